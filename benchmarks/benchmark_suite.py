@@ -0,0 +1,305 @@
+import argparse
+import json
+import math
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+from src.algorithms.bellman_ford import BellmanFord
+from src.algorithms.dijkstra import Dijkstra
+from src.algorithms.floyd_warshall import FloydWarshall
+from src.algorithms.kosaraju import Kosaraju
+from src.algorithms.tarjan import Tarjan
+from src.graphs.directed_graph import DirectedGraph
+from src.services.directed_graph_service import DirectedGraphService
+from src.services.random_graph_generator import RandomGraphGenerator
+
+
+def _sparse_edges(generator, vertices):
+    return vertices, generator.get_uniform_edges(vertices, min(4 * vertices, vertices * (vertices - 1)), True)
+
+
+def _dense_edges(generator, vertices):
+    # Half of all the possible edges quickly gets out of hand, so dense graphs are kept small
+    vertices = min(vertices, 500)
+    return vertices, generator.get_gnp_edges(vertices, 0.5, True)
+
+
+def _chain_edges(generator, vertices):
+    return vertices, [(vertex, vertex + 1) for vertex in range(vertices - 1)]
+
+
+def _grid_edges(generator, vertices):
+    side = math.isqrt(vertices)
+    edges = generator.get_grid_edges(side, side)
+    return side * side, edges + [(end, start) for start, end in edges]
+
+
+def _power_law_edges(generator, vertices):
+    # Point the edges from the earlier vertices to the later ones, so that the hubs reach most of the graph
+    return vertices, [(end, start) for start, end in generator.get_barabasi_albert_edges(vertices, 3)]
+
+
+SHAPES = {
+    "sparse": _sparse_edges,
+    "dense": _dense_edges,
+    "chain": _chain_edges,
+    "grid": _grid_edges,
+    "power-law": _power_law_edges,
+}
+
+
+def _build_graph(vertices, edges):
+    return DirectedGraph.from_edges(vertices, edges)
+
+
+def _add_edges_one_by_one(vertices, edges):
+    graph = DirectedGraph(vertices)
+    for edge, cost in edges:
+        graph.add_edge(edge, cost)
+
+
+def _remove_every_tenth_vertex(graph):
+    for vertex in range(0, graph.vertices_count, 10):
+        graph.remove_vertex(vertex)
+
+
+def _save_text(graph, directory):
+    DirectedGraphService.write_graph_to_file(graph, os.path.join(directory, "graph.txt"))
+    return os.path.join(directory, "graph.txt")
+
+
+def _save_binary(graph, directory):
+    DirectedGraphService.write_graph_to_binary_file(graph, os.path.join(directory, "graph.bin"))
+    return os.path.join(directory, "graph.bin")
+
+
+# Every benchmark is a setup step, which is not measured, and a measured step taking what the setup returned
+BENCHMARKS = {
+    "add_edge": (lambda vertices, edges, directory: (vertices, edges), lambda state: _add_edges_one_by_one(*state)),
+    "from_edges": (lambda vertices, edges, directory: (vertices, edges),
+                   lambda state: DirectedGraph.from_edges(*state)),
+    "remove_vertex": (lambda vertices, edges, directory: _build_graph(vertices, edges), _remove_every_tenth_vertex),
+    "save_text": (lambda vertices, edges, directory: (_build_graph(vertices, edges), directory),
+                  lambda state: _save_text(*state)),
+    "load_text": (lambda vertices, edges, directory: _save_text(_build_graph(vertices, edges), directory),
+                  DirectedGraphService.read_graph_from_file),
+    "save_binary": (lambda vertices, edges, directory: (_build_graph(vertices, edges), directory),
+                    lambda state: _save_binary(*state)),
+    "load_binary": (lambda vertices, edges, directory: _save_binary(_build_graph(vertices, edges), directory),
+                    DirectedGraphService.read_graph_from_binary_file),
+    "kosaraju": (lambda vertices, edges, directory: Kosaraju(_build_graph(vertices, edges)),
+                 Kosaraju.get_strongly_connected_components),
+    "tarjan": (lambda vertices, edges, directory: Tarjan(_build_graph(vertices, edges)),
+               Tarjan.get_strongly_connected_components),
+    "dijkstra": (lambda vertices, edges, directory: Dijkstra(_build_graph(vertices, edges)),
+                 lambda dijkstra: dijkstra.get_shortest_path_tree(0)),
+    "bellman_ford": (lambda vertices, edges, directory: BellmanFord(_build_graph(vertices, edges)),
+                     lambda bellman_ford: bellman_ford.get_shortest_path_tree(0)),
+    "floyd_warshall": (lambda vertices, edges, directory: FloydWarshall(_build_graph(vertices, edges)),
+                       FloydWarshall.get_shortest_path_matrix),
+}
+
+# The largest number of vertices a benchmark is run for, for the ones growing faster than the graph
+LIMITS = {
+    "floyd_warshall": 200,
+}
+
+
+def _measure(benchmark, shape, vertices, repeat, seed):
+    """
+    Runs a benchmark on a graph of a given shape and size. It is meant to run in a process of its own,
+    so that the peak resident set size of the process belongs to the benchmark alone.
+
+    :type benchmark: str
+    :param benchmark: The name of the benchmark
+
+    :type shape: str
+    :param shape: The name of the shape of the graph
+
+    :type vertices: int
+    :param vertices: The requested number of vertices
+
+    :type repeat: int
+    :param repeat: The number of times the benchmark is timed
+
+    :type seed: int
+    :param seed: The seed the graph is generated from
+
+    :rtype: dict
+    :returns: The measurements of the benchmark
+    """
+
+    setup, measured = BENCHMARKS[benchmark]
+    generator = RandomGraphGenerator(seed)
+    vertices, edges = SHAPES[shape](generator, vertices)
+    edges = list(zip(edges, generator.get_costs(len(edges))))
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Time the best of a few runs, each one on a fresh setup
+        seconds = []
+        for _ in range(repeat):
+            state = setup(vertices, edges, directory)
+            start = time.perf_counter()
+            measured(state)
+            seconds.append(time.perf_counter() - start)
+
+        # Tracing allocations slows everything down, so it gets a run of its own
+        state = setup(vertices, edges, directory)
+        tracemalloc.start()
+        measured(state)
+        _, peak_traced_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        "benchmark": benchmark,
+        "shape": shape,
+        "vertices": vertices,
+        "edges": len(edges),
+        "seconds": min(seconds),
+        "mean_seconds": sum(seconds) / len(seconds),
+        "peak_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "peak_traced_bytes": peak_traced_bytes,
+    }
+
+
+class BenchmarkSuite:
+    def __init__(self, benchmarks=None, shapes=None, sizes=(1000, 10000), repeat=3, seed=0):
+        """
+        :type benchmarks: list[str] | None
+        :param benchmarks: The names of the benchmarks to run, or None for all of them
+
+        :type shapes: list[str] | None
+        :param shapes: The names of the graph shapes to run the benchmarks on, or None for all of them
+
+        :type sizes: Sequence[int]
+        :param sizes: The numbers of vertices of the graphs
+
+        :type repeat: int
+        :param repeat: The number of times every benchmark is timed
+
+        :type seed: int
+        :param seed: The seed the graphs are generated from
+        """
+
+        self.__benchmarks = list(BENCHMARKS) if benchmarks is None else benchmarks
+        self.__shapes = list(SHAPES) if shapes is None else shapes
+        self.__sizes = sizes
+        self.__repeat = repeat
+        self.__seed = seed
+
+    def run(self):
+        """
+        Runs every benchmark on every shape and size of graph, each one in a fresh process.
+
+        :rtype: dict
+        :returns: A report holding the environment the benchmarks ran in and their measurements
+        """
+
+        results = []
+
+        with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as pool:
+            for benchmark in self.__benchmarks:
+                for shape in self.__shapes:
+                    for vertices in self.__sizes:
+                        if vertices > LIMITS.get(benchmark, vertices):
+                            continue
+
+                        result = pool.submit(_measure, benchmark, shape, vertices, self.__repeat, self.__seed).result()
+                        result["size"] = vertices
+                        results.append(result)
+                        print(f"{benchmark:>15} {shape:>10} {vertices:>8}: {result['seconds']:.4f}s", file=sys.stderr)
+
+        return {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": self.__seed,
+            "results": results,
+        }
+
+    @staticmethod
+    def compare(report, baseline, threshold=0.1):
+        """
+        Compares the measurements of a report against the ones of a baseline report.
+
+        :type report: dict
+        :param report: The report
+
+        :type baseline: dict
+        :param baseline: The baseline report
+
+        :type threshold: float
+        :param threshold: The relative slowdown above which a benchmark counts as a regression
+
+        :rtype: list[dict]
+        :returns: The benchmarks found in both reports, with the ratio of their times
+        and whether they regressed
+        """
+
+        def key(result):
+            return result["benchmark"], result["shape"], result["size"]
+
+        baseline_results = {key(result): result for result in baseline["results"]}
+        comparisons = []
+
+        for result in report["results"]:
+            if key(result) not in baseline_results:
+                continue
+
+            baseline_seconds = baseline_results[key(result)]["seconds"]
+            ratio = result["seconds"] / baseline_seconds if baseline_seconds else math.inf
+            comparisons.append({
+                "benchmark": result["benchmark"],
+                "shape": result["shape"],
+                "size": result["size"],
+                "seconds": result["seconds"],
+                "baseline_seconds": baseline_seconds,
+                "ratio": ratio,
+                "regression": ratio > 1 + threshold,
+            })
+
+        return comparisons
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description="Benchmarks graph construction, I/O and the graph algorithms.")
+    parser.add_argument("--benchmarks", nargs="+", choices=list(BENCHMARKS))
+    parser.add_argument("--shapes", nargs="+", choices=list(SHAPES))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="The file to write the JSON report to, instead of the standard output")
+    parser.add_argument("--baseline", help="A JSON report to compare the results against")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="The relative slowdown above which a benchmark counts as a regression")
+    arguments = parser.parse_args(arguments)
+
+    report = BenchmarkSuite(arguments.benchmarks, arguments.shapes, arguments.sizes, arguments.repeat,
+                            arguments.seed).run()
+
+    if arguments.baseline:
+        with open(arguments.baseline) as baseline_file:
+            report["comparison"] = BenchmarkSuite.compare(report, json.load(baseline_file), arguments.threshold)
+
+    if arguments.output:
+        with open(arguments.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    # Fail when anything got slower, so that the suite can guard a build
+    regressions = [comparison for comparison in report.get("comparison", []) if comparison["regression"]]
+    for comparison in regressions:
+        print(f"Regression: {comparison['benchmark']} on {comparison['shape']} {comparison['size']}: "
+              f"{comparison['baseline_seconds']:.4f}s -> {comparison['seconds']:.4f}s", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
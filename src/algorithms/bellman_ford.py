@@ -1,3 +1,6 @@
+from array import array
+from collections import deque
+
 from src.graphs.directed_graph import DirectedGraph
 from src.services.directed_graph_service import DirectedGraphService
 
@@ -5,6 +8,14 @@ from src.services.directed_graph_service import DirectedGraphService
 class BellmanFord:
     __graph: DirectedGraph
 
+    def __init__(self, graph=None):
+        """
+        :type graph: DirectedGraph | CompactDirectedGraph | None
+        :param graph: The graph to search, or None if it will be read from a file by run()
+        """
+
+        self.__graph = graph
+
     def run(self):
         """
         Reads a directed graph, a source vertex and a destination vertex from a file and displays the minimum
@@ -15,11 +26,72 @@ class BellmanFord:
         source = int(input("Source vertex: "))
         destination = int(input("Destination vertex: "))
 
-        min_cost_walk, cost = self.__get_minimum_cost_walk(source, destination)
+        min_cost_walk, cost = self.get_minimum_cost_walk(source, destination)
         print(f"Minimum cost walk from {source} to {destination}: {min_cost_walk}")
         print(f"Cost: {cost}")
 
-    def __get_minimum_cost_walk(self, source, destination):
+    def get_shortest_path_tree(self, source=None):
+        """
+        Calculates the minimum cost of reaching every vertex from a source vertex using the queue based
+        Bellman-Ford algorithm, which only relaxes the edges leaving the vertices whose distance changed.
+
+        :type source: int | None
+        :param source: The source vertex, or None to start from a virtual vertex joined to every vertex
+        by an edge of cost 0
+
+        :rtype: tuple[dict[int, int], dict[int, int]]
+        :returns: A tuple containing the distance to every vertex reachable from the source vertex
+        and the previous vertex on the minimum cost walk to each of them
+
+        :raises ValueError: If a negative cost cycle is reachable from the source vertex
+        """
+
+        dist, prev, cycle_vertex = self.__search_queue(source)
+        if cycle_vertex is not None:
+            raise ValueError(f"Negative cost cycle: {self.__get_cycle(prev, cycle_vertex, source)}")
+        return dist, prev
+
+    def get_shortest_path_tree_in_rounds(self, source=None):
+        """
+        Calculates the minimum cost of reaching every vertex from a source vertex using the Bellman-Ford algorithm
+        in rounds over arrays holding the start, end and cost of every edge. Every round relaxes all the edges
+        against the distances of the previous round in bulk, which pays off over the queue based search
+        when most vertices change in most rounds, as on dense graphs.
+
+        :type source: int | None
+        :param source: The source vertex, or None to start from a virtual vertex joined to every vertex
+        by an edge of cost 0
+
+        :rtype: tuple[dict[int, int], dict[int, int]]
+        :returns: A tuple containing the distance to every vertex reachable from the source vertex
+        and the previous vertex on the minimum cost walk to each of them
+
+        :raises ValueError: If a negative cost cycle is reachable from the source vertex
+        """
+
+        dist, prev, cycle_vertex = self.__search_rounds(source)
+        if cycle_vertex is not None:
+            raise ValueError(f"Negative cost cycle: {self.__get_cycle(prev, cycle_vertex, source)}")
+        return dist, prev
+
+    def get_negative_cycle(self, source=None):
+        """
+        Finds a negative cost cycle reachable from a source vertex.
+
+        :type source: int | None
+        :param source: The source vertex, or None to look for a negative cost cycle anywhere in the graph
+
+        :rtype: list[int] | None
+        :returns: The walk around the cycle, starting and ending at the same vertex,
+        or None if there is no negative cost cycle
+        """
+
+        _, prev, cycle_vertex = self.__search_queue(source)
+        if cycle_vertex is None:
+            return None
+        return self.__get_cycle(prev, cycle_vertex, source)
+
+    def get_minimum_cost_walk(self, source, destination):
         """
         Calculates the minimum cost walk from a source vertex to a destination vertex using the Bellman-Ford algorithm.
 
@@ -32,38 +104,177 @@ class BellmanFord:
         :rtype: tuple[list[int], int]
         :returns: A tuple containing the minimum cost walk from the source vertex to the destination vertex
         and the cost of the walk
+
+        :raises ValueError: If a negative cost cycle is reachable from the source vertex
+        """
+
+        self.__graph.in_degree(destination)
+        dist, prev = self.get_shortest_path_tree(source)
+
+        # If the destination vertex is unreachable, return None and infinity
+        if destination not in dist:
+            return None, float('inf')
+
+        min_cost_walk = [destination]
+
+        # Reconstruct the minimum cost walk
+        while min_cost_walk[-1] != source:
+            min_cost_walk.append(prev[min_cost_walk[-1]])
+
+        return min_cost_walk[::-1], dist[destination]
+
+    def __search_queue(self, source):
         """
+        Runs the queue based Bellman-Ford algorithm. A vertex is queued whenever its distance decreases and
+        only the edges leaving queued vertices are relaxed. Without a negative cost cycle, no minimum cost walk
+        has more than vertices_count - 1 edges, so the search stops at the first walk that gets longer.
+
+        :type source: int | None
+        :param source: The source vertex, or None for the virtual vertex
+
+        :rtype: tuple[dict[int, int], dict[int, int], int | None]
+        :returns: A tuple containing the distance and previous vertex dictionaries and a vertex whose walk got
+        too long because of a negative cost cycle, or None if there is no negative cost cycle
+        """
+
+        infinity = float('inf')
+        vertices_count = self.__graph.vertices_count
+        outbound_edges = self.__graph.outbound_edges
 
-        # Initialize the distance and previous vertex dictionaries
-        dist = {vertex: float('inf') for vertex in self.__graph.vertices}
+        if source is None:
+            dist = {vertex: 0 for vertex in self.__graph.vertices}
+        else:
+            outbound_edges(source)
+            dist = {source: 0}
         prev = {}
 
-        # Set the distance of the source vertex to 0
-        dist[source] = 0
-        changed = True
+        # The number of edges of the walk to every vertex
+        length = dict.fromkeys(dist, 0)
+        queue = deque(dist)
+        queued = set(dist)
 
-        # Relax the edges until no more changes can be made
-        while changed:
-            changed = False
+        while queue:
+            start = queue.popleft()
+            queued.discard(start)
+            start_cost, end_length = dist[start], length[start] + 1
 
-            # Traverse all the edges
-            for start, end in self.__graph.edges:
-                if dist[end] > dist[start] + self.__graph.get_cost((start, end)):
-                    dist[end] = dist[start] + self.__graph.get_cost((start, end))
+            # Relax the edges leaving the vertex and queue the ends whose distance decreased
+            for end, cost in outbound_edges(start):
+                if start_cost + cost < dist.get(end, infinity):
+                    dist[end] = start_cost + cost
                     prev[end] = start
-                    changed = True
+                    length[end] = end_length
 
-        # If the destination vertex is unreachable, return None and infinity
-        if dist[destination] == float('inf'):
-            return None, float('inf')
+                    if end_length >= vertices_count:
+                        return dist, prev, end
 
-        min_cost_walk = []
-        vertex = destination
+                    if end not in queued:
+                        queued.add(end)
+                        queue.append(end)
 
-        # Reconstruct the minimum cost walk
-        while vertex != source and prev:
-            min_cost_walk.append(vertex)
+        return dist, prev, None
+
+    def __search_rounds(self, source):
+        """
+        Runs the Bellman-Ford algorithm in rounds over the edge arrays. Without a negative cost cycle,
+        the distances stop changing after vertices_count - 1 rounds.
+
+        :type source: int | None
+        :param source: The source vertex, or None for the virtual vertex
+
+        :rtype: tuple[dict[int, int], dict[int, int], int | None]
+        :returns: A tuple containing the distance and previous vertex dictionaries and a vertex whose distance
+        still changed in the last round because of a negative cost cycle, or None if there is no negative cost cycle
+        """
+
+        infinity = float('inf')
+        vertices = list(self.__graph.vertices)
+        positions = {vertex: position for position, vertex in enumerate(vertices)}
+
+        # Flatten the edges into parallel arrays of start positions, end positions and costs
+        starts, ends, costs = array('q'), array('q'), array('d')
+        for start in vertices:
+            for end, cost in self.__graph.outbound_edges(start):
+                starts.append(positions[start])
+                ends.append(positions[end])
+                costs.append(cost)
+
+        if source is None:
+            dist = array('d', [0]) * len(vertices)
+        else:
+            self.__graph.outbound_edges(source)
+            dist = array('d', [infinity]) * len(vertices)
+            dist[positions[source]] = 0
+        prev = array('q', [-1]) * len(vertices)
+
+        cycle_vertex = None
+        for _ in range(len(vertices)):
+            # Relax every edge against the distances of the previous round
+            candidates = [dist[start] + cost for start, cost in zip(starts, costs)]
+            improved = [edge for edge, (end, candidate) in enumerate(zip(ends, candidates)) if candidate < dist[end]]
+            if not improved:
+                cycle_vertex = None
+                break
+
+            for edge in improved:
+                end = ends[edge]
+                if candidates[edge] < dist[end]:
+                    dist[end] = candidates[edge]
+                    prev[end] = starts[edge]
+                    cycle_vertex = end
+
+        to_cost = self.__to_cost
+        dist = {vertex: to_cost(dist[position]) for position, vertex in enumerate(vertices)
+                if dist[position] != infinity}
+        prev = {vertex: vertices[prev[position]] for position, vertex in enumerate(vertices) if prev[position] != -1}
+        return dist, prev, None if cycle_vertex is None else vertices[cycle_vertex]
+
+    def __get_cycle(self, prev, vertex, source):
+        """
+        Extracts a negative cost cycle from the previous vertex dictionary of a search that found one,
+        by following the previous vertices until one repeats.
+
+        :type prev: dict[int, int]
+        :param prev: The previous vertex dictionary
+
+        :type vertex: int
+        :param vertex: The vertex at which the negative cost cycle was noticed
+
+        :type source: int | None
+        :param source: The source vertex of the search, or None for the virtual vertex
+
+        :rtype: list[int]
+        :returns: The walk around the cycle, starting and ending at the same vertex
+        """
+
+        seen = set()
+        while vertex in prev and vertex not in seen:
+            seen.add(vertex)
             vertex = prev[vertex]
 
-        min_cost_walk.append(source)
-        return min_cost_walk[::-1], dist[destination]
+        # The queue based search can notice a negative cost cycle before it shows up among the previous vertices,
+        # in which case the search in rounds, whose last round always leaves one among them, settles it
+        if vertex not in seen:
+            _, prev, vertex = self.__search_rounds(source)
+            return self.__get_cycle(prev, vertex, source)
+
+        cycle = [vertex]
+        while prev[cycle[-1]] != vertex:
+            cycle.append(prev[cycle[-1]])
+        cycle.append(vertex)
+
+        return cycle[::-1]
+
+    @staticmethod
+    def __to_cost(value):
+        """
+        Converts a distance read from a distance array back to an integer when it holds an integral value.
+
+        :type value: float
+        :param value: The distance
+
+        :rtype: int | float
+        :returns: The distance as an integer if it is integral, otherwise unchanged
+        """
+
+        return int(value) if value.is_integer() else value
@@ -0,0 +1,201 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+from src.algorithms.floyd_warshall import FloydWarshall
+
+# The matrices shared with the worker processes, attached once per worker by _attach_matrices
+_cost_memory = None
+_next_vertex_memory = None
+_cost = None
+_next_vertex = None
+_vertices_count = 0
+
+
+def _attach_matrices(cost_name, next_vertex_name, vertices_count):
+    """
+    Attaches a worker process to the shared cost and next vertex matrices.
+
+    :type cost_name: str
+    :param cost_name: The name of the shared memory block holding the cost matrix
+
+    :type next_vertex_name: str
+    :param next_vertex_name: The name of the shared memory block holding the next vertex matrix
+
+    :type vertices_count: int
+    :param vertices_count: The number of rows and columns of the matrices
+
+    :rtype: None
+    """
+
+    global _cost_memory, _next_vertex_memory, _cost, _next_vertex, _vertices_count
+
+    _cost_memory = SharedMemory(cost_name)
+    _next_vertex_memory = SharedMemory(next_vertex_name)
+    _cost = _cost_memory.buf.cast('d')
+    _next_vertex = _next_vertex_memory.buf.cast('i')
+    _vertices_count = vertices_count
+
+
+def _relax_block(rows, columns, intermediaries):
+    """
+    Runs the Floyd-Warshall steps of a range of intermediary vertices on one tile of the shared matrices.
+
+    :type rows: tuple[int, int]
+    :param rows: The first and past the last row of the tile
+
+    :type columns: tuple[int, int]
+    :param columns: The first and past the last column of the tile
+
+    :type intermediaries: tuple[int, int]
+    :param intermediaries: The first and past the last intermediary vertex
+
+    :rtype: None
+    """
+
+    infinity = float('inf')
+    cost, next_vertex, vertices_count = _cost, _next_vertex, _vertices_count
+    first_column, last_column = columns
+
+    for intermediary in range(*intermediaries):
+        # Only the destinations of the tile the intermediary vertex can reach may get a cheaper walk through it
+        offset = intermediary * vertices_count
+        reachable = [(column, value) for column, value in
+                     enumerate(cost[offset + first_column:offset + last_column].tolist())
+                     if value != infinity]
+        if not reachable:
+            continue
+
+        for source in range(*rows):
+            offset = source * vertices_count
+            to_intermediary = cost[offset + intermediary]
+            if to_intermediary == infinity or source == intermediary:
+                continue
+
+            # Compare against a local copy of the row of the tile, which is much cheaper to index
+            offset += first_column
+            row = cost[offset:offset + last_column - first_column].tolist()
+            improved = [(offset + column, to_intermediary + value) for column, value in reachable
+                        if to_intermediary + value < row[column]]
+            if improved:
+                hop = next_vertex[offset - first_column + intermediary]
+                for index, value in improved:
+                    cost[index] = value
+                    next_vertex[index] = hop
+
+
+class BlockedFloydWarshall(FloydWarshall):
+    """
+    Floyd-Warshall split into square tiles, with the independent tiles of every phase relaxed by a pool
+    of processes working on matrices kept in shared memory.
+    """
+
+    def __init__(self, graph=None, block_size=128, max_workers=None):
+        """
+        :type graph: DirectedGraph | CompactDirectedGraph | None
+        :param graph: The graph to search, or None if it will be read from a file by run()
+
+        :type block_size: int
+        :param block_size: The number of rows and columns of a tile
+
+        :type max_workers: int | None
+        :param max_workers: The number of worker processes, or None to use one per CPU
+        """
+
+        super().__init__(graph)
+        self.__block_size = block_size
+        self.__max_workers = max_workers or os.cpu_count()
+
+    def _relax_all_pairs(self, graph, vertices, cost, next_vertex):
+        """
+        Runs the Floyd-Warshall steps tile by tile. For every block of intermediary vertices, the diagonal tile
+        is relaxed first, then the tiles sharing its row or column, then all the other tiles; the tiles of each
+        of the last two phases only read tiles of earlier phases, so they are relaxed in parallel.
+
+        :type graph: DirectedGraph | CompactDirectedGraph
+        :param graph: The graph
+
+        :type vertices: list[int]
+        :param vertices: The vertices of the graph, in the order of the rows and columns of the matrices
+
+        :type cost: list[array]
+        :param cost: The cost matrix
+
+        :type next_vertex: list[array]
+        :param next_vertex: The next vertex matrix
+
+        :rtype: None
+        """
+
+        vertices_count = len(cost)
+        if vertices_count == 0:
+            return
+
+        cost_memory = SharedMemory(create=True, size=8 * vertices_count * vertices_count)
+        next_vertex_memory = SharedMemory(create=True, size=4 * vertices_count * vertices_count)
+
+        try:
+            # Copy the initial matrices into shared memory, one row after another
+            row_size = 8 * vertices_count
+            for position, row in enumerate(cost):
+                cost_memory.buf[position * row_size:(position + 1) * row_size] = row.tobytes()
+            row_size = 4 * vertices_count
+            for position, row in enumerate(next_vertex):
+                next_vertex_memory.buf[position * row_size:(position + 1) * row_size] = row.tobytes()
+
+            blocks = [(start, min(start + self.__block_size, vertices_count))
+                      for start in range(0, vertices_count, self.__block_size)]
+
+            with ProcessPoolExecutor(self.__max_workers, initializer=_attach_matrices,
+                                     initargs=(cost_memory.name, next_vertex_memory.name, vertices_count)) as pool:
+                for intermediaries in blocks:
+                    # Phase 1: the diagonal tile depends only on itself
+                    pool.submit(_relax_block, intermediaries, intermediaries, intermediaries).result()
+
+                    # Phase 2: the tiles in the row and column of the diagonal tile
+                    tasks = [(intermediaries, block) for block in blocks if block != intermediaries]
+                    tasks += [(block, intermediaries) for block in blocks if block != intermediaries]
+                    self.__run_phase(pool, tasks, intermediaries)
+
+                    # Phase 3: every other tile
+                    tasks = [(rows, columns) for rows in blocks for columns in blocks
+                             if rows != intermediaries and columns != intermediaries]
+                    self.__run_phase(pool, tasks, intermediaries)
+
+            # Copy the results back into the matrices, releasing the views even on failure, since the shared memory
+            # cannot be closed while a view over it is alive
+            with cost_memory.buf.cast('d') as shared_cost, next_vertex_memory.buf.cast('i') as shared_next_vertex:
+                for position in range(vertices_count):
+                    offset = position * vertices_count
+                    cost[position] = array('d', shared_cost[offset:offset + vertices_count].tobytes())
+                    next_vertex[position] = array('i', shared_next_vertex[offset:offset + vertices_count].tobytes())
+        finally:
+            cost_memory.close()
+            cost_memory.unlink()
+            next_vertex_memory.close()
+            next_vertex_memory.unlink()
+
+    def __run_phase(self, pool, tasks, intermediaries):
+        """
+        Relaxes a set of independent tiles in parallel and waits for all of them to finish.
+
+        :type pool: ProcessPoolExecutor
+        :param pool: The worker pool
+
+        :type tasks: list[tuple[tuple[int, int], tuple[int, int]]]
+        :param tasks: The row and column ranges of the tiles
+
+        :type intermediaries: tuple[int, int]
+        :param intermediaries: The range of intermediary vertices
+
+        :rtype: None
+        """
+
+        if not tasks:
+            return
+
+        chunk_size = max(1, len(tasks) // (4 * self.__max_workers))
+        rows, columns = zip(*tasks)
+        for _ in pool.map(_relax_block, rows, columns, [intermediaries] * len(tasks), chunksize=chunk_size):
+            pass
@@ -0,0 +1,87 @@
+from src.algorithms.disjoint_set import DisjointSet
+from src.graphs.vertex_index import VertexIndex
+
+
+class ConnectedComponents:
+    """
+    Keeps the connected components of an undirected graph up to date while edges and vertices are added to it,
+    in a disjoint set over the dense ids of the vertices built with a single pass over the edges. Adding an edge
+    unites the components of its ends, so that both changes and queries take nearly constant time.
+
+    A disjoint set cannot split a component, so removing an edge or a vertex builds the disjoint set again.
+    The id of a removed vertex is left as a set of its own and handed out again to the next vertex added.
+    """
+
+    def __init__(self, graph):
+        """
+        :type graph: UndirectedGraph | CompactUndirectedGraph
+        :param graph: The graph to keep the components of; it must only be changed through this object afterwards
+        """
+
+        self.__graph = graph
+        self.__index = VertexIndex(graph.vertices)
+        self.__build()
+
+    @property
+    def components_count(self):
+        # The free ids are sets of their own without a vertex
+        return self.__components.sets_count - (self.__index.capacity - len(self.__index))
+
+    def same_component(self, start, end):
+        return self.__components.find(self.__index.get_id(start)) == self.__components.find(self.__index.get_id(end))
+
+    def get_components(self):
+        """
+        Groups the vertices of the graph by their connected component.
+
+        :rtype: list[list[int]]
+        :returns: The vertices of every connected component
+        """
+
+        find, get_id = self.__components.find, self.__index.get_id
+        components = {}
+        for vertex in self.__index:
+            components.setdefault(find(get_id(vertex)), []).append(vertex)
+
+        return list(components.values())
+
+    def add_vertex(self, vertex):
+        self.__graph.add_vertex(vertex)
+
+        # A recycled id is already a set of its own
+        if self.__index.add(vertex) == len(self.__components):
+            self.__components.add()
+
+    def add_edge(self, edge, cost=None):
+        self.__graph.add_edge(edge, cost)
+
+        start, end = edge
+        self.__components.union(self.__index.get_id(start), self.__index.get_id(end))
+
+    def add_edges(self, edges, costs=None):
+        edges = list(edges)
+        try:
+            self.__graph.add_edges(edges, costs)
+        except (ValueError, TypeError):
+            # The edges inserted before the failing one are in the graph, so take the components from the graph
+            self.__build()
+            raise
+        self.__union(edges)
+
+    def remove_edge(self, edge):
+        self.__graph.remove_edge(edge)
+        self.__build()
+
+    def remove_vertex(self, vertex):
+        self.__graph.remove_vertex(vertex)
+        self.__index.remove(vertex)
+        self.__build()
+
+    def __build(self):
+        self.__components = DisjointSet(self.__index.capacity)
+        self.__union(self.__graph.edges)
+
+    def __union(self, edges):
+        get_id, union = self.__index.get_id, self.__components.union
+        for start, end in edges:
+            union(get_id(start), get_id(end))
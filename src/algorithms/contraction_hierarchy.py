@@ -0,0 +1,386 @@
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from heapq import heapify, heappop, heappush
+
+from src.graphs.vertex_index import VertexIndex
+
+
+class ContractionHierarchy:
+    """
+    Answers minimum cost walk queries on a static graph with non-negative costs through a contraction hierarchy.
+
+    Preprocessing contracts the vertices one by one, cheapest first: a contracted vertex is taken out of the graph
+    and a shortcut edge is added between every pair of its neighbours whose minimum cost walk went through it,
+    unless a witness search finds another walk that is at least as cheap. The order of contraction ranks the
+    vertices. A query then runs Dijkstra forward from the source and backward from the destination, each only
+    along edges leading to higher ranked vertices, which settles far fewer vertices than a plain search.
+    Every shortcut remembers the vertex it skips, so the walk found can be unpacked into edges of the graph.
+    """
+
+    MAGIC = b"GRCH"
+    VERSION = 1
+
+    __header = struct.Struct("<4sHHqq")
+
+    def __init__(self, graph, witness_limit=64):
+        """
+        Builds the contraction hierarchy of a graph.
+
+        :type graph: DirectedGraph | CompactDirectedGraph
+        :param graph: The graph
+
+        :type witness_limit: int
+        :param witness_limit: The number of vertices a witness search may settle before giving up, which trades
+        preprocessing time for the number of shortcuts added
+
+        :raises ValueError: If the graph has an edge with a negative cost
+        """
+
+        self.__index = VertexIndex(graph.vertices)
+        vertices_count = len(self.__index)
+
+        # The remaining graph, mapping every neighbour to the cost of the edge and the vertex it skips, or -1
+        out_edges = [{} for _ in range(vertices_count)]
+        in_edges = [{} for _ in range(vertices_count)]
+        for start in self.__index:
+            for end, cost in graph.outbound_edges(start):
+                if cost < 0:
+                    raise ValueError("Negative cost")
+
+                start_position, end_position = self.__index.get_id(start), self.__index.get_id(end)
+                if start_position != end_position:
+                    out_edges[start_position][end_position] = cost, -1
+                    in_edges[end_position][start_position] = cost, -1
+
+        self.__rank = array('q', [-1]) * vertices_count
+        upward, downward = [None] * vertices_count, [None] * vertices_count
+        contracted_neighbours = [0] * vertices_count
+
+        heap = [(self.__get_priority(vertex, self.__get_shortcuts(vertex, out_edges, in_edges, witness_limit),
+                                     out_edges, in_edges, contracted_neighbours), vertex)
+                for vertex in range(vertices_count)]
+        heapify(heap)
+
+        for rank in range(vertices_count):
+            # Priorities go stale as the graph shrinks, so a vertex is only contracted once it still beats the next one
+            while True:
+                _, vertex = heappop(heap)
+                shortcuts = self.__get_shortcuts(vertex, out_edges, in_edges, witness_limit)
+                priority = self.__get_priority(vertex, shortcuts, out_edges, in_edges, contracted_neighbours)
+                if not heap or priority <= heap[0][0]:
+                    break
+                heappush(heap, (priority, vertex))
+
+            # The edges left around the vertex all lead to higher ranked vertices
+            self.__rank[vertex] = rank
+            upward[vertex], downward[vertex] = out_edges[vertex], in_edges[vertex]
+            out_edges[vertex], in_edges[vertex] = {}, {}
+            for neighbour in upward[vertex]:
+                del in_edges[neighbour][vertex]
+                contracted_neighbours[neighbour] += 1
+            for neighbour in downward[vertex]:
+                del out_edges[neighbour][vertex]
+                contracted_neighbours[neighbour] += 1
+
+            for start, end, cost in shortcuts:
+                if end not in out_edges[start] or cost < out_edges[start][end][0]:
+                    out_edges[start][end] = cost, vertex
+                    in_edges[end][start] = cost, vertex
+
+        self.__upward = self.__to_arrays(upward)
+        self.__downward = self.__to_arrays(downward)
+
+    @classmethod
+    def load(cls, file_path):
+        """
+        Reads a contraction hierarchy saved by save().
+
+        :type file_path: str
+        :param file_path: The path of the file
+
+        :rtype: ContractionHierarchy
+        :returns: The contraction hierarchy
+
+        :raises ValueError: If the file is not a contraction hierarchy file of a supported version
+        """
+
+        hierarchy = cls.__new__(cls)
+
+        with open(file_path, "rb") as input_file:
+            header = input_file.read(cls.__header.size)
+            if len(header) < cls.__header.size:
+                raise ValueError("Invalid contraction hierarchy file")
+
+            magic, version, float_costs, vertices_count, _ = cls.__header.unpack(header)
+            if magic != cls.MAGIC:
+                raise ValueError("Invalid contraction hierarchy file")
+            if version != cls.VERSION:
+                raise ValueError(f"Unsupported contraction hierarchy file version: {version}")
+
+            def read_array(typecode, length):
+                values = array(typecode)
+                try:
+                    values.fromfile(input_file, length)
+                except EOFError:
+                    raise ValueError("Invalid contraction hierarchy file")
+                if sys.byteorder == "big":
+                    values.byteswap()
+                return values
+
+            hierarchy.__index = VertexIndex(read_array('q', vertices_count))
+            hierarchy.__rank = read_array('q', vertices_count)
+
+            adjacencies = []
+            for _ in range(2):
+                offsets = read_array('q', vertices_count + 1)
+                targets = read_array('q', offsets[-1])
+                costs = read_array('d' if float_costs else 'q', offsets[-1])
+                middles = read_array('q', offsets[-1])
+                adjacencies.append((offsets, targets, costs, middles))
+
+        hierarchy.__upward, hierarchy.__downward = adjacencies
+        return hierarchy
+
+    def save(self, file_path):
+        """
+        Writes the contraction hierarchy to a file, as a header followed by little endian arrays.
+
+        :type file_path: str
+        :param file_path: The path of the file
+
+        :rtype: None
+
+        :raises ValueError: If a vertex label does not fit in a 64 bit integer
+        """
+
+        float_costs = self.__upward[2].typecode == 'd' or self.__downward[2].typecode == 'd'
+
+        # Only labels fitting in 64 bit integers can be stored
+        labels = self.__index.labels
+        try:
+            vertices = array('q', range(len(self.__index)) if labels is None else labels)
+        except (TypeError, OverflowError):
+            raise ValueError("Invalid vertex")
+
+        with open(file_path, "wb") as output_file:
+            output_file.write(self.__header.pack(self.MAGIC, self.VERSION, float_costs, len(vertices),
+                                                 len(self.__upward[1]) + len(self.__downward[1])))
+
+            arrays = [vertices, self.__rank]
+            for offsets, targets, costs, middles in self.__upward, self.__downward:
+                arrays += [offsets, targets, array('d' if float_costs else 'q', costs), middles]
+
+            for values in arrays:
+                if sys.byteorder == "big":
+                    values = array(values.typecode, values)
+                    values.byteswap()
+                values.tofile(output_file)
+
+    @property
+    def shortcuts_count(self):
+        return sum(1 for adjacency in (self.__upward, self.__downward) for middle in adjacency[3] if middle != -1)
+
+    def get_minimum_cost_walk(self, source, destination):
+        """
+        Calculates the minimum cost walk from a source vertex to a destination vertex.
+
+        :type source: int
+        :param source: The source vertex
+
+        :type destination: int
+        :param destination: The destination vertex
+
+        :rtype: tuple[list[int], int]
+        :returns: A tuple containing the minimum cost walk from the source vertex to the destination vertex
+        and the cost of the walk
+        """
+
+        infinity = float('inf')
+        source, destination = self.__index.get_id(source), self.__index.get_id(destination)
+
+        # Index 0 holds the forward search and index 1 the backward search
+        adjacencies = self.__upward, self.__downward
+        dist = {source: 0}, {destination: 0}
+        prev = {}, {}
+        heaps = [(0, source)], [(0, destination)]
+        best_cost, meeting_vertex = (0, source) if source == destination else (infinity, None)
+
+        while heaps[0] or heaps[1]:
+            side = 0 if heaps[0] and (not heaps[1] or heaps[0][0][0] <= heaps[1][0][0]) else 1
+            side_dist, other_dist = dist[side], dist[1 - side]
+            cost, vertex = heappop(heaps[side])
+
+            # Nothing left in this direction can lead to a cheaper walk
+            if cost >= best_cost:
+                heaps[side].clear()
+                continue
+            if cost > side_dist[vertex]:
+                continue
+
+            if vertex in other_dist and cost + other_dist[vertex] < best_cost:
+                best_cost, meeting_vertex = cost + other_dist[vertex], vertex
+
+            # Stall the vertex when a higher ranked vertex reaches it more cheaply, since its walk cannot be minimal
+            offsets, targets, costs, _ = adjacencies[1 - side]
+            low, high = offsets[vertex], offsets[vertex + 1]
+            if any(side_dist.get(neighbour, infinity) + edge_cost < cost
+                   for neighbour, edge_cost in zip(targets[low:high], costs[low:high])):
+                continue
+
+            offsets, targets, costs, middles = adjacencies[side]
+            low, high = offsets[vertex], offsets[vertex + 1]
+            for neighbour, edge_cost, middle in zip(targets[low:high], costs[low:high], middles[low:high]):
+                if cost + edge_cost < side_dist.get(neighbour, infinity):
+                    side_dist[neighbour] = cost + edge_cost
+                    prev[side][neighbour] = vertex, middle
+                    heappush(heaps[side], (cost + edge_cost, neighbour))
+
+        # If the searches never met, the destination vertex is unreachable
+        if meeting_vertex is None:
+            return None, infinity
+
+        # Gather the edges of the walk in the hierarchy, then unpack every shortcut into the edges it skips
+        edges = []
+        vertex = meeting_vertex
+        while vertex != source:
+            previous, middle = prev[0][vertex]
+            edges.append((previous, vertex, middle))
+            vertex = previous
+        edges.reverse()
+
+        vertex = meeting_vertex
+        while vertex != destination:
+            following, middle = prev[1][vertex]
+            edges.append((vertex, following, middle))
+            vertex = following
+
+        walk = [source]
+        for edge in edges:
+            self.__unpack(edge, walk)
+
+        return list(self.__index.get_labels(walk)), best_cost
+
+    def __unpack(self, edge, walk):
+        """
+        Appends the vertices following the start of an edge of the hierarchy on the walk it stands for.
+
+        :type edge: tuple[int, int, int]
+        :param edge: The start, the end and the vertex skipped by the edge, or -1 if it is an edge of the graph
+
+        :type walk: list[int]
+        :param walk: The walk to extend
+
+        :rtype: None
+        """
+
+        stack = [edge]
+        while stack:
+            start, end, middle = stack.pop()
+            if middle == -1:
+                walk.append(end)
+                continue
+
+            # The skipped vertex was contracted before both ends, so both halves are edges of its own
+            stack.append((middle, end, self.__get_middle(self.__upward, middle, end)))
+            stack.append((start, middle, self.__get_middle(self.__downward, middle, start)))
+
+    @staticmethod
+    def __get_middle(adjacency, vertex, neighbour):
+        offsets, targets, _, middles = adjacency
+        index = bisect_left(targets, neighbour, offsets[vertex], offsets[vertex + 1])
+        return middles[index]
+
+    @staticmethod
+    def __to_arrays(rows):
+        """
+        Packs the edges left around every vertex at its contraction into arrays, sorted by neighbour in every row.
+
+        :type rows: list[dict[int, tuple[int, int]]]
+        :param rows: The neighbours of every vertex, mapped to the cost of the edge and the vertex it skips
+
+        :rtype: tuple[array, array, array, array]
+        :returns: The offsets, neighbours, costs and skipped vertices
+        """
+
+        offsets, targets, middles = array('q', [0]), array('q'), array('q')
+        costs = array('q')
+
+        for row in rows:
+            for neighbour in sorted(row):
+                cost, middle = row[neighbour]
+                targets.append(neighbour)
+                middles.append(middle)
+                try:
+                    costs.append(cost)
+                except (TypeError, OverflowError):
+                    costs = array('d', costs)
+                    costs.append(cost)
+            offsets.append(len(targets))
+
+        return offsets, targets, costs, middles
+
+    @staticmethod
+    def __get_priority(vertex, shortcuts, out_edges, in_edges, contracted_neighbours):
+        # Prefer vertices adding few shortcuts for the edges they take away, spreading contraction evenly
+        return len(shortcuts) - len(out_edges[vertex]) - len(in_edges[vertex]) + contracted_neighbours[vertex]
+
+    @staticmethod
+    def __get_shortcuts(vertex, out_edges, in_edges, witness_limit):
+        """
+        Finds the shortcuts needed to contract a vertex: one for every pair of neighbours whose walk through
+        the vertex is cheaper than any walk around it found by a witness search.
+
+        :type vertex: int
+        :param vertex: The vertex to contract
+
+        :type out_edges: list[dict[int, tuple[int, int]]]
+        :param out_edges: The outbound edges of the remaining graph
+
+        :type in_edges: list[dict[int, tuple[int, int]]]
+        :param in_edges: The inbound edges of the remaining graph
+
+        :type witness_limit: int
+        :param witness_limit: The number of vertices a witness search may settle
+
+        :rtype: list[tuple[int, int, int]]
+        :returns: The start, end and cost of every shortcut
+        """
+
+        infinity = float('inf')
+        shortcuts = []
+
+        for start, (in_cost, _) in in_edges[vertex].items():
+            through = {end: in_cost + out_cost for end, (out_cost, _) in out_edges[vertex].items() if end != start}
+            if not through:
+                continue
+
+            # Search from the start around the vertex, up to the most expensive walk through it
+            # or until every end of a walk through it is settled
+            max_cost = max(through.values())
+            remaining = len(through)
+            dist = {start: 0}
+            heap = [(0, start)]
+            settled = 0
+            while heap and settled < witness_limit:
+                cost, current = heappop(heap)
+                if cost > max_cost:
+                    break
+                if cost > dist[current]:
+                    continue
+
+                settled += 1
+                if current in through:
+                    remaining -= 1
+                    if remaining == 0:
+                        break
+
+                for neighbour, (edge_cost, _) in out_edges[current].items():
+                    if neighbour != vertex and cost + edge_cost < dist.get(neighbour, infinity):
+                        dist[neighbour] = cost + edge_cost
+                        heappush(heap, (cost + edge_cost, neighbour))
+
+            shortcuts.extend((start, end, cost) for end, cost in through.items() if dist.get(end, infinity) > cost)
+
+        return shortcuts
@@ -1,12 +1,57 @@
-from queue import PriorityQueue
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from heapq import heappop, heappush
+from itertools import count
 
 from src.graphs.directed_graph import DirectedGraph
 from src.services.directed_graph_service import DirectedGraphService
 
+# The graph shared by the searches of a worker process, mapped into memory once per worker by _load_graph
+_dijkstra = None
+
+
+def _load_graph(file_path):
+    """
+    Prepares a worker process to run searches on a graph saved in the binary format. Every worker maps the same
+    file, so they all share a single copy of the graph through the page cache.
+
+    :type file_path: str
+    :param file_path: The path of the binary graph file
+
+    :rtype: None
+    """
+
+    global _dijkstra
+
+    _dijkstra = Dijkstra(DirectedGraphService.read_graph_from_binary_file(file_path))
+
+
+def _search_trees(sources):
+    """
+    Calculates the shortest path trees of a set of source vertices.
+
+    :type sources: list[int]
+    :param sources: The source vertices
+
+    :rtype: list[tuple[dict[int, int], dict[int, int]]]
+    :returns: The distance and previous vertex dictionaries of every source vertex
+    """
+
+    return [_dijkstra.get_shortest_path_tree(source) for source in sources]
+
 
 class Dijkstra:
     __graph: DirectedGraph
 
+    def __init__(self, graph=None):
+        """
+        :type graph: DirectedGraph | CompactDirectedGraph | None
+        :param graph: The graph to search, or None if it will be read from a file by run()
+        """
+
+        self.__graph = graph
+
     def run(self):
         """
         Reads a directed graph, a source vertex and a destination vertex from a file and displays the minimum
@@ -17,11 +62,105 @@ class Dijkstra:
         source = int(input("Source vertex: "))
         destination = int(input("Destination vertex: "))
 
-        min_cost_walk, cost = self.__get_minimum_cost_walk(source, destination)
+        min_cost_walk, cost = self.get_minimum_cost_walk(source, destination)
         print(f"Minimum cost walk from {source} to {destination}: {min_cost_walk}")
         print(f"Cost: {cost}")
 
-    def __get_minimum_cost_walk(self, source, destination):
+    def get_shortest_path_tree(self, source):
+        """
+        Calculates the minimum cost of reaching every vertex from a source vertex using the Dijkstra algorithm.
+
+        :type source: int
+        :param source: The source vertex
+
+        :rtype: tuple[dict[int, int], dict[int, int]]
+        :returns: A tuple containing the distance to every vertex reachable from the source vertex
+        and the previous vertex on the minimum cost walk to each of them
+        """
+
+        return self.__search([source], None)
+
+    def get_shortest_path_trees(self, sources, max_workers=None):
+        """
+        Calculates the shortest path trees of many source vertices, spreading the searches over a pool of
+        worker processes. The graph is saved once to a temporary binary file which every worker maps into memory,
+        instead of being sent along with every search.
+
+        :type sources: Iterable[int]
+        :param sources: The source vertices
+
+        :type max_workers: int | None
+        :param max_workers: The number of worker processes, or None for one per processor;
+        with a single worker the searches run in this process
+
+        :rtype: Iterator[tuple[dict[int, int], dict[int, int]]]
+        :returns: The distance and previous vertex dictionaries of every source vertex, in the order of the sources
+        """
+
+        sources = list(sources)
+        for source in sources:
+            self.__graph.outbound_edges(source)
+
+        max_workers = max_workers or os.cpu_count() or 1
+        if max_workers == 1:
+            return map(self.get_shortest_path_tree, sources)
+        return self.__search_in_pool(sources, max_workers)
+
+    def __search_in_pool(self, sources, max_workers):
+        """
+        Runs the searches of get_shortest_path_trees() on a pool of worker processes.
+
+        :type sources: list[int]
+        :param sources: The source vertices
+
+        :type max_workers: int
+        :param max_workers: The number of worker processes
+
+        :rtype: Iterator[tuple[dict[int, int], dict[int, int]]]
+        :returns: The distance and previous vertex dictionaries of every source vertex, in the order of the sources
+        """
+
+        chunk_size = max(1, len(sources) // (4 * max_workers))
+        chunks = [sources[start:start + chunk_size] for start in range(0, len(sources), chunk_size)]
+
+        handle, file_path = tempfile.mkstemp(suffix=".bin")
+        os.close(handle)
+        try:
+            DirectedGraphService.write_graph_to_binary_file(self.__graph, file_path)
+            with ProcessPoolExecutor(max_workers, initializer=_load_graph, initargs=(file_path,)) as pool:
+                for trees in pool.map(_search_trees, chunks):
+                    yield from trees
+        finally:
+            os.remove(file_path)
+
+    def get_nearest_sources(self, sources):
+        """
+        Finds the nearest of a set of source vertices for every vertex, such as the nearest facility, with a single
+        search starting from all the source vertices at once.
+
+        :type sources: Iterable[int]
+        :param sources: The source vertices
+
+        :rtype: tuple[dict[int, int], dict[int, int]]
+        :returns: A tuple containing the distance from the nearest source vertex to every vertex reachable from
+        any of them and the nearest source vertex itself
+        """
+
+        dist, prev = self.__search(list(sources), None)
+        nearest = {source: source for source in dist if source not in prev}
+
+        # Every vertex shares the nearest source vertex of the previous vertex on its walk
+        for vertex in dist:
+            walk = []
+            while vertex not in nearest:
+                walk.append(vertex)
+                vertex = prev[vertex]
+            for walk_vertex in walk:
+                nearest[walk_vertex] = nearest[vertex]
+
+        return dist, nearest
+
+    def get_minimum_cost_walk(self, source, destination):
         """
         Calculates the minimum cost walk from a source vertex to a destination vertex using the Dijkstra algorithm.
 
@@ -36,39 +175,390 @@ class Dijkstra:
         and the cost of the walk
         """
 
-        # Initialize the distance and previous vertex dictionaries
-        dist = {vertex: float('inf') for vertex in self.__graph.vertices}
+        # Validate the destination up front, the search stops as soon as it is settled
+        self.__graph.in_degree(destination)
+
+        dist, prev = self.__search([source], destination)
+        return self.__build_walk(dist, prev, source, destination)
+
+    def get_minimum_cost_walk_bidirectional(self, source, destination):
+        """
+        Calculates the minimum cost walk from a source vertex to a destination vertex by running the Dijkstra
+        algorithm forward from the source vertex along outbound edges and backward from the destination vertex
+        along inbound edges at the same time, until the two searches cannot improve the best meeting point.
+
+        :type source: int
+        :param source: The source vertex
+
+        :type destination: int
+        :param destination: The destination vertex
+
+        :rtype: tuple[list[int], int]
+        :returns: A tuple containing the minimum cost walk from the source vertex to the destination vertex
+        and the cost of the walk
+        """
+
+        infinity = float('inf')
+        edges = self.__graph.outbound_edges, self.__graph.inbound_edges
+
+        # Validate the source and destination vertices
+        edges[0](source)
+        edges[1](destination)
+
+        # Index 0 holds the forward search and index 1 the backward search
+        dist = {source: 0}, {destination: 0}
+        prev = {}, {}
+        order = count(2)
+        heaps = [(0, 0, source)], [(0, 1, destination)]
+        best_cost, meeting_vertex = (0, source) if source == destination else (infinity, None)
+
+        while heaps[0] and heaps[1]:
+            # No walk through the unsettled vertices can be cheaper than the two smallest keys together
+            if heaps[0][0][0] + heaps[1][0][0] >= best_cost:
+                break
+
+            # Advance the search with the smaller key
+            side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+            side_dist, other_dist = dist[side], dist[1 - side]
+            cost, _, vertex = heappop(heaps[side])
+
+            if cost > side_dist[vertex]:
+                continue
+
+            for neighbour, edge_cost in edges[side](vertex):
+                new_cost = cost + edge_cost
+                if new_cost < side_dist.get(neighbour, infinity):
+                    side_dist[neighbour] = new_cost
+                    prev[side][neighbour] = vertex
+                    heappush(heaps[side], (new_cost, next(order), neighbour))
+
+                # Check whether the searches meet in the neighbour with a cheaper walk
+                if neighbour in other_dist and side_dist[neighbour] + other_dist[neighbour] < best_cost:
+                    best_cost = side_dist[neighbour] + other_dist[neighbour]
+                    meeting_vertex = neighbour
+
+        # If the searches never met, the destination vertex is unreachable
+        if meeting_vertex is None:
+            return None, infinity
+
+        forward_walk, _ = self.__build_walk(dist[0], prev[0], source, meeting_vertex)
+        backward_walk, _ = self.__build_walk(dist[1], prev[1], destination, meeting_vertex)
+        return forward_walk + backward_walk[-2::-1], best_cost
+
+    def get_minimum_cost_walk_a_star(self, source, destination, heuristic):
+        """
+        Calculates the minimum cost walk from a source vertex to a destination vertex using the A* algorithm,
+        which expands vertices in increasing order of their distance plus the heuristic estimate.
+
+        :type source: int
+        :param source: The source vertex
+
+        :type destination: int
+        :param destination: The destination vertex
+
+        :type heuristic: Callable[[int, int], int]
+        :param heuristic: A function estimating the cost from a vertex to the destination vertex, which must never
+        overestimate it for the walk to be of minimum cost
+
+        :rtype: tuple[list[int], int]
+        :returns: A tuple containing the minimum cost walk from the source vertex to the destination vertex
+        and the cost of the walk
+        """
+
+        infinity = float('inf')
+        outbound_edges = self.__graph.outbound_edges
+
+        # Validate the source and destination vertices
+        outbound_edges(source)
+        self.__graph.in_degree(destination)
+
+        dist = {source: 0}
         prev = {}
-        q = PriorityQueue()
+        order = count(1)
+        heap = [(heuristic(source, destination), 0, 0, source)]
 
-        q.put((0, source))
-        dist[source] = 0
+        while heap:
+            _, cost, _, vertex = heappop(heap)
 
-        # Traverse the graph using Dijkstra's algorithm
-        while not q.empty():
-            vertex = q.get()[1]
+            if cost > dist[vertex]:
+                continue
             if vertex == destination:
                 break
 
-            # Traverse the neighbours of the current vertex and update the distance and previous vertex dictionaries
-            for neighbour in self.__graph.outbound_neighbours(vertex):
-                cost = self.__graph.get_cost((vertex, neighbour))
-                if neighbour not in dist or dist[vertex] + cost < dist[neighbour]:
-                    dist[neighbour] = dist[vertex] + cost
-                    q.put((dist[neighbour], neighbour))
+            for neighbour, edge_cost in outbound_edges(vertex):
+                new_cost = cost + edge_cost
+                if new_cost < dist.get(neighbour, infinity):
+                    dist[neighbour] = new_cost
                     prev[neighbour] = vertex
+                    heappush(heap, (new_cost + heuristic(neighbour, destination), new_cost, next(order), neighbour))
+
+        return self.__build_walk(dist, prev, source, destination)
+
+    def get_k_minimum_cost_paths(self, source, destination, k=None):
+        """
+        Calculates the minimum cost paths, which never repeat a vertex, from a source vertex to a destination vertex
+        in increasing order of their cost using the Yen algorithm. The paths are calculated one at a time, so that
+        the caller can stop as soon as it has enough of them.
+
+        :type source: int
+        :param source: The source vertex
+
+        :type destination: int
+        :param destination: The destination vertex
+
+        :type k: int | None
+        :param k: The largest number of paths to calculate, or None for all of them
+
+        :rtype: Iterator[tuple[list[int], int]]
+        :returns: Tuples containing a path from the source vertex to the destination vertex and the cost of the path
+
+        :raises ValueError: If a vertex is invalid
+        """
+
+        # Validate the source and destination vertices
+        self.__graph.outbound_edges(source)
+        self.__graph.in_degree(destination)
+
+        return self.__yen(source, destination, k)
+
+    def __yen(self, source, destination, k):
+        """
+        Runs the Yen algorithm for get_k_minimum_cost_paths(). Every path found branches into candidates that share
+        a prefix of it, the root, and then leave it at the last vertex of the root, the spur, through a minimum cost
+        walk avoiding the vertices of the root and the edges already taken out of that root by earlier paths.
+        All the candidates wait in a single heap, and the cheapest one becomes the next path.
+
+        Only the spurs from the vertex at which a path left its parent onwards are searched, since the roots before
+        it were already branched from the parent. The edges taken out of every root are kept in a dictionary
+        updated as the paths are found, instead of being gathered again from all the earlier paths. The spur
+        searches are guided by the cost of reaching the destination vertex in the whole graph, calculated once by
+        a backward search, which never overestimates the cost once vertices and edges are left out.
+
+        :type source: int
+        :param source: The source vertex
+
+        :type destination: int
+        :param destination: The destination vertex
+
+        :type k: int | None
+        :param k: The largest number of paths to calculate, or None for all of them
+
+        :rtype: Iterator[tuple[list[int], int]]
+        :returns: Tuples containing a path and its cost
+        """
+
+        remaining, following = self.__search_backward(destination)
+        if source not in remaining:
+            return
+
+        # Follow the backward search from the source vertex for the minimum cost path
+        path = [source]
+        while path[-1] != destination:
+            path.append(following[path[-1]])
+        costs = [remaining[source] - remaining[vertex] for vertex in path]
+
+        # Every candidate holds its cost, a tie breaker, the path, the cost up to every vertex of it
+        # and the index of the vertex at which it left its parent
+        candidates = [(costs[-1], 0, path, costs, 0)]
+        seen = {tuple(path)}
+        next_vertices = {}
+        found = 0
+
+        while candidates and (k is None or found < k):
+            cost, _, path, costs, deviation = heappop(candidates)
+            found += 1
+            yield path, cost
+
+            # Remember the edge taken out of every root of the path
+            for index in range(len(path) - 1):
+                next_vertices.setdefault(tuple(path[:index + 1]), set()).add(path[index + 1])
+
+            for index in range(deviation, len(path) - 1):
+                spur = path[index]
+                root = path[:index + 1]
+
+                dist, prev = self.__search_avoiding(spur, destination, set(path[:index]),
+                                                    next_vertices[tuple(root)], remaining)
+                if destination not in dist:
+                    continue
+
+                spur_walk, _ = self.__build_walk(dist, prev, spur, destination)
+                candidate = root + spur_walk[1:]
+                if tuple(candidate) in seen:
+                    continue
+
+                seen.add(tuple(candidate))
+                candidate_costs = costs[:index + 1] + [costs[index] + dist[vertex] for vertex in spur_walk[1:]]
+                heappush(candidates, (candidate_costs[-1], len(seen), candidate, candidate_costs, index))
+
+    def __search_backward(self, destination):
+        """
+        Runs the Dijkstra algorithm backward from a destination vertex along the inbound edges.
+
+        :type destination: int
+        :param destination: The destination vertex
+
+        :rtype: tuple[dict[int, int], dict[int, int]]
+        :returns: A tuple containing the cost of reaching the destination vertex from every vertex that can
+        and the next vertex on the minimum cost walk of each of them
+        """
+
+        infinity = float('inf')
+        inbound_edges = self.__graph.inbound_edges
+
+        dist = {destination: 0}
+        following = {}
+        order = count(1)
+        heap = [(0, 0, destination)]
+
+        while heap:
+            cost, _, vertex = heappop(heap)
+
+            if cost > dist[vertex]:
+                continue
+
+            for neighbour, edge_cost in inbound_edges(vertex):
+                new_cost = cost + edge_cost
+                if new_cost < dist.get(neighbour, infinity):
+                    dist[neighbour] = new_cost
+                    following[neighbour] = vertex
+                    heappush(heap, (new_cost, next(order), neighbour))
+
+        return dist, following
+
+    def __search_avoiding(self, source, destination, blocked_vertices, blocked_neighbours, remaining):
+        """
+        Runs the A* algorithm from a source vertex while leaving out some of the vertices and some of
+        the outbound edges of the source vertex, without changing the graph.
+
+        :type source: int
+        :param source: The source vertex
+
+        :type destination: int
+        :param destination: The vertex at which the search stops once settled
+
+        :type blocked_vertices: set[int]
+        :param blocked_vertices: The vertices to leave out
+
+        :type blocked_neighbours: set[int]
+        :param blocked_neighbours: The ends of the outbound edges of the source vertex to leave out
+
+        :type remaining: dict[int, int]
+        :param remaining: The cost of reaching the destination vertex in the whole graph, from every vertex that can
+
+        :rtype: tuple[dict[int, int], dict[int, int]]
+        :returns: A tuple containing the distance and previous vertex dictionaries
+        """
+
+        infinity = float('inf')
+        outbound_edges = self.__graph.outbound_edges
+
+        dist = {source: 0}
+        prev = {}
+        order = count()
+        heap = []
+
+        # Relax the outbound edges of the source vertex that are left, the vertices that cannot reach
+        # the destination vertex even in the whole graph are of no use
+        for neighbour, edge_cost in outbound_edges(source):
+            if neighbour in remaining and neighbour not in blocked_neighbours and neighbour not in blocked_vertices \
+                    and edge_cost < dist.get(neighbour, infinity):
+                dist[neighbour] = edge_cost
+                prev[neighbour] = source
+                heappush(heap, (edge_cost + remaining[neighbour], edge_cost, next(order), neighbour))
+
+        while heap:
+            _, cost, _, vertex = heappop(heap)
+
+            if cost > dist[vertex]:
+                continue
+            if vertex == destination:
+                break
+
+            for neighbour, edge_cost in outbound_edges(vertex):
+                new_cost = cost + edge_cost
+                if new_cost < dist.get(neighbour, infinity) and neighbour in remaining \
+                        and neighbour not in blocked_vertices:
+                    dist[neighbour] = new_cost
+                    prev[neighbour] = vertex
+                    heappush(heap, (new_cost + remaining[neighbour], new_cost, next(order), neighbour))
+
+        return dist, prev
+
+    def __search(self, sources, destination):
+        """
+        Runs the Dijkstra algorithm from a set of source vertices using a binary heap with lazy deletion: instead of
+        decreasing the key of a vertex, a new entry is pushed and the stale ones are skipped when popped. Entries
+        of equal cost are ordered by when they were pushed, so that vertex labels never have to be compared.
+
+        :type sources: list[int]
+        :param sources: The source vertices, all starting at distance 0
+
+        :type destination: int | None
+        :param destination: The vertex at which the search stops once settled, or None to settle every vertex
+
+        :rtype: tuple[dict[int, int], dict[int, int]]
+        :returns: A tuple containing the distance and previous vertex dictionaries
+        """
+
+        infinity = float('inf')
+        outbound_edges = self.__graph.outbound_edges
+
+        # Validate the source vertices
+        for source in sources:
+            outbound_edges(source)
+
+        dist = dict.fromkeys(sources, 0)
+        prev = {}
+        heap = [(0, position, source) for position, source in enumerate(dist)]
+        order = count(len(heap))
+
+        while heap:
+            cost, _, vertex = heappop(heap)
+
+            # Skip the entries left behind by a later improvement of the vertex, it has already been settled
+            if cost > dist[vertex]:
+                continue
+            if vertex == destination:
+                break
+
+            # Relax the outbound edges of the settled vertex
+            for neighbour, edge_cost in outbound_edges(vertex):
+                new_cost = cost + edge_cost
+                if new_cost < dist.get(neighbour, infinity):
+                    dist[neighbour] = new_cost
+                    prev[neighbour] = vertex
+                    heappush(heap, (new_cost, next(order), neighbour))
+
+        return dist, prev
+
+    @staticmethod
+    def __build_walk(dist, prev, source, destination):
+        """
+        Reconstructs the walk from a source vertex to a destination vertex from the previous vertex dictionary.
+
+        :type dist: dict[int, int]
+        :param dist: The distance dictionary
+
+        :type prev: dict[int, int]
+        :param prev: The previous vertex dictionary
+
+        :type source: int
+        :param source: The source vertex
+
+        :type destination: int
+        :param destination: The destination vertex
+
+        :rtype: tuple[list[int], int]
+        :returns: A tuple containing the walk and its cost, or None and infinity if the destination is unreachable
+        """
 
         # If the destination vertex is unreachable, return None and infinity
-        if dist[destination] == float('inf'):
+        if destination not in dist:
             return None, float('inf')
 
-        min_cost_walk = []
-        vertex = destination
-
-        # Reconstruct the minimum cost walk
-        while vertex != source and prev:
-            min_cost_walk.append(vertex)
-            vertex = prev[vertex]
+        min_cost_walk = [destination]
+        while min_cost_walk[-1] != source:
+            min_cost_walk.append(prev[min_cost_walk[-1]])
 
-        min_cost_walk.append(source)
         return min_cost_walk[::-1], dist[destination]
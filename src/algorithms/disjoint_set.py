@@ -0,0 +1,92 @@
+from array import array
+
+
+class DisjointSet:
+    """
+    Keeps a partition of the integers from 0 up to a count into disjoint sets, held in arrays: the parent of every
+    element and the rank of every root. Finding the root of an element compresses the path to it and uniting two
+    sets hangs the root of lower rank under the other one, which makes both operations run in nearly constant
+    amortized time.
+    """
+
+    def __init__(self, count=0):
+        """
+        :type count: int
+        :param count: The number of elements, each starting in a set of its own
+        """
+
+        self.__parent = array('q', range(count))
+        self.__rank = array('B', bytes(count))
+        self.__sets_count = count
+
+    @property
+    def sets_count(self):
+        return self.__sets_count
+
+    def __len__(self):
+        return len(self.__parent)
+
+    def add(self):
+        """
+        Adds a new element in a set of its own.
+
+        :rtype: int
+        :returns: The new element
+        """
+
+        element = len(self.__parent)
+        self.__parent.append(element)
+        self.__rank.append(0)
+        self.__sets_count += 1
+        return element
+
+    def find(self, element):
+        """
+        Finds the root of the set holding an element, pointing every element on the way straight at it.
+
+        :type element: int
+        :param element: The element
+
+        :rtype: int
+        :returns: The root of the set
+        """
+
+        parent = self.__parent
+
+        root = element
+        while parent[root] != root:
+            root = parent[root]
+
+        while parent[element] != root:
+            parent[element], element = root, parent[element]
+
+        return root
+
+    def union(self, first, second):
+        """
+        Unites the sets holding two elements.
+
+        :type first: int
+        :param first: The first element
+
+        :type second: int
+        :param second: The second element
+
+        :rtype: bool
+        :returns: True if the elements were in different sets, False otherwise
+        """
+
+        first, second = self.find(first), self.find(second)
+        if first == second:
+            return False
+
+        rank = self.__rank
+        if rank[first] < rank[second]:
+            first, second = second, first
+
+        self.__parent[second] = first
+        if rank[first] == rank[second]:
+            rank[first] += 1
+
+        self.__sets_count -= 1
+        return True
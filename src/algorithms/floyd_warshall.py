@@ -1,61 +1,194 @@
+from array import array
+
 from src.graphs.directed_graph import DirectedGraph
 from src.services.directed_graph_service import DirectedGraphService
 
+
 class FloydWarshall:
     __graph: DirectedGraph
 
+    def __init__(self, graph=None):
+        """
+        :type graph: DirectedGraph | CompactDirectedGraph | None
+        :param graph: The graph to search, or None if it will be read from a file by run()
+        """
+
+        self.__graph = graph
+        self.__vertices = None
+        self.__positions = None
+        self.__cost = None
+        self.__next_vertex = None
+        self.__negative_cycle_vertices = None
+
     def run(self):
         """
         Reads a directed graph from a file and displays the shortest path matrix using the Floyd-Warshall algorithm.
         """
 
         self.__graph = DirectedGraphService.read_graph_from_file("database/shortest_path_data.txt")
-        cost, prev = self.__get_shortest_path_matrix()
+        cost, next_vertex = self.get_shortest_path_matrix()
 
         print("Shortest path matrix:")
-        for row in self.__graph.vertices:
-            for column in self.__graph.vertices:
-                print(f"{(cost[row, column] if cost[row, column] != float('inf') else '-'):>4}", end=" ")
+        for row in cost:
+            for value in row:
+                print(f"{(self.__format_cost(value) if value != float('inf') else '-'):>4}", end=" ")
             print()
 
         print("\nNext vertex matrix:")
-        for row in self.__graph.vertices:
-            for column in self.__graph.vertices:
-                print(f"{prev.get((row, column), '-'):>4}", end=" ")
+        for row in next_vertex:
+            for position in row:
+                print(f"{(self.__vertices[position] if position != -1 else '-'):>4}", end=" ")
             print()
 
-    def __get_shortest_path_matrix(self):
+    def get_shortest_path_matrix(self):
         """
-        Calculates the shortest path matrix using the Floyd-Warshall algorithm.
+        Calculates the shortest path matrix using the Floyd-Warshall algorithm. Rows and columns are indexed by
+        the position of the vertices in the vertices of the graph.
 
-        :rtype: tuple[dict[tuple[int, int], int], dict[tuple[int, int], int]]
-        :returns: A tuple containing the cost and next vertex dictionaries
+        The matrices are dense arrays of machine words: each step over an intermediary vertex is done row by row,
+        only over the columns the intermediary vertex can reach, with the row of the intermediary vertex shared
+        by all the other rows.
+
+        :rtype: tuple[list[array], list[array]]
+        :returns: A tuple containing the cost matrix, with infinity for unreachable vertices, and the next vertex
+        matrix, holding the position of the vertex following the source vertex on the walk or -1 if there is none
         """
 
-        cost = {}
-        next_vertex = {}
+        infinity = float('inf')
+        self.__vertices = list(self.__graph.vertices)
+        self.__positions = positions = {vertex: position for position, vertex in enumerate(self.__vertices)}
+        vertices_count = len(self.__vertices)
+
+        # The cost of a vertex to itself is 0 and to the vertices it is not directly connected to is infinity
+        cost = [array('d', [infinity]) * vertices_count for _ in range(vertices_count)]
+        next_vertex = [array('i', [-1]) * vertices_count for _ in range(vertices_count)]
+        for position in range(vertices_count):
+            cost[position][position] = 0
+
+        # The cost of a vertex to its neighbours is the cost of the edge connecting them
+        for source in self.__vertices:
+            cost_row, next_row = cost[positions[source]], next_vertex[positions[source]]
+            for destination, edge_cost in self.__graph.outbound_edges(source):
+                destination = positions[destination]
+                if edge_cost < cost_row[destination]:
+                    cost_row[destination] = edge_cost
+                    next_row[destination] = destination
 
-        # Initialize the cost and previous vertex dictionaries
-        for source in self.__graph.vertices:
-            for destination in self.__graph.vertices:
-                # The cost of a vertex to itself is 0
-                if source == destination:
-                    cost[source, destination] = 0
-                # The cost of a vertex to its neighbours is the cost of the edge connecting them
-                elif self.__graph.are_connected(source, destination):
-                    cost[source, destination] = self.__graph.get_cost((source, destination))
-                    next_vertex[source, destination] = destination
-                # The cost of a vertex to vertices it is not directly connected to is infinity
-                else:
-                    cost[source, destination] = float('inf')
+        self._relax_all_pairs(self.__graph, self.__vertices, cost, next_vertex)
 
-        # Calculate the shortest path matrix using the Floyd-Warshall algorithm
-        for intermediary in self.__graph.vertices:
-            for source in self.__graph.vertices:
-                for destination in self.__graph.vertices:
-                    # Update the cost and next vertex dictionaries if a shorter path is found
-                    if cost[source, destination] > cost[source, intermediary] + cost[intermediary, destination]:
-                        cost[source, destination] = cost[source, intermediary] + cost[intermediary, destination]
-                        next_vertex[source, destination] = next_vertex[source, intermediary]
+        self.__cost, self.__next_vertex = cost, next_vertex
 
+        # A vertex lies on a negative cost cycle when its cost to itself is negative
+        self.__negative_cycle_vertices = [vertex for position, vertex in enumerate(self.__vertices)
+                                          if cost[position][position] < 0]
         return cost, next_vertex
+
+    def _relax_all_pairs(self, graph, vertices, cost, next_vertex):
+        """
+        Runs the Floyd-Warshall steps over every intermediary vertex on the initial cost and next vertex matrices,
+        updating them in place. Subclasses override this to change how the minimum costs are calculated.
+
+        :type graph: DirectedGraph | CompactDirectedGraph
+        :param graph: The graph
+
+        :type vertices: list[int]
+        :param vertices: The vertices of the graph, in the order of the rows and columns of the matrices
+
+        :type cost: list[array]
+        :param cost: The cost matrix
+
+        :type next_vertex: list[array]
+        :param next_vertex: The next vertex matrix
+
+        :rtype: None
+        """
+
+        infinity = float('inf')
+        vertices_count = len(cost)
+
+        for intermediary in range(vertices_count):
+            # Only the destinations the intermediary vertex can reach may get a cheaper walk through it
+            reachable = [(destination, value) for destination, value in enumerate(cost[intermediary])
+                         if value != infinity]
+
+            for source in range(vertices_count):
+                cost_row = cost[source]
+                to_intermediary = cost_row[intermediary]
+                if to_intermediary == infinity or source == intermediary:
+                    continue
+
+                # Update the row wherever going through the intermediary vertex is cheaper
+                improved = [(destination, to_intermediary + value) for destination, value in reachable
+                            if to_intermediary + value < cost_row[destination]]
+                if improved:
+                    next_row = next_vertex[source]
+                    hop = next_row[intermediary]
+                    for destination, value in improved:
+                        cost_row[destination] = value
+                        next_row[destination] = hop
+
+    def get_negative_cycle_vertices(self):
+        """
+        Finds the vertices lying on a negative cost cycle, which are the ones whose cost to themselves is negative.
+
+        :rtype: list[int]
+        :returns: The vertices that lie on a negative cost cycle
+        """
+
+        if self.__cost is None:
+            self.get_shortest_path_matrix()
+
+        return list(self.__negative_cycle_vertices)
+
+    def get_minimum_cost_walk(self, source, destination):
+        """
+        Reconstructs the minimum cost walk from a source vertex to a destination vertex from the next vertex
+        matrix, calculating the shortest path matrix first if it has not been calculated yet.
+
+        :type source: int
+        :param source: The source vertex
+
+        :type destination: int
+        :param destination: The destination vertex
+
+        :rtype: tuple[list[int], int]
+        :returns: A tuple containing the minimum cost walk from the source vertex to the destination vertex
+        and the cost of the walk
+        """
+
+        if self.__cost is None:
+            self.get_shortest_path_matrix()
+
+        if self.__negative_cycle_vertices:
+            raise ValueError("Negative cost cycle")
+
+        try:
+            position, destination_position = self.__positions[source], self.__positions[destination]
+        except KeyError:
+            raise ValueError("Invalid vertex")
+
+        # If the destination vertex is unreachable, return None and infinity
+        cost = self.__cost[position][destination_position]
+        if cost == float('inf'):
+            return None, cost
+
+        min_cost_walk = [source]
+        while position != destination_position:
+            position = self.__next_vertex[position][destination_position]
+            min_cost_walk.append(self.__vertices[position])
+
+        return min_cost_walk, self.__format_cost(cost)
+
+    @staticmethod
+    def __format_cost(cost):
+        """
+        Converts a cost read from the cost matrix back to an integer when it holds an integral value.
+
+        :type cost: float
+        :param cost: The cost
+
+        :rtype: int | float
+        :returns: The cost as an integer if it is integral, otherwise unchanged
+        """
+
+        return int(cost) if cost.is_integer() else cost
@@ -0,0 +1,265 @@
+from collections import deque
+
+from src.algorithms.floyd_warshall import FloydWarshall
+
+
+class IncrementalAllPairsShortestPaths:
+    """
+    Keeps the cost and next vertex matrices of the Floyd-Warshall algorithm up to date while the edges of a graph
+    change, without recalculating them from scratch.
+
+    An edge getting cheaper, which includes a new edge, can only improve the walks that go through it, so every
+    source is checked once against the walk through the edge in O(V^2) overall. An edge getting more expensive,
+    which includes a removed edge, can only worsen the walks that went through it; those are found by following
+    the next vertex matrix and repaired by a search over the affected sources alone, for every destination
+    concerned. When a repair would touch more pairs than the repair limit, or a negative cost cycle is involved,
+    the matrices are recalculated in full instead.
+    """
+
+    def __init__(self, graph, floyd_warshall=None, repair_limit=0.25):
+        """
+        :type graph: DirectedGraph
+        :param graph: The graph to keep the shortest paths of; it must only be changed through this object afterwards
+
+        :type floyd_warshall: FloydWarshall | None
+        :param floyd_warshall: The all pairs algorithm used for full recalculations, on the same graph,
+        or None for the plain Floyd-Warshall algorithm
+
+        :type repair_limit: float
+        :param repair_limit: The fraction of all the pairs of vertices past which a repair gives way
+        to a full recalculation
+        """
+
+        self.__graph = graph
+        self.__floyd_warshall = FloydWarshall(graph) if floyd_warshall is None else floyd_warshall
+        self.__repair_limit = repair_limit
+
+        self.__vertices = list(graph.vertices)
+        self.__positions = {vertex: position for position, vertex in enumerate(self.__vertices)}
+        self.__recalculations = -1
+        self.__recalculate()
+
+    @property
+    def recalculations(self):
+        return self.__recalculations
+
+    def get_shortest_path_matrix(self):
+        """
+        Gets the current shortest path matrices, indexed by the position of the vertices in the vertices of the graph.
+
+        :rtype: tuple[list[array], list[array]]
+        :returns: A tuple containing the cost matrix and the next vertex matrix
+        """
+
+        return self.__cost, self.__next_vertex
+
+    def get_minimum_cost_walk(self, source, destination):
+        """
+        Reconstructs the minimum cost walk from a source vertex to a destination vertex.
+
+        :type source: int
+        :param source: The source vertex
+
+        :type destination: int
+        :param destination: The destination vertex
+
+        :rtype: tuple[list[int], int]
+        :returns: A tuple containing the minimum cost walk from the source vertex to the destination vertex
+        and the cost of the walk
+
+        :raises ValueError: If a vertex is invalid or the graph has a negative cost cycle
+        """
+
+        return self.__floyd_warshall.get_minimum_cost_walk(source, destination)
+
+    def add_edge(self, edge, cost):
+        self.__graph.add_edge(edge, cost)
+
+        # Take the edge back out when the matrices cannot be brought up to date, so that they still match the graph
+        try:
+            self.__decrease(edge, cost)
+        except ValueError:
+            self.__graph.remove_edge(edge)
+            raise
+
+    def remove_edge(self, edge):
+        old_cost = self.__graph.get_cost(edge)
+        self.__graph.remove_edge(edge)
+
+        try:
+            self.__increase(edge)
+        except ValueError:
+            self.__graph.add_edge(edge, old_cost)
+            raise
+
+    def set_cost(self, edge, cost):
+        old_cost = self.__graph.get_cost(edge)
+        self.__graph.set_cost(edge, cost)
+
+        try:
+            if cost < old_cost:
+                self.__decrease(edge, cost)
+            elif cost > old_cost:
+                self.__increase(edge)
+        except ValueError:
+            self.__graph.set_cost(edge, old_cost)
+            raise
+
+    def __recalculate(self):
+        self.__cost, self.__next_vertex = self.__floyd_warshall.get_shortest_path_matrix()
+        self.__negative_cycle = bool(self.__floyd_warshall.get_negative_cycle_vertices())
+        self.__recalculations += 1
+
+    def __decrease(self, edge, edge_cost):
+        """
+        Improves the walks going through an edge that just got cheaper.
+
+        :type edge: tuple[int, int]
+        :param edge: The edge
+
+        :type edge_cost: int
+        :param edge_cost: The new cost of the edge
+
+        :rtype: None
+        """
+
+        infinity = float('inf')
+        start, end = self.__positions[edge[0]], self.__positions[edge[1]]
+        cost, next_vertex = self.__cost, self.__next_vertex
+
+        if self.__negative_cycle or edge_cost + cost[end][start] < 0:
+            self.__recalculate()
+            return
+
+        # The edge is of no use when the walk it starts is not cheaper than the current one
+        if edge_cost >= cost[start][end]:
+            return
+
+        # Walks out of the end of the edge cannot improve without a negative cost cycle, so its row stays the same
+        reachable = [(destination, value) for destination, value in enumerate(cost[end]) if value != infinity]
+
+        for source in range(len(cost)):
+            cost_row = cost[source]
+            through = cost_row[start] + edge_cost
+            if through >= cost_row[end]:
+                continue
+
+            # Update the row wherever going through the edge is cheaper
+            improved = [(destination, through + value) for destination, value in reachable
+                        if through + value < cost_row[destination]]
+            next_row = next_vertex[source]
+            hop = end if source == start else next_row[start]
+            for destination, value in improved:
+                cost_row[destination] = value
+                next_row[destination] = hop
+
+    def __increase(self, edge):
+        """
+        Repairs the walks that went through an edge that just got more expensive or was removed.
+
+        :type edge: tuple[int, int]
+        :param edge: The edge
+
+        :rtype: None
+        """
+
+        if self.__negative_cycle:
+            self.__recalculate()
+            return
+
+        start, end = self.__positions[edge[0]], self.__positions[edge[1]]
+        vertices_count = len(self.__cost)
+        limit = self.__repair_limit * vertices_count * vertices_count
+
+        # The walks to a destination use the edge exactly when the walk from its start does
+        destinations = [destination for destination, hop in enumerate(self.__next_vertex[start]) if hop == end]
+
+        affected, affected_count = [], 0
+        for destination in destinations:
+            sources = self.__get_affected_sources(start, destination)
+            affected.append((destination, sources))
+            affected_count += len(sources)
+            if affected_count > limit:
+                self.__recalculate()
+                return
+
+        for destination, sources in affected:
+            self.__repair(destination, sources)
+
+    def __get_affected_sources(self, start, destination):
+        """
+        Finds the sources whose walk to a destination goes through a given vertex, by following the next vertex
+        matrix from every source until it reaches a vertex whose answer is already known.
+
+        :type start: int
+        :param start: The position of the vertex
+
+        :type destination: int
+        :param destination: The position of the destination
+
+        :rtype: set[int]
+        :returns: The positions of the sources whose walk goes through the vertex
+        """
+
+        next_vertex = self.__next_vertex
+
+        # A walk goes through the vertex when the walk from its next vertex does
+        through = {start: True, destination: False}
+        for source in range(len(next_vertex)):
+            walk = []
+            vertex = source
+            while vertex != -1 and vertex not in through:
+                walk.append(vertex)
+                vertex = next_vertex[vertex][destination]
+
+            answer = through.get(vertex, False)
+            for vertex in walk:
+                through[vertex] = answer
+
+        return {vertex for vertex, answer in through.items() if answer}
+
+    def __repair(self, destination, sources):
+        """
+        Recalculates the cost and next vertex of a set of sources for a destination. Every source starts from
+        its best edge leaving the set, whose walks are still valid, and then the costs are relaxed backwards
+        along the edges inside the set until nothing changes.
+
+        :type destination: int
+        :param destination: The position of the destination
+
+        :type sources: set[int]
+        :param sources: The positions of the sources to repair
+
+        :rtype: None
+        """
+
+        infinity = float('inf')
+        vertices, positions = self.__vertices, self.__positions
+        cost, next_vertex = self.__cost, self.__next_vertex
+
+        for source in sources:
+            best_cost, best_hop = infinity, -1
+            for neighbour, edge_cost in self.__graph.outbound_edges(vertices[source]):
+                neighbour = positions[neighbour]
+                if neighbour not in sources and edge_cost + cost[neighbour][destination] < best_cost:
+                    best_cost, best_hop = edge_cost + cost[neighbour][destination], neighbour
+            cost[source][destination], next_vertex[source][destination] = best_cost, best_hop
+
+        queue = deque(sources)
+        queued = set(sources)
+
+        while queue:
+            vertex = queue.popleft()
+            queued.discard(vertex)
+            vertex_cost = cost[vertex][destination]
+            if vertex_cost == infinity:
+                continue
+
+            for neighbour, edge_cost in self.__graph.inbound_edges(vertices[vertex]):
+                neighbour = positions[neighbour]
+                if neighbour in sources and edge_cost + vertex_cost < cost[neighbour][destination]:
+                    cost[neighbour][destination] = edge_cost + vertex_cost
+                    next_vertex[neighbour][destination] = vertex
+                    if neighbour not in queued:
+                        queued.add(neighbour)
+                        queue.append(neighbour)
@@ -0,0 +1,231 @@
+from array import array
+
+from src.algorithms.tarjan import Tarjan
+from src.graphs.directed_graph import DirectedGraph
+
+
+class IncrementalCondensation:
+    """
+    Keeps the strongly connected components and the condensation of a directed graph up to date while edges and
+    vertices are added to it, without recomputing them from scratch.
+
+    Components keep a topological order which is repaired after every edge going against it, by searching only
+    the components between the two ends of the edge in that order (the Pearce-Kelly algorithm). When the edge
+    closes a cycle, the components found on it by both searches are merged instead.
+    """
+
+    def __init__(self, graph):
+        """
+        :type graph: DirectedGraph
+        :param graph: The graph to keep the components of; it must only be changed through this object afterwards
+        """
+
+        self.__graph = graph
+        self.__vertices = list(graph.vertices)
+        self.__positions = {vertex: position for position, vertex in enumerate(self.__vertices)}
+
+        condensation, component, _ = Tarjan(graph).get_condensation()
+        component_count = condensation.vertices_count
+
+        # The component of every vertex by position and the positions of the vertices of every component
+        self.__component = component
+        self.__members = {component_id: [] for component_id in range(component_count)}
+        for position, component_id in enumerate(component):
+            self.__members[component_id].append(position)
+
+        # The edges between components, mapped to the cost of the cheapest edge joining them
+        self.__outbound = {component_id: dict(condensation.outbound_edges(component_id))
+                           for component_id in range(component_count)}
+        self.__inbound = {component_id: dict(condensation.inbound_edges(component_id))
+                          for component_id in range(component_count)}
+
+        # Tarjan numbers components in reverse topological order
+        self.__order = {component_id: component_count - 1 - component_id for component_id in range(component_count)}
+        self.__next_component = component_count
+        self.__next_order = component_count
+
+    @property
+    def components_count(self):
+        return len(self.__members)
+
+    def same_component(self, start, end):
+        return self.__component[self.__position(start)] == self.__component[self.__position(end)]
+
+    def add_vertex(self, vertex):
+        self.__graph.add_vertex(vertex)
+
+        self.__positions[vertex] = len(self.__vertices)
+        self.__vertices.append(vertex)
+
+        # A new vertex forms a component of its own, placed after all the others
+        component_id = self.__next_component
+        self.__next_component += 1
+        self.__component.append(component_id)
+        self.__members[component_id] = [self.__positions[vertex]]
+        self.__outbound[component_id] = {}
+        self.__inbound[component_id] = {}
+        self.__order[component_id] = self.__next_order
+        self.__next_order += 1
+
+    def add_edge(self, edge, cost):
+        self.__graph.add_edge(edge, cost)
+
+        start, end = edge
+        start, end = self.__component[self.__position(start)], self.__component[self.__position(end)]
+        if start == end:
+            return
+
+        # The edge goes along the topological order, or joins two components already joined
+        if self.__order[start] < self.__order[end]:
+            self.__link(start, end, cost)
+            return
+
+        lower, upper = self.__order[end], self.__order[start]
+        forward = self.__search(end, self.__outbound, lambda order: order <= upper)
+        backward = self.__search(start, self.__inbound, lambda order: order >= lower)
+        slots = sorted(self.__order[component_id] for component_id in forward | backward)
+
+        if start in forward:
+            # The edge closes a cycle through every component both reachable from its end and reaching its start
+            merged = forward & backward
+            component_id = self.__merge(merged)
+            before = sorted(backward - merged, key=self.__order.get)
+            after = sorted(forward - merged, key=self.__order.get)
+            middle = [component_id]
+        else:
+            self.__link(start, end, cost)
+            before = sorted(backward, key=self.__order.get)
+            after = sorted(forward, key=self.__order.get)
+            middle = []
+
+        # Give the components reaching the start the smallest slots and the ones reachable from the end the largest
+        for component_id, order in zip(before + middle, slots):
+            self.__order[component_id] = order
+        for component_id, order in zip(after, slots[len(slots) - len(after):]):
+            self.__order[component_id] = order
+
+    def add_edges(self, edges):
+        for edge, cost in edges:
+            self.add_edge(edge, cost)
+
+    def get_strongly_connected_components(self):
+        """
+        Gets the strongly connected components of the graph, in topological order.
+
+        :rtype: list[list[int]]
+        :returns: A list of lists where each list represents a strongly connected component
+        and contains the vertices in that component
+        """
+
+        return [[self.__vertices[position] for position in self.__members[component_id]]
+                for component_id in sorted(self.__members, key=self.__order.get)]
+
+    def get_condensation(self):
+        """
+        Gets the condensation of the graph, with the components numbered in topological order.
+
+        :rtype: tuple[DirectedGraph, array, list[int]]
+        :returns: A tuple containing the condensation, the component of every vertex by its position
+        in the vertices of the graph and the components in topological order
+        """
+
+        numbers = {component_id: number
+                   for number, component_id in enumerate(sorted(self.__members, key=self.__order.get))}
+        condensation = DirectedGraph(len(numbers))
+
+        for component_id, neighbours in self.__outbound.items():
+            for neighbour, cost in neighbours.items():
+                condensation.add_edge((numbers[component_id], numbers[neighbour]), cost)
+
+        component = array('q', (numbers[component_id] for component_id in self.__component))
+        return condensation, component, list(range(len(numbers)))
+
+    def __position(self, vertex):
+        try:
+            return self.__positions[vertex]
+        except KeyError:
+            raise ValueError("Invalid vertex")
+
+    def __link(self, start, end, cost):
+        """
+        Joins two components by an edge, keeping the cheapest cost when they are already joined.
+
+        :type start: int
+        :param start: The start component
+
+        :type end: int
+        :param end: The end component
+
+        :type cost: int
+        :param cost: The cost of the edge
+
+        :rtype: None
+        """
+
+        cost = min(cost, self.__outbound[start].get(end, cost))
+        self.__outbound[start][end] = cost
+        self.__inbound[end][start] = cost
+
+    def __search(self, source, neighbours, in_bounds):
+        """
+        Finds the components reachable from a source component whose order lies within bounds.
+
+        :type source: int
+        :param source: The source component
+
+        :type neighbours: dict[int, dict[int, int]]
+        :param neighbours: The outbound or inbound edges of every component, depending on the search direction
+
+        :type in_bounds: Callable[[int], bool]
+        :param in_bounds: Whether a component with a given order may be visited
+
+        :rtype: set[int]
+        :returns: The components reached, including the source component
+        """
+
+        visited = {source}
+        stack = [source]
+
+        while stack:
+            for neighbour in neighbours[stack.pop()]:
+                if neighbour not in visited and in_bounds(self.__order[neighbour]):
+                    visited.add(neighbour)
+                    stack.append(neighbour)
+
+        return visited
+
+    def __merge(self, merged):
+        """
+        Merges a set of components into the one with the most vertices, moving the vertices and edges
+        of the others over to it.
+
+        :type merged: set[int]
+        :param merged: The components to merge
+
+        :rtype: int
+        :returns: The component the others were merged into
+        """
+
+        target = max(merged, key=lambda component_id: len(self.__members[component_id]))
+
+        for component_id in merged - {target}:
+            for position in self.__members[component_id]:
+                self.__component[position] = target
+            self.__members[target].extend(self.__members.pop(component_id))
+            self.__order.pop(component_id)
+
+            # Move the edges over to the target, dropping the ones that now lie inside it
+            for neighbour, cost in self.__outbound.pop(component_id).items():
+                if neighbour not in merged:
+                    self.__inbound[neighbour].pop(component_id)
+                    self.__link(target, neighbour, cost)
+            for neighbour, cost in self.__inbound.pop(component_id).items():
+                if neighbour not in merged:
+                    self.__outbound[neighbour].pop(component_id)
+                    self.__link(neighbour, target, cost)
+
+        for component_id in merged:
+            self.__outbound[target].pop(component_id, None)
+            self.__inbound[target].pop(component_id, None)
+
+        return target
@@ -0,0 +1,154 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from src.algorithms.bellman_ford import BellmanFord
+from src.algorithms.dijkstra import Dijkstra
+from src.algorithms.floyd_warshall import FloydWarshall
+from src.graphs.compact_directed_graph import CompactDirectedGraph
+from src.graphs.directed_graph import DirectedGraph
+
+# The reweighted graph shared by the searches of a worker process, loaded once per worker by _load_graph
+_dijkstra = None
+_potentials = None
+
+
+def _load_graph(graph, potentials):
+    """
+    Prepares a worker process to run searches on the reweighted graph.
+
+    :type graph: CompactDirectedGraph
+    :param graph: The reweighted graph, whose vertices are the positions of the original vertices
+
+    :type potentials: list[int]
+    :param potentials: The potential of every vertex used to reweight the edges
+
+    :rtype: None
+    """
+
+    global _dijkstra, _potentials
+
+    _dijkstra = Dijkstra(graph)
+    _potentials = potentials
+
+
+def _search_rows(sources):
+    """
+    Calculates the rows of the cost and next vertex matrices of a set of source vertices
+    by running the Dijkstra algorithm on the reweighted graph.
+
+    :type sources: list[int]
+    :param sources: The positions of the source vertices
+
+    :rtype: list[tuple[array, array]]
+    :returns: The cost and next vertex rows of every source vertex
+    """
+
+    vertices_count = len(_potentials)
+    rows = []
+
+    for source in sources:
+        dist, prev = _dijkstra.get_shortest_path_tree(source)
+        cost_row = array('d', [float('inf')]) * vertices_count
+        next_row = array('i', [-1]) * vertices_count
+
+        # Undo the reweighting, which adds the same amount to every walk between two vertices
+        for vertex, cost in dist.items():
+            cost_row[vertex] = cost - _potentials[source] + _potentials[vertex]
+
+        # The next vertex of a vertex is the first vertex on the walk from the source in the search tree,
+        # shared with every vertex on the walk to it
+        for destination in dist:
+            walk = []
+            vertex = destination
+            while vertex != source and next_row[vertex] == -1:
+                walk.append(vertex)
+                vertex = prev[vertex]
+
+            hop = walk[-1] if vertex == source and walk else next_row[vertex]
+            for vertex in walk:
+                next_row[vertex] = hop
+
+        rows.append((cost_row, next_row))
+
+    return rows
+
+
+class Johnson(FloydWarshall):
+    """
+    Johnson's algorithm for all pairs minimum cost walks on sparse graphs. A single Bellman-Ford search from a
+    virtual vertex gives every vertex a potential used to reweight the edges to non-negative costs, after which
+    a Dijkstra search is run from every vertex, spread over a pool of worker processes.
+
+    A graph with a negative cost cycle has no such potentials, so it falls back to the Floyd-Warshall steps, which
+    leave the vertices on the cycle with a negative cost to themselves for get_negative_cycle_vertices() to report.
+    """
+
+    def __init__(self, graph=None, max_workers=None):
+        """
+        :type graph: DirectedGraph | CompactDirectedGraph | None
+        :param graph: The graph to search, or None if it will be read from a file by run()
+
+        :type max_workers: int | None
+        :param max_workers: The number of worker processes, or None to use one per CPU
+        """
+
+        super().__init__(graph)
+        self.__max_workers = max_workers or os.cpu_count()
+
+    def _relax_all_pairs(self, graph, vertices, cost, next_vertex):
+        """
+        Replaces the rows of the cost and next vertex matrices with the results of the Dijkstra searches,
+        or runs the Floyd-Warshall steps on them when the graph has a negative cost cycle.
+
+        :type graph: DirectedGraph | CompactDirectedGraph
+        :param graph: The graph
+
+        :type vertices: list[int]
+        :param vertices: The vertices of the graph, in the order of the rows and columns of the matrices
+
+        :type cost: list[array]
+        :param cost: The cost matrix
+
+        :type next_vertex: list[array]
+        :param next_vertex: The next vertex matrix
+
+        :rtype: None
+        """
+
+        vertices_count = len(vertices)
+        positions = {vertex: position for position, vertex in enumerate(vertices)}
+
+        # The distances from the virtual vertex make every reweighted edge cost non-negative
+        try:
+            dist, _ = BellmanFord(graph).get_shortest_path_tree()
+        except ValueError:
+            super()._relax_all_pairs(graph, vertices, cost, next_vertex)
+            return
+        potentials = [dist[vertex] for vertex in vertices]
+
+        reweighted_graph = DirectedGraph(vertices_count)
+        for start in vertices:
+            for end, edge_cost in graph.outbound_edges(start):
+                start_position, end_position = positions[start], positions[end]
+                reweighted_graph.add_edge((start_position, end_position),
+                                          edge_cost + potentials[start_position] - potentials[end_position])
+        reweighted_graph = CompactDirectedGraph(reweighted_graph)
+
+        chunk_size = max(1, vertices_count // (4 * self.__max_workers))
+        chunks = [list(range(start, min(start + chunk_size, vertices_count)))
+                  for start in range(0, vertices_count, chunk_size)]
+
+        # Run the searches in this process when there is a single worker, to spare the pool start up
+        if self.__max_workers == 1:
+            _load_graph(reweighted_graph, potentials)
+            rows = [row for chunk in map(_search_rows, chunks) for row in chunk]
+            _load_graph(None, None)
+        else:
+            with ProcessPoolExecutor(self.__max_workers, initializer=_load_graph,
+                                     initargs=(reweighted_graph, potentials)) as pool:
+                rows = [row for chunk in pool.map(_search_rows, chunks) for row in chunk]
+
+        for position, (cost_row, next_row) in enumerate(rows):
+            cost[position] = cost_row
+            next_vertex[position] = next_row
@@ -1,4 +1,4 @@
-from queue import Queue
+from collections import deque
 
 from src.graphs.directed_graph import DirectedGraph
 from src.services.directed_graph_service import DirectedGraphService
@@ -7,41 +7,69 @@ from src.services.directed_graph_service import DirectedGraphService
 class Kosaraju:
     __graph: DirectedGraph
 
+    def __init__(self, graph=None):
+        """
+        :type graph: DirectedGraph | CompactDirectedGraph | None
+        :param graph: The graph to search, or None if it will be read from a file by run()
+        """
+
+        self.__graph = graph
+
     def run(self):
         """
         Reads a directed graph from a file and displays its strongly connected components.
         """
 
         self.__graph = DirectedGraphService.read_graph_from_file("database/scc_data.txt")
-        ans = self.__get_strongly_connected_components()
+        ans = self.get_strongly_connected_components()
         print("Strongly connected components:")
         for index, components in enumerate(ans):
             print(f"[{index}]: {components}")
 
-    def __create_reverse_depth_vertex_list(self, vertex, visited, processed):
+    def __create_reverse_depth_vertex_list(self, root, vertices, positions, visited, processed):
         """
         Performs depth first search on the graph in order to create a stack that contains
-        the vertices in reverse order of depth from the starting vertex.
+        the vertices in reverse order of depth from the starting vertex. The search keeps its own stack
+        of vertices and neighbour iterators, so its depth is not bounded by the recursion limit.
 
-        :type vertex: int
-        :param vertex: The vertex to start the depth first search from
+        :type root: int
+        :param root: The position of the vertex to start the depth first search from
 
-        :type visited: set
-        :param visited: The set keeping track of all the vertices we have visited during the search
+        :type vertices: list[int]
+        :param vertices: The vertices of the graph
+
+        :type positions: dict[int, int]
+        :param positions: The position of every vertex in the list of vertices
+
+        :type visited: bytearray
+        :param visited: The flags keeping track of all the vertices we have visited during the search
 
         :type processed: list[int]
-        :param processed: The stack containing the elements in reverse order of depth
+        :param processed: The stack containing the positions of the vertices in reverse order of depth
 
         :rtype: None
         """
 
-        for neighbour in self.__graph.outbound_neighbours(vertex):
-            if neighbour not in visited:
-                visited.add(neighbour)
-                self.__create_reverse_depth_vertex_list(neighbour, visited, processed)
-        processed.append(vertex)
-
-    def __get_strongly_connected_components(self):
+        outbound_neighbours = self.__graph.outbound_neighbours
+        visited[root] = True
+        stack = [(root, outbound_neighbours(vertices[root]))]
+
+        while stack:
+            vertex, neighbours = stack[-1]
+
+            # Descend into the first neighbour that has not been visited yet
+            for neighbour in neighbours:
+                neighbour = positions[neighbour]
+                if not visited[neighbour]:
+                    visited[neighbour] = True
+                    stack.append((neighbour, outbound_neighbours(vertices[neighbour])))
+                    break
+            # All the neighbours have been visited, so the vertex is done
+            else:
+                stack.pop()
+                processed.append(vertex)
+
+    def get_strongly_connected_components(self):
         """
         Gets the strongly connected components of a graph using Kosaraju's algorithm.
 
@@ -50,36 +78,39 @@ class Kosaraju:
         and contains the vertices in that component
         """
 
+        vertices = list(self.__graph.vertices)
+        positions = {vertex: position for position, vertex in enumerate(vertices)}
+
         components = list()
-        queue = Queue()
-        visited = set()
+        queue = deque()
+        visited = bytearray(len(vertices))
         processed = list()
 
         # Create the stack in which vertices are sorted in reverse order of time to get to them from node 0 through DFS
-        for vertex in self.__graph.vertices:
-            if vertex not in visited:
-                visited.add(vertex)
-                self.__create_reverse_depth_vertex_list(vertex, visited, processed)
+        for vertex in range(len(vertices)):
+            if not visited[vertex]:
+                self.__create_reverse_depth_vertex_list(vertex, vertices, positions, visited, processed)
 
-        visited.clear()
+        visited = bytearray(len(vertices))
 
         while not len(processed) == 0:
             # Get the vertex closest to the root
             top = processed.pop()
-            if top in visited:
+            if visited[top]:
                 continue
 
-            queue.put(top)
-            visited.add(top)
-            components.append([top])
+            queue.append(top)
+            visited[top] = True
+            components.append([vertices[top]])
 
             # Perform BFS in order to mark the whole SCC as visited and the vertices to the dictionary
-            while not queue.empty():
-                vertex = queue.get()
-                for neighbour in self.__graph.inbound_neighbours(vertex):
-                    if neighbour not in visited:
-                        visited.add(neighbour)
-                        queue.put(neighbour)
+            while queue:
+                vertex = queue.popleft()
+                for neighbour in self.__graph.inbound_neighbours(vertices[vertex]):
+                    position = positions[neighbour]
+                    if not visited[position]:
+                        visited[position] = True
+                        queue.append(position)
                         components[-1].append(neighbour)
 
         return components
@@ -0,0 +1,56 @@
+from array import array
+
+from src.algorithms.disjoint_set import DisjointSet
+
+
+class Kruskal:
+    """
+    Calculates minimum spanning trees of undirected graphs with the Kruskal algorithm: the edges are sorted by cost
+    once and taken in that order whenever they join two different components, which a disjoint set over
+    the positions of the vertices keeps track of.
+    """
+
+    def __init__(self, graph):
+        """
+        :type graph: UndirectedGraph | CompactUndirectedGraph
+        :param graph: The graph to span, every edge of which must have a cost
+        """
+
+        self.__graph = graph
+
+    def get_minimum_spanning_tree(self):
+        """
+        Calculates a minimum spanning tree of the graph, or a minimum spanning forest when it is not connected.
+
+        :rtype: tuple[list[tuple[int, int]], int]
+        :returns: A tuple containing the edges of the tree and their total cost
+        """
+
+        graph = self.__graph
+        vertices = list(graph.vertices)
+        positions = {vertex: position for position, vertex in enumerate(vertices)}
+
+        # Gather every edge once, from the end with the smaller position, into parallel arrays
+        starts, ends, costs = array('q'), array('q'), []
+        for start, vertex in enumerate(vertices):
+            for neighbour, cost in graph.incident_edges(vertex):
+                end = positions[neighbour]
+                if end > start:
+                    starts.append(start)
+                    ends.append(end)
+                    costs.append(cost)
+
+        components = DisjointSet(len(vertices))
+        union = components.union
+        tree, total_cost = [], 0
+
+        for index in sorted(range(len(costs)), key=costs.__getitem__):
+            if union(starts[index], ends[index]):
+                tree.append((vertices[starts[index]], vertices[ends[index]]))
+                total_cost += costs[index]
+
+                # A single component left means the tree is complete
+                if components.sets_count == 1:
+                    break
+
+        return tree, total_cost
@@ -0,0 +1,62 @@
+from heapq import heappop, heappush
+from itertools import count
+
+
+class Prim:
+    """
+    Calculates minimum spanning trees of undirected graphs with the Prim algorithm: the tree grows from a vertex
+    by always taking the cheapest edge leaving it, found through a binary heap.
+    """
+
+    def __init__(self, graph):
+        """
+        :type graph: UndirectedGraph | CompactUndirectedGraph
+        :param graph: The graph to span, every edge of which must have a cost
+        """
+
+        self.__graph = graph
+
+    def get_minimum_spanning_tree(self):
+        """
+        Calculates a minimum spanning tree of the graph, or a minimum spanning forest when it is not connected,
+        by growing a tree from every vertex not yet spanned.
+
+        :rtype: tuple[list[tuple[int, int]], int]
+        :returns: A tuple containing the edges of the tree and their total cost
+        """
+
+        infinity = float('inf')
+        incident_edges = self.__graph.incident_edges
+
+        spanned = set()
+        tree, total_cost = [], 0
+
+        # Entries of equal cost are ordered by when they were pushed, so that vertex labels are never compared
+        order = count()
+
+        for root in self.__graph.vertices:
+            if root in spanned:
+                continue
+
+            # The cheapest known edge joining every vertex to the tree, pushed again on every improvement
+            # and skipped when popped once the vertex is spanned
+            best = {root: 0}
+            heap = [(0, next(order), root, None)]
+
+            while heap:
+                cost, _, vertex, parent = heappop(heap)
+
+                if vertex in spanned:
+                    continue
+
+                spanned.add(vertex)
+                if parent is not None:
+                    tree.append((parent, vertex))
+                    total_cost += cost
+
+                for neighbour, edge_cost in incident_edges(vertex):
+                    if neighbour not in spanned and edge_cost < best.get(neighbour, infinity):
+                        best[neighbour] = edge_cost
+                        heappush(heap, (edge_cost, next(order), neighbour, vertex))
+
+        return tree, total_cost
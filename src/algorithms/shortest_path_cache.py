@@ -0,0 +1,188 @@
+from array import array
+from collections import OrderedDict
+
+from src.algorithms.bellman_ford import BellmanFord
+from src.algorithms.dijkstra import Dijkstra
+
+
+class ShortestPathCache:
+    """
+    Keeps the shortest path trees of the most recently used source vertices, so that repeated queries from
+    the same source are answered without searching again. Every tree is held as a distance array and a previous
+    vertex array indexed by vertex position, which makes its size known up front; the least recently used trees
+    are dropped whenever the trees held go over the memory budget.
+
+    The cache remembers the version of the graph its trees were calculated on and drops all of them as soon as
+    the graph changes.
+    """
+
+    ALGORITHMS = ("dijkstra", "bellman_ford")
+
+    def __init__(self, graph, algorithm="dijkstra", memory_budget=64 << 20):
+        """
+        :type graph: DirectedGraph | CompactDirectedGraph
+        :param graph: The graph to answer the queries on
+
+        :type algorithm: str
+        :param algorithm: The algorithm calculating the trees, one of ALGORITHMS
+
+        :type memory_budget: int
+        :param memory_budget: The largest number of bytes the trees may take together
+
+        :raises ValueError: If the algorithm is not known
+        """
+
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f"Invalid algorithm: {algorithm}")
+
+        self.__graph = graph
+        self.__algorithm = algorithm
+        self.__memory_budget = memory_budget
+
+        self.__trees = OrderedDict()
+        self.__memory_used = 0
+        self.__version = None
+        self.__vertices = None
+        self.__positions = None
+
+        self.__hits = 0
+        self.__misses = 0
+
+    @property
+    def hits(self):
+        return self.__hits
+
+    @property
+    def misses(self):
+        return self.__misses
+
+    @property
+    def memory_used(self):
+        return self.__memory_used
+
+    def __len__(self):
+        return len(self.__trees)
+
+    def clear(self):
+        self.__trees.clear()
+        self.__memory_used = 0
+
+    def get_distance(self, source, destination):
+        """
+        Gets the cost of the minimum cost walk from a source vertex to a destination vertex.
+
+        :type source: int
+        :param source: The source vertex
+
+        :type destination: int
+        :param destination: The destination vertex
+
+        :rtype: int | float
+        :returns: The cost of the walk, or infinity if the destination vertex is unreachable
+
+        :raises ValueError: If a vertex is invalid or a negative cost cycle is reachable from the source vertex
+        """
+
+        dist, _ = self.__get_tree(source)
+        return self.__to_cost(dist[self.__position(destination)])
+
+    def get_minimum_cost_walk(self, source, destination):
+        """
+        Gets the minimum cost walk from a source vertex to a destination vertex.
+
+        :type source: int
+        :param source: The source vertex
+
+        :type destination: int
+        :param destination: The destination vertex
+
+        :rtype: tuple[list[int], int]
+        :returns: A tuple containing the minimum cost walk from the source vertex to the destination vertex
+        and the cost of the walk
+
+        :raises ValueError: If a vertex is invalid or a negative cost cycle is reachable from the source vertex
+        """
+
+        dist, prev = self.__get_tree(source)
+        position = self.__position(destination)
+
+        # If the destination vertex is unreachable, return None and infinity
+        if dist[position] == float('inf'):
+            return None, float('inf')
+
+        # Reconstruct the minimum cost walk
+        walk = [position]
+        while prev[walk[-1]] != -1:
+            walk.append(prev[walk[-1]])
+
+        return [self.__vertices[position] for position in reversed(walk)], self.__to_cost(dist[position])
+
+    def __position(self, vertex):
+        try:
+            return self.__positions[vertex]
+        except KeyError:
+            raise ValueError("Invalid vertex")
+
+    def __get_tree(self, source):
+        """
+        Gets the shortest path tree of a source vertex, from the cache if it holds one for the current version
+        of the graph and from a new search otherwise.
+
+        :type source: int
+        :param source: The source vertex
+
+        :rtype: tuple[array, array]
+        :returns: The distance to every vertex by position, with infinity for the unreachable ones,
+        and the position of the previous vertex on the minimum cost walk to every vertex, or -1 if there is none
+        """
+
+        # Drop every tree calculated on an earlier version of the graph
+        if self.__version != self.__graph.version:
+            self.clear()
+            self.__version = self.__graph.version
+            self.__vertices = list(self.__graph.vertices)
+            self.__positions = {vertex: position for position, vertex in enumerate(self.__vertices)}
+
+        tree = self.__trees.get(source)
+        if tree is not None:
+            self.__hits += 1
+            self.__trees.move_to_end(source)
+            return tree
+
+        self.__misses += 1
+        tree = self.__search(source)
+        size = sum(len(values) * values.itemsize for values in tree)
+
+        # Make room for the tree by dropping the least recently used ones, unless it does not fit at all
+        if size <= self.__memory_budget:
+            while self.__memory_used + size > self.__memory_budget:
+                _, (dist, prev) = self.__trees.popitem(last=False)
+                self.__memory_used -= len(dist) * dist.itemsize + len(prev) * prev.itemsize
+
+            self.__trees[source] = tree
+            self.__memory_used += size
+
+        return tree
+
+    def __search(self, source):
+        self.__position(source)
+
+        if self.__algorithm == "dijkstra":
+            dist, prev = Dijkstra(self.__graph).get_shortest_path_tree(source)
+        else:
+            dist, prev = BellmanFord(self.__graph).get_shortest_path_tree(source)
+
+        # Move the dictionaries over to arrays indexed by vertex position
+        positions = self.__positions
+        dist_array = array('d', [float('inf')]) * len(positions)
+        prev_array = array('q', [-1]) * len(positions)
+        for vertex, cost in dist.items():
+            dist_array[positions[vertex]] = cost
+        for vertex, previous in prev.items():
+            prev_array[positions[vertex]] = positions[previous]
+
+        return dist_array, prev_array
+
+    @staticmethod
+    def __to_cost(value):
+        return int(value) if value.is_integer() else value
@@ -0,0 +1,138 @@
+from itertools import islice
+
+from src.algorithms.bellman_ford import BellmanFord
+from src.algorithms.dijkstra import Dijkstra
+from src.algorithms.floyd_warshall import FloydWarshall
+
+
+class ShortestPathQueries:
+    """
+    Answers a stream of minimum cost walk queries against a graph loaded once.
+
+    Queries are taken in chunks. Within a chunk, all the queries sharing a source vertex are answered from a single
+    shortest path tree of that source with Dijkstra or Bellman-Ford, while Floyd-Warshall answers every query
+    from the matrices it calculates on the first one.
+    """
+
+    ALGORITHMS = ("dijkstra", "bellman_ford", "floyd_warshall")
+
+    def __init__(self, graph, algorithm="dijkstra", chunk_size=1024):
+        """
+        :type graph: DirectedGraph | CompactDirectedGraph
+        :param graph: The graph to answer the queries on
+
+        :type algorithm: str
+        :param algorithm: The algorithm answering the queries, one of ALGORITHMS
+
+        :type chunk_size: int
+        :param chunk_size: The number of queries taken at a time
+
+        :raises ValueError: If the algorithm is not known
+        """
+
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f"Invalid algorithm: {algorithm}")
+
+        self.__graph = graph
+        self.__algorithm = algorithm
+        self.__chunk_size = chunk_size
+        self.__floyd_warshall = FloydWarshall(graph) if algorithm == "floyd_warshall" else None
+
+    def get_minimum_cost_walks(self, queries):
+        """
+        Answers minimum cost walk queries in the order they come in.
+
+        :type queries: Iterable[tuple[int, int]]
+        :param queries: The (source, destination) pairs to find minimum cost walks for
+
+        :rtype: Iterator[dict]
+        :returns: An answer for every query, holding its source and destination and either the walk and its cost,
+        both None when the destination is unreachable, or the error the query ran into; a query that is not
+        a pair is answered with itself and an error instead
+        """
+
+        queries = iter(queries)
+
+        while chunk := list(islice(queries, self.__chunk_size)):
+            pairs = [self.__read_query(query) for query in chunk]
+
+            if self.__floyd_warshall is not None:
+                for query, pair in zip(chunk, pairs):
+                    yield self.__answer_from_matrix(*pair) if pair else {"query": query, "error": "Invalid query"}
+                continue
+
+            # Search once from every source in the chunk
+            trees = {}
+            for pair in pairs:
+                if pair and pair[0] not in trees:
+                    trees[pair[0]] = self.__get_shortest_path_tree(pair[0])
+
+            for query, pair in zip(chunk, pairs):
+                if pair is None:
+                    yield {"query": query, "error": "Invalid query"}
+                else:
+                    yield self.__answer_from_tree(trees[pair[0]], *pair)
+
+    @staticmethod
+    def __read_query(query):
+        """
+        Reads the source and destination vertices of a query.
+
+        :type query: tuple[int, int]
+        :param query: The query
+
+        :rtype: tuple[int, int] | None
+        :returns: The source and destination vertices, or None if the query is not a pair
+        """
+
+        try:
+            source, destination = query
+        except (TypeError, ValueError):
+            return None
+        return source, destination
+
+    def __get_shortest_path_tree(self, source):
+        """
+        Calculates the shortest path tree of a source vertex with the chosen algorithm.
+
+        :type source: int
+        :param source: The source vertex
+
+        :rtype: tuple[dict[int, int], dict[int, int]] | str
+        :returns: The distance and previous vertex dictionaries, or the error the search ran into
+        """
+
+        try:
+            if self.__algorithm == "dijkstra":
+                return Dijkstra(self.__graph).get_shortest_path_tree(source)
+            return BellmanFord(self.__graph).get_shortest_path_tree(source)
+        except ValueError as error:
+            return str(error)
+
+    def __answer_from_tree(self, tree, source, destination):
+        if isinstance(tree, str):
+            return {"source": source, "destination": destination, "error": tree}
+
+        try:
+            self.__graph.in_degree(destination)
+        except ValueError as error:
+            return {"source": source, "destination": destination, "error": str(error)}
+
+        dist, prev = tree
+        if destination not in dist:
+            return {"source": source, "destination": destination, "walk": None, "cost": None}
+
+        # Reconstruct the minimum cost walk
+        walk = [destination]
+        while walk[-1] != source:
+            walk.append(prev[walk[-1]])
+
+        return {"source": source, "destination": destination, "walk": walk[::-1], "cost": dist[destination]}
+
+    def __answer_from_matrix(self, source, destination):
+        try:
+            walk, cost = self.__floyd_warshall.get_minimum_cost_walk(source, destination)
+        except ValueError as error:
+            return {"source": source, "destination": destination, "error": str(error)}
+
+        return {"source": source, "destination": destination, "walk": walk, "cost": None if walk is None else cost}
@@ -1,3 +1,5 @@
+from array import array
+
 from src.graphs.directed_graph import DirectedGraph
 from src.services.directed_graph_service import DirectedGraphService
 
@@ -5,81 +7,180 @@ from src.services.directed_graph_service import DirectedGraphService
 class Tarjan:
     __graph: DirectedGraph
 
+    def __init__(self, graph=None):
+        """
+        :type graph: DirectedGraph | CompactDirectedGraph | None
+        :param graph: The graph to search, or None if it will be read from a file by run()
+        """
+
+        self.__graph = graph
+
     def run(self):
         """
         Reads a directed graph from a file and displays its strongly connected components.
         """
 
         self.__graph = DirectedGraphService.read_graph_from_file("database/scc_data.txt")
-        ans = self.__get_strongly_connected_components()
+        ans = self.get_strongly_connected_components()
 
         print("Strongly connected components:")
         for index, components in enumerate(ans):
             print(f"[{index}]: {components}")
 
-    def __generate_low_links_dfs(self, vertex, visited, low_link):
+    def __generate_low_links_dfs(self, root, vertices, positions, index, low_link, on_stack, component, counters):
         """
         Performs depth first search on the graph in order to calculate the low link values for each vertex.
-        The low link value of a vertex is the smallest vertex (in terms of id) that can be reached from the vertex
+        The low link value of a vertex is the smallest discovery index of a vertex still on the stack that can be
+        reached from the vertex. The search keeps its own stack of vertices and neighbour iterators, so its depth
+        is not bounded by the recursion limit.
+
+        :type root: int
+        :param root: The position of the vertex to start the depth first search from
+
+        :type vertices: list[int]
+        :param vertices: The vertices of the graph
 
-        :type vertex: int
-        :param vertex: The vertex to start the depth first search from
+        :type positions: dict[int, int]
+        :param positions: The position of every vertex in the list of vertices
 
-        :type visited: list[int]
-        :param visited: The list of vertices that have been visited
+        :type index: array
+        :param index: The discovery index of every vertex, or -1 for the vertices that have not been visited
 
-        :type low_link: dict[int, int]
-        :param low_link: A dictionary containing the low link values for each vertex
+        :type low_link: array
+        :param low_link: The low link value of every vertex
 
-        :rtype: None
+        :type on_stack: bytearray
+        :param on_stack: The flags keeping track of the vertices on the stack of visited vertices
+
+        :type component: array
+        :param component: The strongly connected component of every vertex, or -1 for the vertices
+        that have not been assigned one yet
+
+        :type counters: tuple[int, int]
+        :param counters: The number of vertices visited and of strongly connected components found so far
+
+        :rtype: tuple[int, int]
+        :returns: The number of vertices visited and of strongly connected components found after the search
         """
 
-        # Mark the vertex as visited and set its low link value to itself
-        visited.append(vertex)
-        low_link[vertex] = vertex
-
-        # Traverse the neighbours of the vertex
-        for neighbour in self.__graph.outbound_neighbours(vertex):
-            if neighbour not in visited:
-                # Recursively call the function on the neighbour and update the low link value of the vertex
-                self.__generate_low_links_dfs(neighbour, visited, low_link)
-                low_link[vertex] = min(low_link[vertex], low_link[neighbour])
-
-        # If the low link value of the vertex is equal to itself, it is the root of a strongly connected component
-        if low_link[vertex] == vertex:
-            current = visited.pop() if visited else 0
-            # Update the low link values of the vertices in the strongly connected component
-            while visited:
-                low_link[current] = vertex
-                current = visited.pop()
-
-    def __get_strongly_connected_components(self):
+        outbound_neighbours = self.__graph.outbound_neighbours
+        counter, component_count = counters
+        visited = []
+
+        # Mark the vertex as visited and set its low link value to its discovery index
+        index[root] = low_link[root] = counter
+        counter += 1
+        visited.append(root)
+        on_stack[root] = True
+        stack = [(root, outbound_neighbours(vertices[root]))]
+
+        while stack:
+            vertex, neighbours = stack[-1]
+
+            # Traverse the neighbours of the vertex until one that has not been visited is found
+            for neighbour in neighbours:
+                neighbour = positions[neighbour]
+                if index[neighbour] == -1:
+                    index[neighbour] = low_link[neighbour] = counter
+                    counter += 1
+                    visited.append(neighbour)
+                    on_stack[neighbour] = True
+                    stack.append((neighbour, outbound_neighbours(vertices[neighbour])))
+                    break
+                elif on_stack[neighbour]:
+                    low_link[vertex] = min(low_link[vertex], index[neighbour])
+            else:
+                # All the neighbours are done, so pass the low link value of the vertex on to its parent
+                stack.pop()
+                if stack:
+                    parent = stack[-1][0]
+                    low_link[parent] = min(low_link[parent], low_link[vertex])
+
+                # If the low link value of the vertex is its own index, it is the root of a strongly connected component
+                if low_link[vertex] == index[vertex]:
+                    current = -1
+                    while current != vertex:
+                        current = visited.pop()
+                        on_stack[current] = False
+                        component[current] = component_count
+                    component_count += 1
+
+        return counter, component_count
+
+    def get_strongly_connected_components(self):
         """
         Gets the strongly connected components of a graph using Tarjan's algorithm.
 
-        :rtype: dict[int, list[int]]
-        :returns: A dictionary where the keys represent the id of the strongly connected component
-        and the value is a list consisting of the vertices in that respective component
+        :rtype: list[list[int]]
+        :returns: A list of lists where each list represents a strongly connected component
+        and contains the vertices in that component
         """
 
+        vertices, _, component, _ = self.__get_vertex_components()
         components = list()
-        visited = list()
-        low_link = dict()
         component_order = dict()
-        component_count = -1
 
-        # Generate the low link values for each vertex in the graph
-        for vertex in self.__graph.vertices:
-            if vertex not in visited:
-                self.__generate_low_links_dfs(vertex, visited, low_link)
-
-        # Create a dictionary containing the vertices of each strongly connected component based on the low link values
-        for vertex in self.__graph.vertices:
-            if low_link[vertex] not in component_order:
-                component_count += 1
-                component_order[low_link[vertex]] = component_count
+        # Group the vertices of each strongly connected component, in the order in which the components first appear
+        for position, vertex in enumerate(vertices):
+            if component[position] not in component_order:
+                component_order[component[position]] = len(components)
                 components.append([vertex])
             else:
-                components[component_order[low_link[vertex]]].append(vertex)
+                components[component_order[component[position]]].append(vertex)
 
         return components
+
+    def get_condensation(self):
+        """
+        Gets the condensation of a graph, the directed acyclic graph with a vertex for every strongly connected
+        component and an edge between two components whenever an edge of the graph joins them, costing as much
+        as the cheapest such edge.
+
+        :rtype: tuple[DirectedGraph, array, list[int]]
+        :returns: A tuple containing the condensation, the component of every vertex by its position
+        in the vertices of the graph and the components in topological order
+        """
+
+        vertices, positions, component, component_count = self.__get_vertex_components()
+        condensation = DirectedGraph(component_count)
+
+        # Join the components of the ends of every edge, keeping the cheapest edge between two components
+        for position, vertex in enumerate(vertices):
+            for neighbour, cost in self.__graph.outbound_edges(vertex):
+                edge = component[position], component[positions[neighbour]]
+                if edge[0] == edge[1]:
+                    continue
+                if not condensation.are_connected(*edge):
+                    condensation.add_edge(edge, cost)
+                elif cost < condensation.get_cost(edge):
+                    condensation.set_cost(edge, cost)
+
+        # Components are completed sinks first, so the reverse of their numbering is a topological order
+        return condensation, component, list(range(component_count - 1, -1, -1))
+
+    def __get_vertex_components(self):
+        """
+        Assigns every vertex its strongly connected component. Components are numbered in the order in which
+        the search completes them, which is a reverse topological order of the condensation.
+
+        :rtype: tuple[list[int], dict[int, int], array, int]
+        :returns: A tuple containing the vertices of the graph, the position of every vertex,
+        the component of every vertex by its position and the number of components
+        """
+
+        vertices = list(self.__graph.vertices)
+        positions = {vertex: position for position, vertex in enumerate(vertices)}
+
+        index = array('q', [-1]) * len(vertices)
+        low_link = array('q', [-1]) * len(vertices)
+        component = array('q', [-1]) * len(vertices)
+        on_stack = bytearray(len(vertices))
+        counters = 0, 0
+
+        # Generate the low link values for each vertex in the graph
+        for vertex in range(len(vertices)):
+            if index[vertex] == -1:
+                counters = self.__generate_low_links_dfs(vertex, vertices, positions, index, low_link, on_stack,
+                                                         component, counters)
+
+        return vertices, positions, component, counters[1]
@@ -0,0 +1,204 @@
+from array import array
+from bisect import bisect_left
+
+from src.graphs.vertex_index import VertexIndex
+
+
+class CompactDirectedGraph:
+    """
+    A frozen directed graph stored in compressed sparse row (CSR) form for the outbound edges and compressed
+    sparse column (CSC) form for the inbound edges. Each form is made of an offset array, a target array and
+    a cost array, so the whole graph takes a handful of machine words per edge instead of one Python object each.
+
+    Within a vertex, neighbours are kept in ascending order of their position, which allows edge lookups
+    through binary search.
+    """
+
+    def __init__(self, graph):
+        """
+        Builds the compact form of a graph exposing the same read API as DirectedGraph.
+
+        :type graph: DirectedGraph
+        :param graph: The graph to compact
+        """
+
+        # Vertices are stored by their dense id in the index, which is their position in every array
+        self.__index = VertexIndex(graph.vertices)
+        vertices_count = len(self.__index)
+
+        target_type = "i" if vertices_count < 2 ** 31 else "q"
+
+        # Build the outbound offsets from the out degrees
+        self.__outbound_offsets = array("q", [0])
+        for vertex in self.__index:
+            self.__outbound_offsets.append(self.__outbound_offsets[-1] + graph.out_degree(vertex))
+
+        # Fill the outbound targets and costs, sorting every row by target position
+        self.__outbound_targets = array(target_type)
+        self.__outbound_costs = array("q")
+        for vertex in self.__index:
+            row = sorted((self.__index.get_id(neighbour), graph.get_cost((vertex, neighbour)))
+                         for neighbour in graph.outbound_neighbours(vertex))
+            for target, cost in row:
+                self.__outbound_targets.append(target)
+                self.__outbound_costs = self.__append_cost(self.__outbound_costs, cost)
+
+        # Count the in degrees in order to build the inbound offsets
+        in_degrees = array("q", bytes(8 * vertices_count))
+        for target in self.__outbound_targets:
+            in_degrees[target] += 1
+
+        self.__inbound_offsets = array("q", [0])
+        for degree in in_degrees:
+            self.__inbound_offsets.append(self.__inbound_offsets[-1] + degree)
+
+        # Scatter the edges into their inbound rows; sources are visited in ascending order, so rows stay sorted
+        edges_count = len(self.__outbound_targets)
+        self.__inbound_targets = array(target_type, bytes(self.__outbound_targets.itemsize * edges_count))
+        self.__inbound_costs = array(self.__outbound_costs.typecode,
+                                     bytes(self.__outbound_costs.itemsize * edges_count))
+        slots = self.__inbound_offsets[:-1]
+        for source in range(vertices_count):
+            for index in range(self.__outbound_offsets[source], self.__outbound_offsets[source + 1]):
+                target = self.__outbound_targets[index]
+                self.__inbound_targets[slots[target]] = source
+                self.__inbound_costs[slots[target]] = self.__outbound_costs[index]
+                slots[target] += 1
+
+    @classmethod
+    def from_arrays(cls, vertices, outbound, inbound):
+        """
+        Wraps already built arrays without copying them, so that they may live in a memory mapped file.
+
+        :type vertices: array | memoryview | list | None
+        :param vertices: The vertex labels by position, or None when every vertex is its own position
+
+        :type outbound: tuple[Sequence[int], Sequence[int], Sequence[int | float]]
+        :param outbound: The outbound offsets, targets and costs
+
+        :type inbound: tuple[Sequence[int], Sequence[int], Sequence[int | float]]
+        :param inbound: The inbound offsets, targets and costs
+
+        :rtype: CompactDirectedGraph
+        :returns: The graph backed by the given arrays
+        """
+
+        graph = cls.__new__(cls)
+
+        graph.__index = VertexIndex.wrap(vertices, len(outbound[0]) - 1)
+        graph.__outbound_offsets, graph.__outbound_targets, graph.__outbound_costs = outbound
+        graph.__inbound_offsets, graph.__inbound_targets, graph.__inbound_costs = inbound
+        return graph
+
+    def to_arrays(self):
+        """
+        Gets the arrays the graph is made of, in the form accepted by from_arrays.
+
+        :rtype: tuple[array | memoryview | list | None, tuple, tuple]
+        :returns: A tuple containing the vertex labels, or None when every vertex is its own position,
+        the outbound offsets, targets and costs and the inbound offsets, targets and costs
+        """
+
+        return (self.__index.labels,
+                (self.__outbound_offsets, self.__outbound_targets, self.__outbound_costs),
+                (self.__inbound_offsets, self.__inbound_targets, self.__inbound_costs))
+
+    @staticmethod
+    def __append_cost(costs, cost):
+        """
+        Appends a cost to a cost array, widening the array to floating point the first time a cost is not an integer.
+
+        :type costs: array
+        :param costs: The cost array
+
+        :type cost: int | float
+        :param cost: The cost to append
+
+        :rtype: array
+        :returns: The array the cost was appended to
+        """
+
+        try:
+            costs.append(cost)
+        except (TypeError, OverflowError):
+            costs = array("d", costs)
+            costs.append(cost)
+        return costs
+
+    def __edge_index(self, edge):
+        start, end = edge
+
+        try:
+            start, end = self.__index.get_id(start), self.__index.get_id(end)
+        except ValueError:
+            return None
+
+        low, high = self.__outbound_offsets[start], self.__outbound_offsets[start + 1]
+        index = bisect_left(self.__outbound_targets, end, low, high)
+        if index < high and self.__outbound_targets[index] == end:
+            return index
+        return None
+
+    @property
+    def vertices_count(self):
+        return len(self.__index)
+
+    @property
+    def edges_count(self):
+        return len(self.__outbound_targets)
+
+    @property
+    def version(self):
+        # The graph never changes
+        return 0
+
+    @property
+    def vertices(self):
+        return iter(self.__index)
+
+    @property
+    def edges(self):
+        for start in range(len(self.__index)):
+            low, high = self.__outbound_offsets[start], self.__outbound_offsets[start + 1]
+            for end in self.__index.get_labels(self.__outbound_targets[low:high]):
+                yield self.__index.get_label(start), end
+
+    def are_connected(self, start, end):
+        return self.__edge_index((start, end)) is not None
+
+    def in_degree(self, vertex):
+        position = self.__index.get_id(vertex)
+        return self.__inbound_offsets[position + 1] - self.__inbound_offsets[position]
+
+    def out_degree(self, vertex):
+        position = self.__index.get_id(vertex)
+        return self.__outbound_offsets[position + 1] - self.__outbound_offsets[position]
+
+    def inbound_neighbours(self, vertex):
+        position = self.__index.get_id(vertex)
+        low, high = self.__inbound_offsets[position], self.__inbound_offsets[position + 1]
+        return self.__index.get_labels(self.__inbound_targets[low:high])
+
+    def outbound_neighbours(self, vertex):
+        position = self.__index.get_id(vertex)
+        low, high = self.__outbound_offsets[position], self.__outbound_offsets[position + 1]
+        return self.__index.get_labels(self.__outbound_targets[low:high])
+
+    def inbound_edges(self, vertex):
+        position = self.__index.get_id(vertex)
+        low, high = self.__inbound_offsets[position], self.__inbound_offsets[position + 1]
+        return zip(self.__index.get_labels(self.__inbound_targets[low:high]), self.__inbound_costs[low:high])
+
+    def outbound_edges(self, vertex):
+        position = self.__index.get_id(vertex)
+        low, high = self.__outbound_offsets[position], self.__outbound_offsets[position + 1]
+        return zip(self.__index.get_labels(self.__outbound_targets[low:high]), self.__outbound_costs[low:high])
+
+    def get_cost(self, edge):
+        index = self.__edge_index(edge)
+        if index is None:
+            raise ValueError("Invalid edge")
+        return self.__outbound_costs[index]
+
+    def copy(self):
+        return self
@@ -0,0 +1,169 @@
+from array import array
+from bisect import bisect_left
+from itertools import repeat
+
+from src.graphs.vertex_index import VertexIndex
+
+
+class CompactUndirectedGraph:
+    """
+    A frozen undirected graph stored in compressed sparse row (CSR) form. Every edge shows up in the rows of both
+    of its ends, except for loops which show up once, so the whole graph takes a couple of machine words per edge.
+
+    Within a vertex, neighbours are kept in ascending order of their position, which allows edge lookups
+    through binary search. When every edge has a cost, the costs are kept in an array parallel to the targets,
+    as integers or as floating point numbers once a cost is not an integer.
+    """
+
+    def __init__(self, graph):
+        """
+        Builds the compact form of a graph exposing the same read API as UndirectedGraph.
+
+        :type graph: UndirectedGraph
+        :param graph: The graph to compact
+        """
+
+        # Vertices are stored by their dense id in the index, which is their position in every array
+        self.__index = VertexIndex(graph.vertices)
+        self.__edges_count = graph.edges_count
+
+        # Build the offsets from the degrees and fill the targets and costs, sorting every row by target position
+        self.__offsets = array("q", [0])
+        self.__targets = array("i" if len(self.__index) < 2 ** 31 else "q")
+        self.__costs = array("q")
+        for vertex in self.__index:
+            row = sorted((self.__index.get_id(neighbour), cost) for neighbour, cost in graph.incident_edges(vertex))
+            self.__targets.extend(position for position, _ in row)
+            self.__offsets.append(len(self.__targets))
+            if self.__costs is not None:
+                self.__costs = self.__extend_costs(self.__costs, [cost for _, cost in row])
+
+    @classmethod
+    def from_arrays(cls, vertices, offsets, targets, edges_count, costs=None):
+        """
+        Wraps already built arrays without copying them, so that they may live in a memory mapped file.
+
+        :type vertices: array | memoryview | list | None
+        :param vertices: The vertex labels by position, or None when every vertex is its own position
+
+        :type offsets: Sequence[int]
+        :param offsets: The offset of the row of every vertex in the targets, followed by the number of targets
+
+        :type targets: Sequence[int]
+        :param targets: The positions of the neighbours of every vertex
+
+        :type edges_count: int
+        :param edges_count: The number of edges
+
+        :type costs: Sequence[int | float] | None
+        :param costs: The cost of the edge to every target, or None when the edges have no costs
+
+        :rtype: CompactUndirectedGraph
+        :returns: The graph backed by the given arrays
+        """
+
+        graph = cls.__new__(cls)
+
+        graph.__index = VertexIndex.wrap(vertices, len(offsets) - 1)
+        graph.__offsets, graph.__targets, graph.__edges_count = offsets, targets, edges_count
+        graph.__costs = costs
+        return graph
+
+    def to_arrays(self):
+        """
+        Gets the arrays the graph is made of, in the form accepted by from_arrays.
+
+        :rtype: tuple[array | memoryview | list | None, Sequence[int], Sequence[int], int,
+        Sequence[int | float] | None]
+        :returns: A tuple containing the vertex labels, or None when every vertex is its own position,
+        the offsets, the targets, the number of edges and the costs, or None when the edges have no costs
+        """
+
+        return self.__index.labels, self.__offsets, self.__targets, self.__edges_count, self.__costs
+
+    @staticmethod
+    def __extend_costs(costs, row_costs):
+        """
+        Extends a cost array with the costs of a row, widening the array to floating point the first time a cost
+        is not an integer.
+
+        :type costs: array
+        :param costs: The cost array
+
+        :type row_costs: list[int | float | None]
+        :param row_costs: The costs to append
+
+        :rtype: array | None
+        :returns: The array the costs were appended to, or None if an edge has no cost
+        """
+
+        if None in row_costs:
+            return None
+
+        try:
+            costs.extend(row_costs)
+        except (TypeError, OverflowError):
+            costs = array("d", costs)
+            costs.extend(row_costs)
+        return costs
+
+    def __edge_index(self, edge):
+        start, end = edge
+
+        try:
+            start, end = self.__index.get_id(start), self.__index.get_id(end)
+        except ValueError:
+            return None
+
+        low, high = self.__offsets[start], self.__offsets[start + 1]
+        index = bisect_left(self.__targets, end, low, high)
+        if index < high and self.__targets[index] == end:
+            return index
+        return None
+
+    @property
+    def vertices_count(self):
+        return len(self.__index)
+
+    @property
+    def edges_count(self):
+        return self.__edges_count
+
+    @property
+    def vertices(self):
+        return iter(self.__index)
+
+    @property
+    def edges(self):
+        # Every edge is reported once, from the end with the smaller position
+        for start in range(len(self.__index)):
+            low, high = self.__offsets[start], self.__offsets[start + 1]
+            low = bisect_left(self.__targets, start, low, high)
+            for end in self.__index.get_labels(self.__targets[low:high]):
+                yield self.__index.get_label(start), end
+
+    def are_connected(self, start, end):
+        return self.__edge_index((start, end)) is not None
+
+    def degree(self, vertex):
+        position = self.__index.get_id(vertex)
+        return self.__offsets[position + 1] - self.__offsets[position]
+
+    def neighbours(self, vertex):
+        position = self.__index.get_id(vertex)
+        return self.__index.get_labels(self.__targets[self.__offsets[position]:self.__offsets[position + 1]])
+
+    def incident_edges(self, vertex):
+        position = self.__index.get_id(vertex)
+        low, high = self.__offsets[position], self.__offsets[position + 1]
+        costs = repeat(None) if self.__costs is None else self.__costs[low:high]
+        return zip(self.__index.get_labels(self.__targets[low:high]), costs)
+
+    def get_cost(self, edge):
+        index = self.__edge_index(edge)
+        if index is None:
+            raise ValueError("Invalid edge")
+        return None if self.__costs is None else self.__costs[index]
+
+    def copy(self):
+        return self
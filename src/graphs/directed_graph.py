@@ -1,30 +1,79 @@
-from copy import deepcopy
-
-
 class DirectedGraph:
     def __init__(self, vertices_count):
-        self.__vertices = [_ for _ in range(vertices_count)]
-        self.__edges = []
+        self.__edges_count = 0
+
+        # Bumped by every change to the graph, so that anything derived from it can tell when it went stale
+        self.__version = 0
+
+        # Neighbours are kept in insertion ordered dictionaries that map each neighbour to the cost of the edge,
+        # so that looking up, adding and removing an edge are all constant time operations
+        self.__inbound_neighbours = {vertex: {} for vertex in range(vertices_count)}
+        self.__outbound_neighbours = {vertex: {} for vertex in range(vertices_count)}
+
+        # Copies share their dictionaries with the graph they were taken from until they change them: the first
+        # change only copies the maps from the vertices to their dictionaries, and the dictionaries of a vertex are
+        # copied the first time that vertex changes. The vertices whose neighbour dictionaries were already copied
+        # are kept in these sets, which are None while the graph shares nothing
+        self.__owns_vertices = True
+        self.__copied_inbound = None
+        self.__copied_outbound = None
+
+    @classmethod
+    def from_edges(cls, vertices_count, edges):
+        """
+        Builds a graph from its edges in one step. Instead of checking every edge as it goes in, the edges are
+        checked all at once: an edge with an invalid vertex fails the lookup of its neighbour dictionary, and
+        a repeated edge leaves the dictionaries holding fewer edges than were given.
 
-        self.__inbound_neighbours = {vertex: [] for vertex in self.__vertices}
-        self.__outbound_neighbours = {vertex: [] for vertex in self.__vertices}
-        self.__cost = {}
+        :type vertices_count: int
+        :param vertices_count: The number of vertices, labelled 0..n-1
+
+        :type edges: Iterable[tuple[tuple[int, int], int]]
+        :param edges: The edges together with their costs
+
+        :rtype: DirectedGraph
+        :returns: The graph
+
+        :raises ValueError: If an edge has an invalid vertex or is given more than once
+        """
+
+        graph = cls(vertices_count)
+        outbound_neighbours, inbound_neighbours = graph.__outbound_neighbours, graph.__inbound_neighbours
+
+        edges_count = 0
+        try:
+            for (start, end), cost in edges:
+                outbound_neighbours[start][end] = cost
+                inbound_neighbours[end][start] = cost
+                edges_count += 1
+        except (KeyError, TypeError):
+            raise ValueError("Invalid vertex")
+
+        if sum(map(len, outbound_neighbours.values())) != edges_count:
+            raise ValueError("Invalid edge")
+
+        graph.__edges_count = edges_count
+        return graph
 
     @property
     def vertices_count(self):
-        return len(self.__vertices)
+        return len(self.__outbound_neighbours)
 
     @property
     def edges_count(self):
-        return len(self.__edges)
+        return self.__edges_count
+
+    @property
+    def version(self):
+        return self.__version
 
     @property
     def vertices(self):
-        return iter(self.__vertices)
+        return iter(self.__outbound_neighbours)
 
     @property
     def edges(self):
-        return iter(self.__edges)
+        return ((start, end) for start, neighbours in self.__outbound_neighbours.items() for end in neighbours)
 
     def add_edge(self, edge, cost):
         start, end = edge
@@ -32,14 +81,39 @@ class DirectedGraph:
         if self.are_connected(start, end):
             raise ValueError("Invalid edge")
 
-        self.__edges.append(edge)
-        self.__cost[edge] = cost
+        if start not in self.__outbound_neighbours or end not in self.__outbound_neighbours:
+            raise ValueError("Invalid vertex")
+
+        self.__outbound(start)[end] = cost
+        self.__inbound(end)[start] = cost
+        self.__edges_count += 1
+        self.__version += 1
+
+    def add_edges(self, edges):
+        # A graph sharing its dictionaries copies them one edge at a time
+        if self.__copied_outbound is not None:
+            for edge, cost in edges:
+                self.add_edge(edge, cost)
+            return
+
+        outbound_neighbours, inbound_neighbours = self.__outbound_neighbours, self.__inbound_neighbours
+        edges_count = self.__edges_count
 
         try:
-            self.__outbound_neighbours[start].append(end)
-            self.__inbound_neighbours[end].append(start)
-        except KeyError:
-            raise ValueError("Invalid vertex")
+            for (start, end), cost in edges:
+                if self.are_connected(start, end):
+                    raise ValueError("Invalid edge")
+
+                if start not in outbound_neighbours or end not in outbound_neighbours:
+                    raise ValueError("Invalid vertex")
+
+                outbound_neighbours[start][end] = cost
+                inbound_neighbours[end][start] = cost
+                self.__edges_count += 1
+        finally:
+            # The graph only changed if an edge went in, even when a later one was rejected
+            if self.__edges_count != edges_count:
+                self.__version += 1
 
     def remove_edge(self, edge):
         start, end = edge
@@ -47,83 +121,134 @@ class DirectedGraph:
         if not self.are_connected(start, end):
             raise ValueError("Invalid edge")
 
-        self.__edges.remove(edge)
-        self.__cost.pop(edge)
+        del self.__outbound(start)[end]
+        del self.__inbound(end)[start]
+        self.__edges_count -= 1
+        self.__version += 1
 
-        self.__outbound_neighbours[start].remove(end)
-        self.__inbound_neighbours[end].remove(start)
+    def remove_edges(self, edges):
+        for edge in edges:
+            self.remove_edge(edge)
 
     def add_vertex(self, vertex):
-        if vertex in self.__vertices:
+        if vertex in self.__outbound_neighbours:
             raise ValueError("Invalid vertex")
 
-        self.__vertices.append(vertex)
-        self.__inbound_neighbours[vertex] = []
-        self.__outbound_neighbours[vertex] = []
+        self.__own_vertices()
+        self.__inbound_neighbours[vertex] = {}
+        self.__outbound_neighbours[vertex] = {}
+        if self.__copied_outbound is not None:
+            self.__copied_inbound.add(vertex)
+            self.__copied_outbound.add(vertex)
+        self.__version += 1
 
     def remove_vertex(self, vertex):
-        try:
-            self.__vertices[vertex]
-        except IndexError:
+        if vertex not in self.__outbound_neighbours:
             raise ValueError("Invalid vertex")
 
-        self.__vertices.remove(vertex)
+        if self.are_connected(vertex, vertex):
+            self.remove_edge((vertex, vertex))
+
+        self.__own_vertices()
 
-        for inbound_neighbour in self.__inbound_neighbours[vertex]:
-            edge = inbound_neighbour, vertex
-            self.__outbound_neighbours[inbound_neighbour].remove(vertex)
-            self.__edges.remove(edge)
-            self.__cost.pop(edge)
+        for inbound_neighbour in self.__inbound_neighbours.pop(vertex):
+            del self.__outbound(inbound_neighbour)[vertex]
+            self.__edges_count -= 1
 
-        for outbound_neighbour in self.__outbound_neighbours[vertex]:
-            edge = vertex, outbound_neighbour
-            self.__inbound_neighbours[outbound_neighbour].remove(vertex)
-            self.__edges.remove(edge)
-            self.__cost.pop(edge)
+        for outbound_neighbour in self.__outbound_neighbours.pop(vertex):
+            del self.__inbound(outbound_neighbour)[vertex]
+            self.__edges_count -= 1
 
-        self.__inbound_neighbours.pop(vertex)
-        self.__outbound_neighbours.pop(vertex)
+        if self.__copied_outbound is not None:
+            self.__copied_inbound.discard(vertex)
+            self.__copied_outbound.discard(vertex)
+
+        self.__version += 1
 
     def are_connected(self, start, end):
-        return self.__cost.get((start, end)) is not None
+        neighbours = self.__outbound_neighbours.get(start)
+        return neighbours is not None and end in neighbours
 
     def in_degree(self, vertex):
-        try:
-            self.__vertices[vertex]
-        except IndexError:
+        if vertex not in self.__inbound_neighbours:
             raise ValueError("Invalid vertex")
         return len(self.__inbound_neighbours[vertex])
 
     def out_degree(self, vertex):
-        try:
-            self.__vertices[vertex]
-        except IndexError:
+        if vertex not in self.__outbound_neighbours:
             raise ValueError("Invalid vertex")
         return len(self.__outbound_neighbours[vertex])
 
     def inbound_neighbours(self, vertex):
-        try:
-            self.__vertices[vertex]
-        except IndexError:
+        if vertex not in self.__inbound_neighbours:
             raise ValueError("Invalid vertex")
         return iter(self.__inbound_neighbours[vertex])
 
     def outbound_neighbours(self, vertex):
-        try:
-            self.__vertices[vertex]
-        except IndexError:
+        if vertex not in self.__outbound_neighbours:
             raise ValueError("Invalid vertex")
         return iter(self.__outbound_neighbours[vertex])
 
+    def inbound_edges(self, vertex):
+        if vertex not in self.__inbound_neighbours:
+            raise ValueError("Invalid vertex")
+        return iter(self.__inbound_neighbours[vertex].items())
+
+    def outbound_edges(self, vertex):
+        if vertex not in self.__outbound_neighbours:
+            raise ValueError("Invalid vertex")
+        return iter(self.__outbound_neighbours[vertex].items())
+
     def get_cost(self, edge):
-        if self.__cost.get(edge) is None:
+        start, end = edge
+
+        if not self.are_connected(start, end):
             raise ValueError("Invalid edge")
-        return self.__cost[edge]
+        return self.__outbound_neighbours[start][end]
 
     def set_cost(self, edge, value):
-        if self.__cost.get(edge) is None:
+        start, end = edge
+
+        if not self.are_connected(start, end):
             raise ValueError("Invalid edge")
-        self.__cost[edge] = value
+        self.__outbound(start)[end] = value
+        self.__inbound(end)[start] = value
+        self.__version += 1
 
     def copy(self):
-        return deepcopy(self)
+        # Both graphs share every dictionary from now on, and copy the ones they change first
+        self.__owns_vertices = False
+        self.__copied_inbound = set()
+        self.__copied_outbound = set()
+
+        graph = DirectedGraph.__new__(DirectedGraph)
+        graph.__edges_count = self.__edges_count
+        graph.__version = self.__version
+        graph.__inbound_neighbours = self.__inbound_neighbours
+        graph.__outbound_neighbours = self.__outbound_neighbours
+        graph.__owns_vertices = False
+        graph.__copied_inbound = set()
+        graph.__copied_outbound = set()
+        return graph
+
+    def __own_vertices(self):
+        if not self.__owns_vertices:
+            self.__inbound_neighbours = dict(self.__inbound_neighbours)
+            self.__outbound_neighbours = dict(self.__outbound_neighbours)
+            self.__owns_vertices = True
+
+    def __inbound(self, vertex):
+        # The inbound neighbours of a vertex, copied first if they may be shared with another graph
+        if self.__copied_inbound is not None and vertex not in self.__copied_inbound:
+            self.__own_vertices()
+            self.__inbound_neighbours[vertex] = dict(self.__inbound_neighbours[vertex])
+            self.__copied_inbound.add(vertex)
+        return self.__inbound_neighbours[vertex]
+
+    def __outbound(self, vertex):
+        # The outbound neighbours of a vertex, copied first if they may be shared with another graph
+        if self.__copied_outbound is not None and vertex not in self.__copied_outbound:
+            self.__own_vertices()
+            self.__outbound_neighbours[vertex] = dict(self.__outbound_neighbours[vertex])
+            self.__copied_outbound.add(vertex)
+        return self.__outbound_neighbours[vertex]
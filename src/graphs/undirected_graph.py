@@ -1,38 +1,128 @@
-from copy import deepcopy
+from itertools import repeat
 
 
 class UndirectedGraph:
     def __init__(self, vertices_count):
-        self.__vertices = [_ for _ in range(vertices_count)]
-        self.__edges = []
+        self.__edges_count = 0
 
-        self.__neighbours = {vertex: [] for vertex in self.__vertices}
+        # Neighbours are kept in insertion ordered dictionaries that map each neighbour to the cost of the edge,
+        # or None when it has no cost, so that looking up, adding and removing an edge are all constant time
+        # operations and costs take no room beyond the slots the dictionaries have anyway
+        self.__neighbours = {vertex: {} for vertex in range(vertices_count)}
+
+        # Every edge is also kept in the same way under the vertex it starts from alone, which keeps the direction
+        # it was added in
+        self.__edge_ends = {vertex: {} for vertex in range(vertices_count)}
+
+        # Copies share their dictionaries with the graph they were taken from until they change them: the first
+        # change only copies the maps from the vertices to their dictionaries, and the dictionaries of a vertex are
+        # copied the first time that vertex changes. The vertices whose dictionaries were already copied are kept
+        # in a set, which is None while the graph shares nothing
+        self.__owns_vertices = True
+        self.__copied = None
+
+    @classmethod
+    def from_edges(cls, vertices_count, edges, costs=None):
+        """
+        Builds a graph from its edges in one step. Instead of checking every edge as it goes in, the edges are
+        checked all at once: an edge with an invalid vertex fails the lookup of its neighbour dictionary, and
+        a repeated edge, in either direction, leaves the dictionaries holding fewer edges than were given.
+        The edges and the costs are paired by a strict zip, which fails once one of them runs out before the other.
+
+        :type vertices_count: int
+        :param vertices_count: The number of vertices, labelled 0..n-1
+
+        :type edges: Iterable[tuple[int, int]]
+        :param edges: The edges
+
+        :type costs: Iterable[int] | None
+        :param costs: The cost of every edge, or None when the edges have no costs
+
+        :rtype: UndirectedGraph
+        :returns: The graph
+
+        :raises ValueError: If an edge has an invalid vertex or is given more than once, or if the number of costs
+        differs from the number of edges
+        """
+
+        graph = cls(vertices_count)
+        edge_ends, neighbours = graph.__edge_ends, graph.__neighbours
+
+        edges_count = 0
+        try:
+            for edge, cost in zip(edges, repeat(None) if costs is None else costs, strict=costs is not None):
+                start, end = edge
+                neighbours[start][end] = cost
+                neighbours[end][start] = cost
+                edge_ends[start][end] = cost
+                edges_count += 1
+        except (KeyError, TypeError):
+            raise ValueError("Invalid vertex")
+        except ValueError:
+            raise ValueError("Invalid edge")
+
+        # Every edge shows up in the neighbours of both of its ends, except for loops which show up once
+        loops_count = sum(1 for vertex, vertex_neighbours in neighbours.items() if vertex in vertex_neighbours)
+        if sum(map(len, edge_ends.values())) != edges_count or \
+                sum(map(len, neighbours.values())) != 2 * edges_count - loops_count:
+            raise ValueError("Invalid edge")
+
+        graph.__edges_count = edges_count
+        return graph
 
     @property
     def vertices_count(self):
-        return len(self.__vertices)
+        return len(self.__neighbours)
 
     @property
     def edges_count(self):
-        return len(self.__edges)
+        return self.__edges_count
 
     @property
     def vertices(self):
-        return iter(self.__vertices)
+        return iter(self.__neighbours)
 
     @property
     def edges(self):
-        return iter(self.__edges)
+        return ((start, end) for start, ends in self.__edge_ends.items() for end in ends)
 
-    def add_edge(self, edge):
+    def add_edge(self, edge, cost=None):
         start, end = edge
 
         if self.are_connected(start, end):
             raise ValueError("Invalid edge")
 
-        self.__edges.append(edge)
-        self.__neighbours[start].append(end)
-        self.__neighbours[end].append(start)
+        if start not in self.__neighbours or end not in self.__neighbours:
+            raise ValueError("Invalid vertex")
+
+        # Owning the neighbours of the start also owns the ends of its edges
+        self.__own(start)[end] = cost
+        self.__own(end)[start] = cost
+        self.__edge_ends[start][end] = cost
+        self.__edges_count += 1
+
+    def add_edges(self, edges, costs=None):
+        # A graph sharing its dictionaries copies them one edge at a time
+        if self.__copied is not None:
+            for edge, cost in self.__pair_costs(edges, costs):
+                self.add_edge(edge, cost)
+            return
+
+        edge_ends, neighbours = self.__edge_ends, self.__neighbours
+
+        for edge, cost in self.__pair_costs(edges, costs):
+            start, end = edge
+
+            if self.are_connected(start, end):
+                raise ValueError("Invalid edge")
+
+            if start not in neighbours or end not in neighbours:
+                raise ValueError("Invalid vertex")
+
+            neighbours[start][end] = cost
+            neighbours[end][start] = cost
+            edge_ends[start][end] = cost
+            self.__edges_count += 1
 
     def remove_edge(self, edge):
         start, end = edge
@@ -40,47 +130,118 @@ class UndirectedGraph:
         if not self.are_connected(start, end):
             raise ValueError("Invalid edge")
 
-        self.__edges.remove(edge)
-        self.__neighbours[start].remove(end)
-        self.__neighbours[end].remove(start)
+        # The edge is kept under the vertex it was added from
+        if end not in self.__edge_ends[start]:
+            start, end = end, start
+
+        del self.__own(start)[end]
+        self.__own(end).pop(start, None)
+        del self.__edge_ends[start][end]
+        self.__edges_count -= 1
+
+    def remove_edges(self, edges):
+        for edge in edges:
+            self.remove_edge(edge)
 
     def add_vertex(self, vertex):
-        if vertex in self.__vertices:
+        if vertex in self.__neighbours:
             raise ValueError("Invalid vertex")
 
-        self.__vertices.append(vertex)
-        self.__neighbours[vertex] = []
+        self.__own_vertices()
+        self.__neighbours[vertex] = {}
+        self.__edge_ends[vertex] = {}
+        if self.__copied is not None:
+            self.__copied.add(vertex)
 
     def remove_vertex(self, vertex):
-        try:
-            self.__vertices[vertex]
-        except IndexError:
+        if vertex not in self.__neighbours:
             raise ValueError("Invalid vertex")
 
-        self.__vertices.remove(vertex)
+        self.__own_vertices()
+        neighbours = self.__neighbours.pop(vertex)
+        del self.__edge_ends[vertex]
 
-        for neighbour in self.__neighbours[vertex]:
-            self.__neighbours[neighbour].remove(vertex)
-            self.__edges.remove((vertex, neighbour) if (vertex, neighbour) in self.__edges else (neighbour, vertex))
+        # Every neighbour stands for one edge, a loop included
+        for neighbour in neighbours:
+            if neighbour != vertex:
+                del self.__own(neighbour)[vertex]
+                self.__edge_ends[neighbour].pop(vertex, None)
+        self.__edges_count -= len(neighbours)
 
-        self.__neighbours.pop(vertex)
+        if self.__copied is not None:
+            self.__copied.discard(vertex)
 
     def are_connected(self, start, end):
-        return end in self.__neighbours[start]
+        neighbours = self.__neighbours.get(start)
+        return neighbours is not None and end in neighbours
 
     def degree(self, vertex):
-        try:
-            self.__vertices[vertex]
-        except IndexError:
+        if vertex not in self.__neighbours:
             raise ValueError("Invalid vertex")
         return len(self.__neighbours[vertex])
 
     def neighbours(self, vertex):
-        try:
-            self.__vertices[vertex]
-        except IndexError:
+        if vertex not in self.__neighbours:
             raise ValueError("Invalid vertex")
         return iter(self.__neighbours[vertex])
 
+    def incident_edges(self, vertex):
+        if vertex not in self.__neighbours:
+            raise ValueError("Invalid vertex")
+        return iter(self.__neighbours[vertex].items())
+
+    def get_cost(self, edge):
+        start, end = edge
+
+        if not self.are_connected(start, end):
+            raise ValueError("Invalid edge")
+        return self.__neighbours[start][end]
+
+    def set_cost(self, edge, value):
+        start, end = edge
+
+        if not self.are_connected(start, end):
+            raise ValueError("Invalid edge")
+        if end not in self.__edge_ends[start]:
+            start, end = end, start
+
+        self.__own(start)[end] = value
+        self.__own(end)[start] = value
+        self.__edge_ends[start][end] = value
+
     def copy(self):
-        return deepcopy(self)
+        # Both graphs share every dictionary from now on, and copy the ones they change first
+        self.__owns_vertices = False
+        self.__copied = set()
+
+        graph = UndirectedGraph.__new__(UndirectedGraph)
+        graph.__edges_count = self.__edges_count
+        graph.__neighbours = self.__neighbours
+        graph.__edge_ends = self.__edge_ends
+        graph.__owns_vertices = False
+        graph.__copied = set()
+        return graph
+
+    @staticmethod
+    def __pair_costs(edges, costs):
+        # Pair every edge with its cost, there must be exactly as many costs as there are edges
+        try:
+            yield from zip(edges, repeat(None) if costs is None else costs, strict=costs is not None)
+        except ValueError:
+            raise ValueError("Invalid edge")
+
+    def __own_vertices(self):
+        if not self.__owns_vertices:
+            self.__neighbours = dict(self.__neighbours)
+            self.__edge_ends = dict(self.__edge_ends)
+            self.__owns_vertices = True
+
+    def __own(self, vertex):
+        # The neighbours of a vertex, copied first along with the ends of its edges if they may be shared
+        # with another graph
+        if self.__copied is not None and vertex not in self.__copied:
+            self.__own_vertices()
+            self.__neighbours[vertex] = dict(self.__neighbours[vertex])
+            self.__edge_ends[vertex] = dict(self.__edge_ends[vertex])
+            self.__copied.add(vertex)
+        return self.__neighbours[vertex]
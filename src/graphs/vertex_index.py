@@ -0,0 +1,183 @@
+from array import array
+
+
+class VertexIndex:
+    """
+    Maps vertex labels, which may be any hashable values such as strings or sparse 64 bit ids, to dense ids
+    and back in constant time, so that algorithms can keep their data in arrays indexed by id. The ids of removed
+    labels go to a free list and are handed out again to the next labels added, which keeps the ids dense however
+    many vertices come and go.
+
+    Labels are kept in a 64 bit integer array while they all fit in one and in a list otherwise. Vertices labelled
+    0..n-1 are their own ids, in which case no lookup table is kept at all.
+    """
+
+    def __init__(self, labels=()):
+        """
+        :type labels: Iterable
+        :param labels: The labels to add, which get the ids 0, 1, 2 and so on
+        """
+
+        labels = list(labels)
+        self.__free = []
+
+        if all(type(label) is int and label == vertex_id for vertex_id, label in enumerate(labels)):
+            self.__labels = range(len(labels))
+            self.__ids = None
+            return
+
+        self.__ids = {label: vertex_id for vertex_id, label in enumerate(labels)}
+        if len(self.__ids) != len(labels):
+            raise ValueError("Invalid vertex")
+
+        try:
+            self.__labels = array('q', labels)
+        except (TypeError, OverflowError):
+            self.__labels = labels
+
+    @classmethod
+    def wrap(cls, labels, count):
+        """
+        Builds an index over already stored labels without copying them, so that they may live in a memory
+        mapped file.
+
+        :type labels: array | memoryview | None
+        :param labels: The label of every id, or None when every vertex is its own id
+
+        :type count: int
+        :param count: The number of labels
+
+        :rtype: VertexIndex
+        :returns: The index over the labels
+        """
+
+        index = cls()
+        if labels is None:
+            index.__labels = range(count)
+        else:
+            index.__labels = labels
+            index.__ids = {label: vertex_id for vertex_id, label in enumerate(labels)}
+            if len(index.__ids) != len(labels):
+                raise ValueError("Invalid vertex")
+        return index
+
+    def __len__(self):
+        return len(self.__labels) - len(self.__free)
+
+    def __contains__(self, label):
+        if self.__ids is None:
+            return type(label) is int and 0 <= label < len(self.__labels)
+        return label in self.__ids
+
+    def __iter__(self):
+        if not self.__free:
+            return iter(self.__labels)
+
+        free = set(self.__free)
+        return (label for vertex_id, label in enumerate(self.__labels) if vertex_id not in free)
+
+    @property
+    def capacity(self):
+        # Every id handed out so far is below the capacity, including the free ones
+        return len(self.__labels)
+
+    @property
+    def labels(self):
+        # The label of every id, or None when every vertex is its own id
+        return None if self.__ids is None else self.__labels
+
+    def add(self, label):
+        """
+        Adds a label, giving it a free id if there is one and the next id otherwise.
+
+        :type label: Hashable
+        :param label: The label
+
+        :rtype: int
+        :returns: The id of the label
+
+        :raises ValueError: If the label is already in the index
+        """
+
+        if label in self:
+            raise ValueError("Invalid vertex")
+
+        # Appending the next number keeps every vertex its own id
+        if self.__ids is None and not self.__free and type(label) is int and label == len(self.__labels):
+            self.__labels = range(label + 1)
+            return label
+
+        self.__make_mutable()
+        vertex_id = self.__free.pop() if self.__free else len(self.__labels)
+
+        try:
+            if vertex_id == len(self.__labels):
+                self.__labels.append(label)
+            else:
+                self.__labels[vertex_id] = label
+        except (TypeError, OverflowError):
+            # The label does not fit in a 64 bit integer, so move the labels over to a list
+            self.__labels = list(self.__labels)
+            if vertex_id == len(self.__labels):
+                self.__labels.append(label)
+            else:
+                self.__labels[vertex_id] = label
+
+        self.__ids[label] = vertex_id
+        return vertex_id
+
+    def remove(self, label):
+        """
+        Removes a label, putting its id on the free list.
+
+        :type label: Hashable
+        :param label: The label
+
+        :rtype: int
+        :returns: The id the label had
+
+        :raises ValueError: If the label is not in the index
+        """
+
+        vertex_id = self.get_id(label)
+
+        self.__make_mutable()
+        del self.__ids[label]
+        self.__free.append(vertex_id)
+        return vertex_id
+
+    def get_id(self, label):
+        if self.__ids is None:
+            if type(label) is int and 0 <= label < len(self.__labels):
+                return label
+            raise ValueError("Invalid vertex")
+
+        try:
+            return self.__ids[label]
+        except (KeyError, TypeError):
+            raise ValueError("Invalid vertex")
+
+    def get_label(self, vertex_id):
+        if not 0 <= vertex_id < len(self.__labels):
+            raise ValueError("Invalid vertex")
+
+        # A free id still holds the label it had before being freed
+        label = self.__labels[vertex_id]
+        if self.__ids is not None and self.__ids.get(label) != vertex_id:
+            raise ValueError("Invalid vertex")
+        return label
+
+    def get_labels(self, vertex_ids):
+        if self.__ids is None:
+            return iter(vertex_ids)
+
+        labels = self.__labels
+        return (labels[vertex_id] for vertex_id in vertex_ids)
+
+    def __make_mutable(self):
+        # Turn the identity mapping or the wrapped labels into an array with a lookup table
+        if self.__ids is None:
+            self.__ids = {label: label for label in self.__labels}
+            self.__labels = array('q', self.__labels)
+        elif isinstance(self.__labels, memoryview):
+            self.__labels = array('q', self.__labels)
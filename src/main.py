@@ -1,13 +1,76 @@
-from algorithms.kosaraju import Kosaraju
-from algorithms.tarjan import Tarjan
-from algorithms.bellman_ford import BellmanFord
-from algorithms.dijkstra import Dijkstra
-from algorithms.floyd_warshall import FloydWarshall
+import argparse
+import json
+import sys
+
+from src.algorithms.kosaraju import Kosaraju
+from src.algorithms.tarjan import Tarjan
+from src.algorithms.bellman_ford import BellmanFord
+from src.algorithms.dijkstra import Dijkstra
+from src.algorithms.floyd_warshall import FloydWarshall
+from src.algorithms.shortest_path_queries import ShortestPathQueries
+from src.services.binary_graph_file import BinaryGraphFile
+from src.services.directed_graph_service import DirectedGraphService
+
+
+def read_graph(file_path):
+    # Binary graph files are told apart from text ones by their magic string
+    with open(file_path, "rb") as input_file:
+        is_binary = input_file.read(len(BinaryGraphFile.MAGIC)) == BinaryGraphFile.MAGIC
+
+    if is_binary:
+        return DirectedGraphService.read_graph_from_binary_file(file_path)
+    return DirectedGraphService.read_graph_from_file(file_path)
+
+
+def read_vertex(field):
+    # A field that is not an integer is passed on as it is, to be answered as an invalid vertex
+    try:
+        return int(field)
+    except ValueError:
+        return field
+
+
+def read_queries(input_file):
+    # Every line is passed on as a query, even a malformed one, which gets an error answer of its own
+    for line in input_file:
+        if line.strip():
+            yield tuple(map(read_vertex, line.split()))
+
+
+def query(arguments):
+    graph = read_graph(arguments.graph)
+    queries = ShortestPathQueries(graph, arguments.algorithm)
+
+    input_file = sys.stdin if arguments.queries == "-" else open(arguments.queries)
+    try:
+        for answer in queries.get_minimum_cost_walks(read_queries(input_file)):
+            print(json.dumps(answer))
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description="Graph algorithms.")
+    subparsers = parser.add_subparsers(dest="command")
+
+    query_parser = subparsers.add_parser("query", help="Answer minimum cost walk queries as JSON lines")
+    query_parser.add_argument("graph", help="A directed graph file, in the text or the binary format")
+    query_parser.add_argument("queries", nargs="?", default="-",
+                              help="A file with a source and a destination vertex on every line, or - for stdin")
+    query_parser.add_argument("--algorithm", choices=ShortestPathQueries.ALGORITHMS, default="dijkstra")
+    query_parser.set_defaults(handler=query)
+
+    arguments = parser.parse_args(arguments)
+    if arguments.command is None:
+        # Kosaraju().run()
+        # Tarjan().run()
+        # BellmanFord().run()
+        # Dijkstra().run()
+        FloydWarshall().run()
+    else:
+        arguments.handler(arguments)
 
 
 if __name__ == "__main__":
-    # Kosaraju().run()
-    # Tarjan().run()
-    # BellmanFord().run()
-    # Dijkstra().run()
-    FloydWarshall().run()
+    main()
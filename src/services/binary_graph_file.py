@@ -0,0 +1,179 @@
+import mmap
+import struct
+import sys
+from array import array
+
+
+class BinaryGraphFile:
+    """
+    Reads and writes graphs in compressed sparse row form to a versioned binary file. The file starts with a header
+    holding a magic string, the format version, a set of flags, the number of vertices and the number of edges,
+    followed by fixed width little endian arrays, each one starting at a multiple of 8 bytes:
+
+    - the vertex labels, as 64 bit integers, only when the vertices are not labelled 0..n-1
+    - for every adjacency (one for undirected graphs, outbound then inbound for directed graphs), the offsets
+      as 64 bit integers, the targets as 32 or 64 bit integers and, when the graph has costs, the costs
+      as 64 bit integers or 64 bit floats
+
+    Files are read through a read only memory map, so the arrays handed back are views over the page cache
+    which every process opening the same file shares.
+    """
+
+    MAGIC = b"GRPH"
+    VERSION = 1
+
+    DIRECTED = 1
+    LABELS = 2
+    WIDE_TARGETS = 4
+    COSTS = 8
+    FLOAT_COSTS = 16
+
+    __header = struct.Struct("<4sHHqq")
+
+    @staticmethod
+    def write(file_path, directed, edges_count, vertices_count, vertices, adjacencies):
+        """
+        Writes the arrays of a graph to a binary file.
+
+        :type file_path: str
+        :param file_path: The path of the file
+
+        :type directed: bool
+        :param directed: Whether the graph is directed
+
+        :type edges_count: int
+        :param edges_count: The number of edges
+
+        :type vertices_count: int
+        :param vertices_count: The number of vertices
+
+        :type vertices: Sequence[int] | None
+        :param vertices: The vertex labels by position, or None when every vertex is its own position
+
+        :type adjacencies: list[tuple]
+        :param adjacencies: The offsets, targets and costs of every adjacency, with the costs left out
+        when the graph has none
+
+        :rtype: None
+
+        :raises ValueError: If a vertex label does not fit in a 64 bit integer
+        """
+
+        costs = len(adjacencies[0]) > 2
+        flags = BinaryGraphFile.DIRECTED if directed else 0
+        if vertices is not None:
+            flags |= BinaryGraphFile.LABELS
+
+            # Only labels fitting in 64 bit integers can be stored
+            if BinaryGraphFile.__typecode(vertices) != "q":
+                try:
+                    vertices = array("q", vertices)
+                except (TypeError, OverflowError):
+                    raise ValueError("Invalid vertex")
+        if vertices_count >= 2 ** 31:
+            flags |= BinaryGraphFile.WIDE_TARGETS
+        if costs:
+            flags |= BinaryGraphFile.COSTS
+            if any(BinaryGraphFile.__typecode(adjacency[2]) == "d" for adjacency in adjacencies):
+                flags |= BinaryGraphFile.FLOAT_COSTS
+
+        target_type, cost_type = BinaryGraphFile.__array_types(flags)
+
+        with open(file_path, "wb") as output_file:
+            output_file.write(BinaryGraphFile.__header.pack(BinaryGraphFile.MAGIC, BinaryGraphFile.VERSION, flags,
+                                                            vertices_count, edges_count))
+
+            if vertices is not None:
+                BinaryGraphFile.__write_array(output_file, "q", vertices)
+            for adjacency in adjacencies:
+                BinaryGraphFile.__write_array(output_file, "q", adjacency[0])
+                BinaryGraphFile.__write_array(output_file, target_type, adjacency[1])
+                if costs:
+                    BinaryGraphFile.__write_array(output_file, cost_type, adjacency[2])
+
+    @staticmethod
+    def read(file_path):
+        """
+        Maps a binary graph file into memory and gets views over its arrays, without copying them.
+
+        :type file_path: str
+        :param file_path: The path of the file
+
+        :rtype: tuple[bool, int, memoryview | None, list[tuple]]
+        :returns: A tuple containing whether the graph is directed, the number of edges, the vertex labels,
+        or None when every vertex is its own position, and the offsets, targets and costs of every adjacency,
+        with the costs left out when the graph has none
+
+        :raises ValueError: If the file is not a binary graph file of a supported version
+        """
+
+        with open(file_path, "rb") as input_file:
+            memory = memoryview(mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ))
+
+        if len(memory) < BinaryGraphFile.__header.size:
+            raise ValueError("Invalid graph file")
+
+        magic, version, flags, vertices_count, edges_count = BinaryGraphFile.__header.unpack_from(memory)
+        if magic != BinaryGraphFile.MAGIC:
+            raise ValueError("Invalid graph file")
+        if version != BinaryGraphFile.VERSION:
+            raise ValueError(f"Unsupported graph file version: {version}")
+
+        target_type, cost_type = BinaryGraphFile.__array_types(flags)
+        offset = BinaryGraphFile.__header.size
+
+        vertices = None
+        if flags & BinaryGraphFile.LABELS:
+            vertices, offset = BinaryGraphFile.__read_array(memory, offset, "q", vertices_count)
+
+        adjacencies = []
+        for _ in range(2 if flags & BinaryGraphFile.DIRECTED else 1):
+            offsets, offset = BinaryGraphFile.__read_array(memory, offset, "q", vertices_count + 1)
+            targets, offset = BinaryGraphFile.__read_array(memory, offset, target_type, offsets[-1])
+            adjacency = offsets, targets
+            if flags & BinaryGraphFile.COSTS:
+                costs, offset = BinaryGraphFile.__read_array(memory, offset, cost_type, offsets[-1])
+                adjacency += costs,
+            adjacencies.append(adjacency)
+
+        return bool(flags & BinaryGraphFile.DIRECTED), edges_count, vertices, adjacencies
+
+    @staticmethod
+    def __array_types(flags):
+        target_type = "q" if flags & BinaryGraphFile.WIDE_TARGETS else "i"
+        cost_type = "d" if flags & BinaryGraphFile.FLOAT_COSTS else "q"
+        return target_type, cost_type
+
+    @staticmethod
+    def __typecode(values):
+        if isinstance(values, memoryview):
+            return values.format
+        return getattr(values, "typecode", None)
+
+    @staticmethod
+    def __write_array(output_file, typecode, values):
+        # Arrays already in the right layout are written as they are, anything else goes through a copy
+        if sys.byteorder == "big" or BinaryGraphFile.__typecode(values) != typecode:
+            values = array(typecode, values)
+            if sys.byteorder == "big":
+                values.byteswap()
+
+        # Pad every array to a multiple of 8 bytes, so that the next one starts aligned
+        size = len(values) * array(typecode).itemsize
+        output_file.write(values)
+        output_file.write(bytes(-size % 8))
+
+    @staticmethod
+    def __read_array(memory, offset, typecode, length):
+        size = length * array(typecode).itemsize
+        if offset + size > len(memory):
+            raise ValueError("Invalid graph file")
+
+        values = memory[offset:offset + size].cast(typecode)
+
+        # Views can only be handed back on little endian machines; elsewhere the array has to be swapped in a copy
+        if sys.byteorder == "big":
+            values = array(typecode, values)
+            values.byteswap()
+
+        return values, offset + size + -size % 8
@@ -1,23 +1,39 @@
-import random
+import gc
+from itertools import chain
 
+from src.graphs.compact_directed_graph import CompactDirectedGraph
 from src.graphs.directed_graph import DirectedGraph
+from src.services.binary_graph_file import BinaryGraphFile
+from src.services.random_graph_generator import RandomGraphGenerator
 
 
 class DirectedGraphService:
     @staticmethod
     def read_graph_from_file(file_path):
-        with open(file_path, "r") as input_file:
-            vertices, edges = input_file.readline().strip().split(" ")
-            vertices, edges = int(vertices), int(edges)
+        with open(file_path, "rb") as input_file:
+            vertices, edges = DirectedGraphService.__read_header(input_file)
 
-            graph = DirectedGraph(vertices)
+            # The edges only ever add objects, so pause the garbage collector instead of letting it
+            # scan the growing graph over and over again
+            gc_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                batches = DirectedGraphService.__read_edge_batches(input_file, edges)
+                return DirectedGraph.from_edges(vertices, chain.from_iterable(batches))
+            finally:
+                if gc_enabled:
+                    gc.enable()
 
-            for _ in range(edges):
-                start, end, cost = input_file.readline().strip().split(" ")
-                start, end, cost = int(start), int(end), int(cost)
-                graph.add_edge((start, end), cost)
+    @staticmethod
+    def read_graph_header(file_path):
+        with open(file_path, "rb") as input_file:
+            return DirectedGraphService.__read_header(input_file)
 
-            return graph
+    @staticmethod
+    def read_edge_batches(file_path):
+        with open(file_path, "rb") as input_file:
+            _, edges = DirectedGraphService.__read_header(input_file)
+            yield from DirectedGraphService.__read_edge_batches(input_file, edges)
 
     @staticmethod
     def write_graph_to_file(graph, file_path):
@@ -31,21 +47,81 @@ class DirectedGraphService:
                 output_file.write(f"{start} {end} {cost}\n")
 
     @staticmethod
-    def generate_random_graph(vertices, edges):
-        graph = DirectedGraph(vertices)
-        free_edges = [(start, end) for start in range(vertices) for end in range(vertices) if start != end]
-        generated_edges = []
+    def read_graph_from_binary_file(file_path):
+        directed, _, vertices, adjacencies = BinaryGraphFile.read(file_path)
+        if not directed:
+            raise ValueError("Invalid graph file")
+
+        return CompactDirectedGraph.from_arrays(vertices, *adjacencies)
+
+    @staticmethod
+    def write_graph_to_binary_file(graph, file_path):
+        if not isinstance(graph, CompactDirectedGraph):
+            graph = CompactDirectedGraph(graph)
+
+        vertices, outbound, inbound = graph.to_arrays()
+        BinaryGraphFile.write(file_path, True, graph.edges_count, graph.vertices_count, vertices, [outbound, inbound])
+
+    @staticmethod
+    def generate_random_graph(vertices, edges, seed=None):
+        generator = RandomGraphGenerator(seed)
+        return DirectedGraphService.__build_graph(vertices, generator.get_uniform_edges(vertices, edges, True),
+                                                  generator)
+
+    @staticmethod
+    def generate_gnp_graph(vertices, probability, seed=None):
+        generator = RandomGraphGenerator(seed)
+        return DirectedGraphService.__build_graph(vertices, generator.get_gnp_edges(vertices, probability, True),
+                                                  generator)
 
-        for _ in range(edges):
-            edge = random.choice(free_edges)
-            free_edges.remove(edge)
+    @staticmethod
+    def generate_barabasi_albert_graph(vertices, edges_per_vertex, seed=None):
+        generator = RandomGraphGenerator(seed)
+        return DirectedGraphService.__build_graph(vertices,
+                                                  generator.get_barabasi_albert_edges(vertices, edges_per_vertex),
+                                                  generator)
+
+    @staticmethod
+    def generate_grid_graph(rows, columns, seed=None):
+        generator = RandomGraphGenerator(seed)
+        edges = generator.get_grid_edges(rows, columns)
+        costs = generator.get_costs(len(edges))
+
+        # Roads go both ways at the same cost
+        return DirectedGraph.from_edges(rows * columns,
+                                        chain(zip(edges, costs),
+                                              (((end, start), cost) for (start, end), cost in zip(edges, costs))))
+
+    @staticmethod
+    def __read_header(input_file):
+        vertices, edges = input_file.readline().split()
+        return int(vertices), int(edges)
+
+    @staticmethod
+    def __read_edge_batches(input_file, edges, chunk_size=1 << 20):
+        # Read the file in large chunks and turn every chunk into a batch of edges at once, carrying over
+        # the number cut in two by the end of a chunk and the numbers of an edge split between two chunks
+        partial_number, numbers = b"", []
 
-            cost = random.randint(1, 100)
-            generated_edges.append((edge, cost))
+        while edges > 0 and (chunk := input_file.read(chunk_size)):
+            chunk = partial_number + chunk
+            chunk_numbers = chunk.split()
+            partial_number = b"" if chunk[-1:].isspace() else chunk_numbers.pop()
 
-        generated_edges = sorted(generated_edges, key=lambda x: x[0][0])
+            numbers += chunk_numbers
+            count = min(len(numbers) // 3, edges)
+            if count == 0:
+                continue
 
-        for edge, cost in generated_edges:
-            graph.add_edge(edge, cost)
+            edges -= count
+            triples = iter(map(int, numbers[:3 * count]))
+            numbers = numbers[3 * count:]
+            yield [((start, end), cost) for start, end, cost in zip(triples, triples, triples)]
 
-        return graph
+        if edges > 0:
+            start, end, cost = map(int, numbers + [partial_number])
+            yield [((start, end), cost)]
+
+    @staticmethod
+    def __build_graph(vertices, edges, generator):
+        return DirectedGraph.from_edges(vertices, zip(edges, generator.get_costs(len(edges))))
@@ -0,0 +1,199 @@
+import math
+import random
+
+
+class RandomGraphGenerator:
+    """
+    Generates the edges of random graphs without going over every possible edge. Edges are numbered
+    0..N-1, where N is the number of possible edges, and only the numbers of the edges picked are ever
+    drawn and decoded back into pairs of vertices, so the work done grows with the edges generated.
+
+    Every graph comes from a single random number generator, which makes the output reproducible from a seed.
+    """
+
+    def __init__(self, seed=None):
+        """
+        :type seed: int | None
+        :param seed: The seed of the random number generator, or None for a random seed
+        """
+
+        self.__random = random.Random(seed)
+
+    def get_uniform_edges(self, vertices, edges, directed):
+        """
+        Picks a number of distinct edges uniformly at random, without loops.
+
+        :type vertices: int
+        :param vertices: The number of vertices
+
+        :type edges: int
+        :param edges: The number of edges
+
+        :type directed: bool
+        :param directed: Whether the edges are directed
+
+        :rtype: list[tuple[int, int]]
+        :returns: The edges, in order of their number, which groups them by vertex
+
+        :raises ValueError: If there are fewer possible edges than requested
+        """
+
+        edges_count = self.__possible_edges_count(vertices, directed)
+        if not 0 <= edges <= edges_count:
+            raise ValueError("Invalid edges count")
+
+        # Sampling from a range only keeps the numbers drawn so far, not the whole range
+        numbers = sorted(self.__random.sample(range(edges_count), edges))
+        return [self.__decode_edge(number, vertices, directed) for number in numbers]
+
+    def get_gnp_edges(self, vertices, probability, directed):
+        """
+        Picks every possible edge, except for loops, independently with a given probability (the G(n, p) model).
+        Instead of flipping a coin for every edge, the number of edges skipped before the next one picked is drawn
+        from a geometric distribution.
+
+        :type vertices: int
+        :param vertices: The number of vertices
+
+        :type probability: float
+        :param probability: The probability of picking an edge
+
+        :type directed: bool
+        :param directed: Whether the edges are directed
+
+        :rtype: list[tuple[int, int]]
+        :returns: The edges, in order of their number, which groups them by vertex
+        """
+
+        edges_count = self.__possible_edges_count(vertices, directed)
+        if probability <= 0:
+            return []
+        if probability >= 1:
+            return [self.__decode_edge(number, vertices, directed) for number in range(edges_count)]
+
+        log_skip = math.log(1 - probability)
+        edges = []
+        number = -1
+
+        while True:
+            number += 1 + int(math.log(1 - self.__random.random()) / log_skip)
+            if number >= edges_count:
+                return edges
+            edges.append(self.__decode_edge(number, vertices, directed))
+
+    def get_barabasi_albert_edges(self, vertices, edges_per_vertex):
+        """
+        Grows a scale free graph by preferential attachment (the Barabasi-Albert model). Every vertex after the
+        first edges_per_vertex ones is joined to edges_per_vertex distinct earlier vertices, each picked with
+        a probability proportional to its degree, which gives a power law degree distribution.
+
+        :type vertices: int
+        :param vertices: The number of vertices
+
+        :type edges_per_vertex: int
+        :param edges_per_vertex: The number of edges joining every new vertex to the earlier ones
+
+        :rtype: list[tuple[int, int]]
+        :returns: The edges, going from every new vertex to the earlier ones it was joined to
+
+        :raises ValueError: If there are not more vertices than edges per vertex
+        """
+
+        if not 1 <= edges_per_vertex < vertices:
+            raise ValueError("Invalid edges count")
+
+        # Every vertex shows up in the list once for every edge it has, so picking uniformly from the list
+        # picks vertices proportionally to their degree
+        endpoints = []
+        targets = list(range(edges_per_vertex))
+        edges = []
+
+        for vertex in range(edges_per_vertex, vertices):
+            for target in targets:
+                edges.append((vertex, target))
+            endpoints.extend(targets)
+            endpoints.extend([vertex] * edges_per_vertex)
+
+            picked = set()
+            while len(picked) < edges_per_vertex:
+                picked.add(self.__random.choice(endpoints))
+            targets = sorted(picked)
+
+        return edges
+
+    @staticmethod
+    def get_grid_edges(rows, columns):
+        """
+        Joins every cell of a grid to the cells right of and below it, which resembles a road network.
+        The cell in a given row and column is the vertex row * columns + column.
+
+        :type rows: int
+        :param rows: The number of rows of the grid
+
+        :type columns: int
+        :param columns: The number of columns of the grid
+
+        :rtype: list[tuple[int, int]]
+        :returns: The edges, sorted by their start vertex
+        """
+
+        edges = []
+        for row in range(rows):
+            for column in range(columns):
+                vertex = row * columns + column
+                if column + 1 < columns:
+                    edges.append((vertex, vertex + 1))
+                if row + 1 < rows:
+                    edges.append((vertex, vertex + columns))
+
+        return edges
+
+    def get_costs(self, count, low=1, high=100):
+        """
+        Draws a number of integer costs uniformly at random.
+
+        :type count: int
+        :param count: The number of costs
+
+        :type low: int
+        :param low: The smallest cost
+
+        :type high: int
+        :param high: The largest cost
+
+        :rtype: list[int]
+        :returns: The costs
+        """
+
+        return self.__random.choices(range(low, high + 1), k=count)
+
+    @staticmethod
+    def __possible_edges_count(vertices, directed):
+        return vertices * (vertices - 1) if directed else vertices * (vertices - 1) // 2
+
+    @staticmethod
+    def __decode_edge(number, vertices, directed):
+        """
+        Decodes the number of an edge. Directed edges are numbered by start vertex and then by end vertex,
+        skipping loops, while undirected edges (start, end) with start < end are numbered by end vertex and
+        then by start vertex, so that the end vertex of a number can be found with a square root.
+
+        :type number: int
+        :param number: The number of the edge
+
+        :type vertices: int
+        :param vertices: The number of vertices
+
+        :type directed: bool
+        :param directed: Whether the edge is directed
+
+        :rtype: tuple[int, int]
+        :returns: The edge
+        """
+
+        if directed:
+            start, end = divmod(number, vertices - 1)
+            return start, end + (end >= start)
+
+        end = (1 + math.isqrt(1 + 8 * number)) // 2
+        return number - end * (end - 1) // 2, end
@@ -1,23 +1,47 @@
-import random
+import gc
+from itertools import chain, tee
 
+from src.graphs.compact_undirected_graph import CompactUndirectedGraph
 from src.graphs.undirected_graph import UndirectedGraph
+from src.services.binary_graph_file import BinaryGraphFile
+from src.services.random_graph_generator import RandomGraphGenerator
 
 
 class UndirectedGraphService:
     @staticmethod
     def read_graph_from_file(file_path):
-        with open(file_path, "r") as input_file:
-            vertices, edges = input_file.readline().strip().split(" ")
-            vertices, edges = int(vertices), int(edges)
+        with open(file_path, "rb") as input_file:
+            vertices, edges = UndirectedGraphService.__read_header(input_file)
 
-            graph = UndirectedGraph(vertices)
+            columns = UndirectedGraphService.__read_columns(input_file)
 
-            for _ in range(edges):
-                start, end, = input_file.readline().strip().split(" ")
-                start, end = int(start), int(end)
-                graph.add_edge((start, end))
+            # The edges only ever add objects, so pause the garbage collector instead of letting it
+            # scan the growing graph over and over again
+            gc_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                batches = UndirectedGraphService.__read_edge_batches(input_file, edges, columns)
+                if columns == 2:
+                    return UndirectedGraph.from_edges(vertices, chain.from_iterable(batches))
 
-            return graph
+                # The edges and the costs are taken in step, so the two copies of the iterator stay one apart
+                edges, costs = tee(chain.from_iterable(batches))
+                return UndirectedGraph.from_edges(vertices, (edge for edge, _ in edges), (cost for _, cost in costs))
+            finally:
+                if gc_enabled:
+                    gc.enable()
+
+    @staticmethod
+    def read_graph_header(file_path):
+        with open(file_path, "rb") as input_file:
+            return UndirectedGraphService.__read_header(input_file)
+
+    @staticmethod
+    def read_edge_batches(file_path):
+        with open(file_path, "rb") as input_file:
+            _, edges = UndirectedGraphService.__read_header(input_file)
+            columns = UndirectedGraphService.__read_columns(input_file)
+            yield from UndirectedGraphService.__read_edge_batches(input_file, edges, columns)
 
     @staticmethod
     def write_graph_to_file(graph, file_path):
@@ -25,25 +49,96 @@ class UndirectedGraphService:
             vertices, edges = graph.vertices_count, graph.edges_count
             output_file.write(f"{vertices} {edges}\n")
 
-            for edge in graph.edges:
-                start, end = edge
-                output_file.write(f"{start} {end}\n")
+            # Every line has the same number of columns, so the costs are only written when every edge has one
+            if all(graph.get_cost(edge) is not None for edge in graph.edges):
+                for edge in graph.edges:
+                    start, end = edge
+                    output_file.write(f"{start} {end} {graph.get_cost(edge)}\n")
+            else:
+                for start, end in graph.edges:
+                    output_file.write(f"{start} {end}\n")
+
+    @staticmethod
+    def read_graph_from_binary_file(file_path):
+        directed, edges_count, vertices, adjacencies = BinaryGraphFile.read(file_path)
+        if directed:
+            raise ValueError("Invalid graph file")
+
+        offsets, targets, *costs = adjacencies[0]
+        return CompactUndirectedGraph.from_arrays(vertices, offsets, targets, edges_count, *costs)
+
+    @staticmethod
+    def write_graph_to_binary_file(graph, file_path):
+        if not isinstance(graph, CompactUndirectedGraph):
+            graph = CompactUndirectedGraph(graph)
+
+        vertices, offsets, targets, edges_count, costs = graph.to_arrays()
+        adjacency = (offsets, targets) if costs is None else (offsets, targets, costs)
+        BinaryGraphFile.write(file_path, False, edges_count, graph.vertices_count, vertices, [adjacency])
+
+    @staticmethod
+    def generate_random_graph(vertices, edges, seed=None):
+        generator = RandomGraphGenerator(seed)
+        return UndirectedGraphService.__build_graph(vertices, generator.get_uniform_edges(vertices, edges, False))
 
     @staticmethod
-    def generate_random_graph(vertices, edges):
-        graph = UndirectedGraph(vertices)
-        free_edges = [(start, end) for start in range(vertices) for end in range(vertices) if start != end]
-        generated_edges = []
+    def generate_gnp_graph(vertices, probability, seed=None):
+        generator = RandomGraphGenerator(seed)
+        return UndirectedGraphService.__build_graph(vertices, generator.get_gnp_edges(vertices, probability, False))
 
-        for _ in range(edges):
-            edge = random.choice(free_edges)
-            free_edges.remove(edge)
+    @staticmethod
+    def generate_barabasi_albert_graph(vertices, edges_per_vertex, seed=None):
+        generator = RandomGraphGenerator(seed)
+        return UndirectedGraphService.__build_graph(vertices,
+                                                    generator.get_barabasi_albert_edges(vertices, edges_per_vertex))
 
-            generated_edges.append(edge)
+    @staticmethod
+    def generate_grid_graph(rows, columns):
+        return UndirectedGraphService.__build_graph(rows * columns, RandomGraphGenerator.get_grid_edges(rows, columns))
 
-        generated_edges = sorted(generated_edges, key=lambda x: x[0])
+    @staticmethod
+    def __read_header(input_file):
+        vertices, edges = input_file.readline().split()
+        return int(vertices), int(edges)
 
-        for edge in generated_edges:
-            graph.add_edge(edge)
+    @staticmethod
+    def __read_columns(input_file):
+        # Edges come with a cost as a third column or without one, as told by the first edge of the file
+        position = input_file.tell()
+        columns = len(input_file.readline().split())
+        input_file.seek(position)
+        return 3 if columns == 3 else 2
 
-        return graph
+    @staticmethod
+    def __read_edge_batches(input_file, edges, columns, chunk_size=1 << 20):
+        # Read the file in large chunks and turn every chunk into a batch of edges at once, carrying over
+        # the line cut in two by the end of a chunk
+        partial_line = b""
+
+        while edges > 0:
+            chunk = input_file.read(chunk_size)
+            lines = (partial_line + chunk).split(b"\n")
+            partial_line = lines.pop() if chunk else b""
+
+            # Every edge must have as many columns as the first one, skipping the blank lines
+            rows = list(map(bytes.split, lines))
+            if set(map(len, rows)) != {columns}:
+                rows = [row for row in rows if row]
+                if any(len(row) != columns for row in rows[:edges]):
+                    raise ValueError("Invalid graph file")
+            rows = rows[:edges]
+            if not rows:
+                if not chunk:
+                    raise ValueError("Invalid graph file")
+                continue
+
+            edges -= len(rows)
+            values = iter(map(int, chain.from_iterable(rows)))
+            if columns == 3:
+                yield [((start, end), cost) for start, end, cost in zip(values, values, values)]
+            else:
+                yield list(zip(values, values))
+
+    @staticmethod
+    def __build_graph(vertices, edges):
+        return UndirectedGraph.from_edges(vertices, edges)
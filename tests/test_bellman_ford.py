@@ -0,0 +1,48 @@
+from unittest import TestCase
+from src.algorithms.bellman_ford import BellmanFord
+from src.graphs.directed_graph import DirectedGraph
+
+
+class TestBellmanFord(TestCase):
+    def setUp(self):
+        self.graph = DirectedGraph(5)
+        self.graph.add_edge((0, 1), 3)
+        self.graph.add_edge((0, 2), 2)
+        self.graph.add_edge((1, 3), 7)
+        self.graph.add_edge((2, 3), 5)
+        self.graph.add_edge((1, 2), -2)
+        self.bellman_ford = BellmanFord(self.graph)
+
+    def tearDown(self):
+        del self.bellman_ford
+        del self.graph
+
+    def test_get_minimum_cost_walk(self):
+        self.assertEqual(self.bellman_ford.get_minimum_cost_walk(0, 3), ([0, 1, 2, 3], 6))
+        self.assertEqual(self.bellman_ford.get_minimum_cost_walk(0, 0), ([0], 0))
+        self.assertEqual(self.bellman_ford.get_minimum_cost_walk(3, 0), (None, float('inf')))
+        self.assertRaises(ValueError, self.bellman_ford.get_minimum_cost_walk, 0, 5)
+
+    def test_get_shortest_path_tree(self):
+        dist, prev = self.bellman_ford.get_shortest_path_tree(0)
+        self.assertEqual(dist, {0: 0, 1: 3, 2: 1, 3: 6})
+        self.assertEqual(prev, {1: 0, 2: 1, 3: 2})
+
+    def test_get_shortest_path_tree_from_virtual_source(self):
+        dist, _ = self.bellman_ford.get_shortest_path_tree()
+        self.assertEqual(dist, {0: 0, 1: 0, 2: -2, 3: 0, 4: 0})
+
+    def test_get_shortest_path_tree_in_rounds(self):
+        self.assertEqual(self.bellman_ford.get_shortest_path_tree_in_rounds(0),
+                         self.bellman_ford.get_shortest_path_tree(0))
+        self.assertEqual(self.bellman_ford.get_shortest_path_tree_in_rounds(),
+                         self.bellman_ford.get_shortest_path_tree())
+
+    def test_negative_cycle(self):
+        self.assertIsNone(self.bellman_ford.get_negative_cycle())
+
+        self.graph.add_edge((3, 1), -6)
+        self.assertEqual(self.bellman_ford.get_negative_cycle(0), [2, 3, 1, 2])
+        self.assertIsNone(self.bellman_ford.get_negative_cycle(4))
+        self.assertRaises(ValueError, self.bellman_ford.get_minimum_cost_walk, 0, 3)
+        self.assertRaises(ValueError, self.bellman_ford.get_shortest_path_tree_in_rounds, 0)
@@ -0,0 +1,26 @@
+from unittest import TestCase
+from benchmarks.benchmark_suite import BenchmarkSuite
+
+
+class TestBenchmarkSuite(TestCase):
+    def test_run(self):
+        report = BenchmarkSuite(["tarjan", "load_binary"], ["chain", "power-law"], [50], repeat=1).run()
+
+        self.assertEqual([(result["benchmark"], result["shape"]) for result in report["results"]],
+                         [("tarjan", "chain"), ("tarjan", "power-law"),
+                          ("load_binary", "chain"), ("load_binary", "power-law")])
+        for result in report["results"]:
+            self.assertEqual(result["vertices"], 50)
+            self.assertGreater(result["peak_rss_kib"], 0)
+            self.assertGreaterEqual(result["seconds"], 0)
+
+    def test_compare(self):
+        baseline = {"results": [{"benchmark": "tarjan", "shape": "grid", "size": 100, "seconds": 1.0},
+                                {"benchmark": "dijkstra", "shape": "grid", "size": 100, "seconds": 1.0}]}
+        report = {"results": [{"benchmark": "tarjan", "shape": "grid", "size": 100, "seconds": 1.05},
+                              {"benchmark": "dijkstra", "shape": "grid", "size": 100, "seconds": 1.5},
+                              {"benchmark": "kosaraju", "shape": "grid", "size": 100, "seconds": 1.0}]}
+
+        comparisons = BenchmarkSuite.compare(report, baseline, threshold=0.1)
+        self.assertEqual([(comparison["benchmark"], comparison["regression"]) for comparison in comparisons],
+                         [("tarjan", False), ("dijkstra", True)])
@@ -0,0 +1,45 @@
+import random
+from unittest import TestCase
+from unittest.mock import patch
+from src.algorithms.blocked_floyd_warshall import BlockedFloydWarshall
+from src.algorithms.floyd_warshall import FloydWarshall
+from src.graphs.directed_graph import DirectedGraph
+
+
+class TestBlockedFloydWarshall(TestCase):
+    def setUp(self):
+        generator = random.Random(5)
+        self.graph = DirectedGraph(30)
+        for _ in range(100):
+            start, end = generator.randrange(30), generator.randrange(30)
+            if start != end and not self.graph.are_connected(start, end):
+                self.graph.add_edge((start, end), generator.randint(1, 20))
+
+    def tearDown(self):
+        del self.graph
+
+    def test_get_shortest_path_matrix(self):
+        cost, _ = FloydWarshall(self.graph).get_shortest_path_matrix()
+        blocked_cost, _ = BlockedFloydWarshall(self.graph, block_size=7, max_workers=2).get_shortest_path_matrix()
+        self.assertEqual(blocked_cost, cost)
+
+    def test_get_minimum_cost_walk(self):
+        floyd_warshall = FloydWarshall(self.graph)
+        blocked_floyd_warshall = BlockedFloydWarshall(self.graph, block_size=7, max_workers=2)
+
+        for source in range(30):
+            for destination in range(30):
+                walk, cost = blocked_floyd_warshall.get_minimum_cost_walk(source, destination)
+                self.assertEqual(cost, floyd_warshall.get_minimum_cost_walk(source, destination)[1])
+                if walk is not None:
+                    self.assertEqual(walk[0], source)
+                    self.assertEqual(walk[-1], destination)
+                    self.assertEqual(sum(self.graph.get_cost(edge) for edge in zip(walk, walk[1:])), cost)
+
+    def test_failure_releases_shared_memory(self):
+        with patch("src.algorithms.blocked_floyd_warshall.array", side_effect=RuntimeError("Copy failed")):
+            floyd_warshall = BlockedFloydWarshall(self.graph, block_size=7, max_workers=2)
+            self.assertRaisesRegex(RuntimeError, "Copy failed", floyd_warshall.get_shortest_path_matrix)
+
+    def test_empty_graph(self):
+        self.assertEqual(BlockedFloydWarshall(DirectedGraph(0)).get_shortest_path_matrix(), ([], []))
@@ -0,0 +1,99 @@
+from unittest import TestCase
+from src.graphs.compact_directed_graph import CompactDirectedGraph
+from src.graphs.directed_graph import DirectedGraph
+
+
+class TestCompactDirectedGraph(TestCase):
+    def setUp(self):
+        graph = DirectedGraph(4)
+        graph.add_edge((0, 2), 5)
+        graph.add_edge((0, 1), 1)
+        graph.add_edge((1, 2), 2)
+        graph.add_edge((2, 0), 3)
+        self.graph = CompactDirectedGraph(graph)
+
+    def tearDown(self):
+        del self.graph
+
+    def test_vertices_count(self):
+        self.assertEqual(self.graph.vertices_count, 4)
+
+    def test_edges_count(self):
+        self.assertEqual(self.graph.edges_count, 4)
+
+    def test_vertices(self):
+        self.assertEqual(list(self.graph.vertices), [0, 1, 2, 3])
+
+    def test_edges(self):
+        self.assertEqual(list(self.graph.edges), [(0, 1), (0, 2), (1, 2), (2, 0)])
+
+    def test_are_connected(self):
+        self.assertTrue(self.graph.are_connected(0, 1))
+        self.assertTrue(self.graph.are_connected(2, 0))
+        self.assertFalse(self.graph.are_connected(1, 0))
+        self.assertFalse(self.graph.are_connected(0, 4))
+
+    def test_in_degree(self):
+        self.assertEqual(self.graph.in_degree(0), 1)
+        self.assertEqual(self.graph.in_degree(2), 2)
+        self.assertEqual(self.graph.in_degree(3), 0)
+        self.assertRaises(ValueError, self.graph.in_degree, 4)
+
+    def test_out_degree(self):
+        self.assertEqual(self.graph.out_degree(0), 2)
+        self.assertEqual(self.graph.out_degree(3), 0)
+        self.assertRaises(ValueError, self.graph.out_degree, 4)
+
+    def test_inbound_neighbours(self):
+        self.assertEqual(list(self.graph.inbound_neighbours(2)), [0, 1])
+        self.assertEqual(list(self.graph.inbound_neighbours(3)), [])
+        self.assertRaises(ValueError, self.graph.inbound_neighbours, 4)
+
+    def test_outbound_neighbours(self):
+        self.assertEqual(list(self.graph.outbound_neighbours(0)), [1, 2])
+        self.assertEqual(list(self.graph.outbound_neighbours(3)), [])
+        self.assertRaises(ValueError, self.graph.outbound_neighbours, 4)
+
+    def test_get_cost(self):
+        self.assertEqual(self.graph.get_cost((0, 1)), 1)
+        self.assertEqual(self.graph.get_cost((0, 2)), 5)
+        self.assertRaises(ValueError, self.graph.get_cost, (1, 0))
+        self.assertRaises(ValueError, self.graph.get_cost, (0, 4))
+
+    def test_float_costs(self):
+        graph = DirectedGraph(2)
+        graph.add_edge((0, 1), 1.5)
+        self.assertEqual(CompactDirectedGraph(graph).get_cost((0, 1)), 1.5)
+
+    def test_sparse_vertices(self):
+        graph = DirectedGraph(3)
+        graph.add_vertex(10)
+        graph.add_edge((10, 0), 4)
+        graph.remove_vertex(1)
+        compact = CompactDirectedGraph(graph)
+
+        self.assertEqual(list(compact.vertices), [0, 2, 10])
+        self.assertEqual(list(compact.inbound_neighbours(0)), [10])
+        self.assertEqual(compact.get_cost((10, 0)), 4)
+        self.assertRaises(ValueError, compact.out_degree, 1)
+
+    def test_from_arrays(self):
+        graph = CompactDirectedGraph.from_arrays(*self.graph.to_arrays())
+        self.assertEqual(list(graph.edges), list(self.graph.edges))
+        self.assertEqual(list(graph.inbound_edges(2)), [(0, 5), (1, 2)])
+
+    def test_arbitrary_labels(self):
+        for labels in ["a", "b", "c"], [2 ** 64 + 1, 7, -3]:
+            graph = DirectedGraph(0)
+            for label in labels:
+                graph.add_vertex(label)
+            graph.add_edge((labels[0], labels[2]), 4)
+            graph.add_edge((labels[2], labels[1]), 2)
+            graph = CompactDirectedGraph(graph)
+
+            self.assertEqual(list(graph.vertices), labels)
+            self.assertEqual(list(graph.outbound_edges(labels[2])), [(labels[1], 2)])
+            self.assertEqual(list(graph.inbound_neighbours(labels[2])), [labels[0]])
+            self.assertEqual(sorted(graph.edges, key=str), sorted([(labels[0], labels[2]), (labels[2], labels[1])],
+                                                                  key=str))
+            self.assertRaises(ValueError, graph.out_degree, 0)
@@ -0,0 +1,94 @@
+from unittest import TestCase
+from src.graphs.compact_undirected_graph import CompactUndirectedGraph
+from src.graphs.undirected_graph import UndirectedGraph
+
+
+class TestCompactUndirectedGraph(TestCase):
+    def setUp(self):
+        graph = UndirectedGraph(4)
+        graph.add_edge((2, 0))
+        graph.add_edge((0, 1))
+        graph.add_edge((1, 2))
+        graph.add_edge((3, 3))
+        self.graph = CompactUndirectedGraph(graph)
+
+    def tearDown(self):
+        del self.graph
+
+    def test_vertices_count(self):
+        self.assertEqual(self.graph.vertices_count, 4)
+
+    def test_edges_count(self):
+        self.assertEqual(self.graph.edges_count, 4)
+
+    def test_vertices(self):
+        self.assertEqual(list(self.graph.vertices), [0, 1, 2, 3])
+
+    def test_edges(self):
+        self.assertEqual(list(self.graph.edges), [(0, 1), (0, 2), (1, 2), (3, 3)])
+
+    def test_are_connected(self):
+        self.assertTrue(self.graph.are_connected(0, 2))
+        self.assertTrue(self.graph.are_connected(2, 0))
+        self.assertTrue(self.graph.are_connected(3, 3))
+        self.assertFalse(self.graph.are_connected(0, 3))
+        self.assertFalse(self.graph.are_connected(0, 4))
+
+    def test_degree(self):
+        self.assertEqual(self.graph.degree(0), 2)
+        self.assertEqual(self.graph.degree(3), 1)
+        self.assertRaises(ValueError, self.graph.degree, 4)
+
+    def test_neighbours(self):
+        self.assertEqual(list(self.graph.neighbours(2)), [0, 1])
+        self.assertRaises(ValueError, self.graph.neighbours, 4)
+
+    def test_labelled_vertices(self):
+        graph = UndirectedGraph(0)
+        graph.add_vertex(10)
+        graph.add_vertex(5)
+        graph.add_edge((5, 10))
+        graph = CompactUndirectedGraph(graph)
+
+        self.assertEqual(list(graph.edges), [(10, 5)])
+        self.assertEqual(list(graph.neighbours(5)), [10])
+        self.assertRaises(ValueError, graph.degree, 0)
+
+    def test_from_arrays(self):
+        graph = CompactUndirectedGraph.from_arrays(*self.graph.to_arrays())
+        self.assertEqual(list(graph.edges), list(self.graph.edges))
+        self.assertEqual(graph.edges_count, 4)
+
+    def test_costs(self):
+        self.assertIsNone(self.graph.get_cost((0, 1)))
+        self.assertEqual(list(self.graph.incident_edges(0)), [(1, None), (2, None)])
+
+        graph = UndirectedGraph(3)
+        graph.add_edge((2, 0), 4)
+        graph.add_edge((0, 1), 2)
+        graph = CompactUndirectedGraph(graph)
+        self.assertEqual(graph.get_cost((0, 2)), 4)
+        self.assertEqual(graph.get_cost((1, 0)), 2)
+        self.assertEqual(list(graph.incident_edges(0)), [(1, 2), (2, 4)])
+        self.assertRaises(ValueError, graph.get_cost, (1, 2))
+        self.assertEqual(CompactUndirectedGraph.from_arrays(*graph.to_arrays()).get_cost((2, 0)), 4)
+
+    def test_float_costs(self):
+        graph = UndirectedGraph(3)
+        graph.add_edge((0, 1), 2)
+        graph.add_edge((1, 2), 0.5)
+        graph = CompactUndirectedGraph(graph)
+        self.assertEqual(graph.to_arrays()[4].typecode, "d")
+        self.assertEqual(graph.get_cost((2, 1)), 0.5)
+
+    def test_arbitrary_labels(self):
+        graph = UndirectedGraph(0)
+        for label in "x", "y", "z":
+            graph.add_vertex(label)
+        graph.add_edge(("x", "z"))
+        graph = CompactUndirectedGraph(graph)
+
+        self.assertEqual(list(graph.edges), [("x", "z")])
+        self.assertEqual(list(graph.neighbours("z")), ["x"])
+        self.assertTrue(graph.are_connected("z", "x"))
+        self.assertFalse(graph.are_connected("z", "w"))
@@ -0,0 +1,98 @@
+import random
+from unittest import TestCase
+from src.algorithms.connected_components import ConnectedComponents
+from src.graphs.undirected_graph import UndirectedGraph
+
+
+class TestConnectedComponents(TestCase):
+    def setUp(self):
+        self.graph = UndirectedGraph(5)
+        self.graph.add_edge((0, 1))
+        self.graph.add_edge((2, 3))
+        self.components = ConnectedComponents(self.graph)
+
+    def tearDown(self):
+        del self.components
+        del self.graph
+
+    def test_components(self):
+        self.assertEqual(self.components.components_count, 3)
+        self.assertTrue(self.components.same_component(0, 1))
+        self.assertFalse(self.components.same_component(1, 2))
+        self.assertEqual(sorted(map(sorted, self.components.get_components())), [[0, 1], [2, 3], [4]])
+        self.assertRaises(ValueError, self.components.same_component, 0, 5)
+
+    def test_add_edge(self):
+        self.components.add_edge((1, 2))
+        self.assertTrue(self.graph.are_connected(1, 2))
+        self.assertEqual(self.components.components_count, 2)
+        self.assertTrue(self.components.same_component(0, 3))
+        self.assertRaises(ValueError, self.components.add_edge, (1, 2))
+        self.assertEqual(self.components.components_count, 2)
+
+    def test_add_edges(self):
+        self.components.add_edges([(1, 2), (3, 4), (0, 4)])
+        self.assertEqual(self.components.components_count, 1)
+        self.assertEqual(self.graph.edges_count, 5)
+
+    def test_failed_add_edges_keeps_inserted_edges(self):
+        self.assertRaises(ValueError, self.components.add_edges, [(1, 2), (3, 4), (0, 1)])
+        self.assertTrue(self.graph.are_connected(3, 4))
+        self.assertEqual(self.components.components_count, 1)
+        self.assertTrue(self.components.same_component(0, 4))
+
+        self.assertRaises(ValueError, self.components.add_edges, [(0, 5)])
+        self.assertEqual(self.components.components_count, 1)
+
+    def test_add_vertex(self):
+        self.components.add_vertex(7)
+        self.assertEqual(self.components.components_count, 4)
+        self.components.add_edge((7, 4))
+        self.assertTrue(self.components.same_component(4, 7))
+        self.assertEqual(self.components.components_count, 3)
+
+    def test_remove(self):
+        self.components.add_edge((1, 2))
+        self.components.remove_edge((0, 1))
+        self.assertFalse(self.components.same_component(0, 1))
+        self.assertTrue(self.components.same_component(1, 3))
+        self.components.remove_vertex(2)
+        self.assertFalse(self.components.same_component(1, 3))
+        self.assertEqual(self.components.components_count, 4)
+
+    def test_recycled_ids(self):
+        self.components.remove_vertex(4)
+        self.components.add_vertex("x")
+        self.assertEqual(self.components.components_count, 3)
+        self.components.add_edge(("x", 3))
+        self.assertTrue(self.components.same_component("x", 2))
+        self.assertFalse(self.components.same_component("x", 0))
+        self.assertEqual(sorted(map(set, self.components.get_components()), key=len), [{0, 1}, {2, 3, "x"}])
+        self.assertRaises(ValueError, self.components.same_component, 4, 0)
+
+    def test_random_against_traversal(self):
+        generator = random.Random(3)
+        graph = UndirectedGraph(40)
+        components = ConnectedComponents(graph)
+        for _ in range(30):
+            start, end = generator.sample(range(40), 2)
+            if not graph.are_connected(start, end):
+                components.add_edge((start, end))
+
+        # Label every vertex with its component by a traversal
+        label = {}
+        for vertex in graph.vertices:
+            if vertex in label:
+                continue
+            label[vertex] = vertex
+            stack = [vertex]
+            while stack:
+                for neighbour in graph.neighbours(stack.pop()):
+                    if neighbour not in label:
+                        label[neighbour] = vertex
+                        stack.append(neighbour)
+
+        self.assertEqual(components.components_count, len(set(label.values())))
+        for start in range(40):
+            for end in range(40):
+                self.assertEqual(components.same_component(start, end), label[start] == label[end])
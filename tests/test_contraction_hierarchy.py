@@ -0,0 +1,77 @@
+import os
+import random
+import tempfile
+from unittest import TestCase
+from src.algorithms.contraction_hierarchy import ContractionHierarchy
+from src.algorithms.dijkstra import Dijkstra
+from src.graphs.directed_graph import DirectedGraph
+from src.services.directed_graph_service import DirectedGraphService
+
+
+class TestContractionHierarchy(TestCase):
+    def setUp(self):
+        self.graph = DirectedGraphService.generate_grid_graph(6, 6, seed=3)
+        self.hierarchy = ContractionHierarchy(self.graph)
+
+    def tearDown(self):
+        del self.hierarchy
+        del self.graph
+
+    def assert_same_walks(self, graph, hierarchy):
+        dijkstra = Dijkstra(graph)
+
+        for source in graph.vertices:
+            for destination in graph.vertices:
+                walk, cost = hierarchy.get_minimum_cost_walk(source, destination)
+                self.assertEqual(cost, dijkstra.get_minimum_cost_walk(source, destination)[1])
+                if walk is not None:
+                    self.assertEqual((walk[0], walk[-1]), (source, destination))
+                    self.assertEqual(sum(graph.get_cost(edge) for edge in zip(walk, walk[1:])), cost)
+
+    def test_get_minimum_cost_walk(self):
+        self.assert_same_walks(self.graph, self.hierarchy)
+        self.assertGreater(self.hierarchy.shortcuts_count, 0)
+        self.assertRaises(ValueError, self.hierarchy.get_minimum_cost_walk, 0, 36)
+
+    def test_random_graph(self):
+        generator = random.Random(8)
+        graph = DirectedGraph(0)
+        for vertex in range(30):
+            graph.add_vertex(vertex * 3)
+        for _ in range(90):
+            start, end = generator.randrange(30) * 3, generator.randrange(30) * 3
+            if not graph.are_connected(start, end):
+                graph.add_edge((start, end), generator.randint(0, 10))
+
+        self.assert_same_walks(graph, ContractionHierarchy(graph, witness_limit=4))
+
+    def test_save_and_load(self):
+        handle, file_path = tempfile.mkstemp()
+        os.close(handle)
+        try:
+            self.hierarchy.save(file_path)
+            hierarchy = ContractionHierarchy.load(file_path)
+        finally:
+            os.remove(file_path)
+
+        self.assert_same_walks(self.graph, hierarchy)
+        self.assertEqual(hierarchy.shortcuts_count, self.hierarchy.shortcuts_count)
+
+    def test_negative_cost(self):
+        graph = DirectedGraph(2)
+        graph.add_edge((0, 1), -1)
+        self.assertRaises(ValueError, ContractionHierarchy, graph)
+
+    def test_arbitrary_labels(self):
+        graph = DirectedGraph(0)
+        for vertex in "abcd":
+            graph.add_vertex(vertex)
+        graph.add_edge(("a", "b"), 1)
+        graph.add_edge(("b", "c"), 1)
+        graph.add_edge(("a", "c"), 5)
+        graph.add_edge(("c", "d"), 1)
+        hierarchy = ContractionHierarchy(graph)
+
+        self.assertEqual(hierarchy.get_minimum_cost_walk("a", "d"), (["a", "b", "c", "d"], 3))
+        self.assertRaises(ValueError, hierarchy.get_minimum_cost_walk, "a", "e")
+        self.assertRaises(ValueError, hierarchy.save, os.devnull)
@@ -0,0 +1,141 @@
+import random
+from unittest import TestCase
+from src.algorithms.dijkstra import Dijkstra
+from src.graphs.compact_directed_graph import CompactDirectedGraph
+from src.graphs.directed_graph import DirectedGraph
+
+
+class TestDijkstra(TestCase):
+    def setUp(self):
+        self.graph = DirectedGraph(5)
+        self.graph.add_edge((0, 1), 3)
+        self.graph.add_edge((0, 2), 2)
+        self.graph.add_edge((1, 3), 7)
+        self.graph.add_edge((2, 3), 5)
+        self.graph.add_edge((2, 1), 0)
+        self.dijkstra = Dijkstra(self.graph)
+
+    def tearDown(self):
+        del self.dijkstra
+        del self.graph
+
+    def test_get_minimum_cost_walk(self):
+        self.assertEqual(self.dijkstra.get_minimum_cost_walk(0, 3), ([0, 2, 3], 7))
+        self.assertEqual(self.dijkstra.get_minimum_cost_walk(0, 1), ([0, 2, 1], 2))
+        self.assertEqual(self.dijkstra.get_minimum_cost_walk(0, 0), ([0], 0))
+
+    def test_get_minimum_cost_walk_unreachable(self):
+        self.assertEqual(self.dijkstra.get_minimum_cost_walk(3, 0), (None, float('inf')))
+        self.assertEqual(self.dijkstra.get_minimum_cost_walk(0, 4), (None, float('inf')))
+
+    def test_get_minimum_cost_walk_invalid_vertex(self):
+        self.assertRaises(ValueError, self.dijkstra.get_minimum_cost_walk, 0, 5)
+        self.assertRaises(ValueError, self.dijkstra.get_minimum_cost_walk, 5, 0)
+
+    def test_get_shortest_path_tree(self):
+        dist, prev = self.dijkstra.get_shortest_path_tree(0)
+        self.assertEqual(dist, {0: 0, 1: 2, 2: 2, 3: 7})
+        self.assertEqual(prev, {1: 2, 2: 0, 3: 2})
+
+    def test_compact_graph(self):
+        dijkstra = Dijkstra(CompactDirectedGraph(self.graph))
+        self.assertEqual(dijkstra.get_minimum_cost_walk(0, 3), ([0, 2, 3], 7))
+
+    def test_get_minimum_cost_walk_bidirectional(self):
+        self.assertEqual(self.dijkstra.get_minimum_cost_walk_bidirectional(0, 3), ([0, 2, 3], 7))
+        self.assertEqual(self.dijkstra.get_minimum_cost_walk_bidirectional(0, 0), ([0], 0))
+        self.assertEqual(self.dijkstra.get_minimum_cost_walk_bidirectional(3, 0), (None, float('inf')))
+        self.assertRaises(ValueError, self.dijkstra.get_minimum_cost_walk_bidirectional, 0, 5)
+
+    def test_get_minimum_cost_walk_a_star(self):
+        def heuristic(vertex, destination):
+            return 0
+
+        self.assertEqual(self.dijkstra.get_minimum_cost_walk_a_star(0, 3, heuristic), ([0, 2, 3], 7))
+        self.assertEqual(self.dijkstra.get_minimum_cost_walk_a_star(3, 0, heuristic), (None, float('inf')))
+        self.assertRaises(ValueError, self.dijkstra.get_minimum_cost_walk_a_star, 0, 5, heuristic)
+
+    def test_modes_agree_on_random_graphs(self):
+        generator = random.Random(7)
+        for _ in range(20):
+            graph = DirectedGraph(30)
+            for _ in range(90):
+                start, end = generator.randrange(30), generator.randrange(30)
+                if start != end and not graph.are_connected(start, end):
+                    graph.add_edge((start, end), generator.randint(1, 10))
+
+            dijkstra = Dijkstra(graph)
+            for source, destination in [(0, 29), (5, 17), (12, 3)]:
+                _, cost = dijkstra.get_minimum_cost_walk(source, destination)
+                walk, bidirectional_cost = dijkstra.get_minimum_cost_walk_bidirectional(source, destination)
+                self.assertEqual(bidirectional_cost, cost)
+                if walk is not None:
+                    self.assertEqual(sum(graph.get_cost(edge) for edge in zip(walk, walk[1:])), cost)
+
+                # Every edge costs at least 1, so estimating 1 for every vertex but the destination is admissible
+                _, a_star_cost = dijkstra.get_minimum_cost_walk_a_star(
+                    source, destination, lambda vertex, target: 0 if vertex == target else 1)
+                self.assertEqual(a_star_cost, cost)
+
+    def test_get_shortest_path_trees(self):
+        trees = [self.dijkstra.get_shortest_path_tree(source) for source in range(5)]
+        self.assertEqual(list(self.dijkstra.get_shortest_path_trees(range(5), max_workers=1)), trees)
+        self.assertEqual(list(self.dijkstra.get_shortest_path_trees(range(5), max_workers=2)), trees)
+        self.assertRaises(ValueError, self.dijkstra.get_shortest_path_trees, [0, 5])
+
+    def test_get_nearest_sources(self):
+        dist, nearest = self.dijkstra.get_nearest_sources([1, 2])
+        self.assertEqual(dist, {1: 0, 2: 0, 3: 5})
+        self.assertEqual(nearest, {1: 1, 2: 2, 3: 2})
+        self.assertEqual(self.dijkstra.get_nearest_sources([]), ({}, {}))
+
+    def test_get_k_minimum_cost_paths(self):
+        paths = self.dijkstra.get_k_minimum_cost_paths(0, 3)
+        self.assertEqual(next(paths), ([0, 2, 3], 7))
+        self.assertEqual(list(paths), [([0, 2, 1, 3], 9), ([0, 1, 3], 10)])
+        self.assertEqual(list(self.dijkstra.get_k_minimum_cost_paths(0, 3, 2)), [([0, 2, 3], 7), ([0, 2, 1, 3], 9)])
+        self.assertEqual(list(self.dijkstra.get_k_minimum_cost_paths(0, 0)), [([0], 0)])
+        self.assertEqual(list(self.dijkstra.get_k_minimum_cost_paths(3, 0)), [])
+        self.assertRaises(ValueError, self.dijkstra.get_k_minimum_cost_paths, 0, 5)
+
+    def test_mixed_vertex_labels(self):
+        graph = DirectedGraph(0)
+        for vertex in [0, "a", 1, "b", "c"]:
+            graph.add_vertex(vertex)
+        for edge in [(0, "a"), (0, 1), ("a", "b"), (1, "b"), ("a", 1), (1, "a"), ("b", "c")]:
+            graph.add_edge(edge, 1)
+
+        dijkstra = Dijkstra(graph)
+        self.assertEqual(dijkstra.get_shortest_path_tree(0)[0], {0: 0, "a": 1, 1: 1, "b": 2, "c": 3})
+        self.assertEqual(dijkstra.get_nearest_sources(["a", 1])[0], {"a": 0, 1: 0, "b": 1, "c": 2})
+        self.assertEqual(dijkstra.get_minimum_cost_walk(0, "c")[1], 3)
+        self.assertEqual(dijkstra.get_minimum_cost_walk_bidirectional(0, "c")[1], 3)
+        self.assertEqual(dijkstra.get_minimum_cost_walk_a_star(0, "c", lambda vertex, destination: 0)[1], 3)
+        self.assertEqual([cost for _, cost in dijkstra.get_k_minimum_cost_paths(0, "c")], [3, 3, 4, 4])
+
+    def test_get_k_minimum_cost_paths_random(self):
+        generator = random.Random(7)
+        for _ in range(20):
+            graph = DirectedGraph(7)
+            for start in range(7):
+                for end in range(7):
+                    if start != end and generator.random() < 0.4:
+                        graph.add_edge((start, end), generator.randint(0, 9))
+
+            # Enumerate every path from 0 to 6
+            costs = []
+            stack = [([0], 0)]
+            while stack:
+                path, cost = stack.pop()
+                if path[-1] == 6:
+                    costs.append(cost)
+                    continue
+                for neighbour, edge_cost in graph.outbound_edges(path[-1]):
+                    if neighbour not in path:
+                        stack.append((path + [neighbour], cost + edge_cost))
+
+            paths = list(Dijkstra(graph).get_k_minimum_cost_paths(0, 6))
+            self.assertEqual([cost for _, cost in paths], sorted(costs))
+            self.assertEqual(len({tuple(path) for path, _ in paths}), len(paths))
+            for path, cost in paths:
+                self.assertEqual(sum(graph.get_cost(edge) for edge in zip(path, path[1:])), cost)
@@ -35,6 +35,19 @@ class TestDirectedGraph(TestCase):
         self.assertRaises(ValueError, self.graph.add_edge, (0, 1), 1)
         self.assertRaises(ValueError, self.graph.add_edge, (0, 4), 1)
 
+    def test_failed_add_edges_keeps_version(self):
+        self.graph.add_edge((0, 1), 1)
+        version = self.graph.version
+
+        self.assertRaises(ValueError, self.graph.add_edges, [((0, 1), 2)])
+        self.assertRaises(ValueError, self.graph.add_edges, [((0, 5), 2)])
+        self.graph.add_edges([])
+        self.assertEqual(self.graph.version, version)
+
+        self.assertRaises(ValueError, self.graph.add_edges, [((1, 2), 2), ((0, 1), 2)])
+        self.assertTrue(self.graph.are_connected(1, 2))
+        self.assertGreater(self.graph.version, version)
+
     def test_remove_edge(self):
         self.graph.add_edge((0, 1), 1)
         self.assertTrue(self.graph.are_connected(0, 1))
@@ -45,6 +58,18 @@ class TestDirectedGraph(TestCase):
         self.assertRaises(ValueError, self.graph.remove_edge, (0, 1))
         self.assertRaises(ValueError, self.graph.remove_edge, (0, 4))
 
+    def test_remove_edges(self):
+        self.graph.add_edge((0, 1), 1)
+        self.graph.add_edge((1, 2), 1)
+        self.graph.add_edge((2, 0), 1)
+
+        self.graph.remove_edges([(0, 1), (2, 0)])
+        self.assertEqual(list(self.graph.edges), [(1, 2)])
+        self.assertEqual(self.graph.edges_count, 1)
+        self.assertEqual(list(self.graph.inbound_neighbours(0)), [])
+
+        self.assertRaises(ValueError, self.graph.remove_edges, [(0, 1)])
+
     def test_add_vertex(self):
         self.graph.add_vertex(10)
         self.assertEqual(self.graph.vertices_count, 4)
@@ -65,6 +90,15 @@ class TestDirectedGraph(TestCase):
         self.assertRaises(ValueError, self.graph.remove_vertex, 1)
         self.assertRaises(ValueError, self.graph.remove_vertex, 10)
 
+    def test_remove_vertex_keeps_other_vertices_valid(self):
+        self.graph.add_edge((1, 2), 1)
+        self.graph.remove_vertex(0)
+
+        self.assertEqual(list(self.graph.vertices), [1, 2])
+        self.assertEqual(self.graph.out_degree(2), 0)
+        self.assertEqual(self.graph.in_degree(2), 1)
+        self.assertEqual(self.graph.edges_count, 1)
+
     def test_are_connected(self):
         self.graph.add_edge((0, 1), 1)
         self.assertTrue(self.graph.are_connected(0, 1))
@@ -130,3 +164,45 @@ class TestDirectedGraph(TestCase):
 
         self.assertFalse(self.graph.are_connected(0, 1))
         self.assertFalse(self.graph.are_connected(1, 2))
+
+    def test_copy_does_not_change_original(self):
+        self.graph.add_edge((0, 1), 1)
+        self.graph.add_edge((1, 2), 2)
+        copy = self.graph.copy()
+
+        copy.set_cost((0, 1), 5)
+        copy.remove_edge((1, 2))
+        copy.add_vertex(3)
+        copy.add_edges([((3, 0), 4)])
+        copy.remove_vertex(1)
+
+        self.assertEqual(sorted(self.graph.edges), [(0, 1), (1, 2)])
+        self.assertEqual(self.graph.get_cost((0, 1)), 1)
+        self.assertEqual(self.graph.vertices_count, 3)
+        self.assertEqual(list(self.graph.inbound_edges(0)), [])
+        self.assertEqual(sorted(copy.edges), [(3, 0)])
+        self.assertEqual(copy.edges_count, 1)
+
+    def test_original_does_not_change_copies(self):
+        self.graph.add_edge((0, 1), 1)
+        first = self.graph.copy()
+        self.graph.add_edge((1, 2), 2)
+        second = self.graph.copy()
+        self.graph.remove_edge((0, 1))
+        self.graph.remove_vertex(2)
+
+        self.assertEqual(sorted(first.edges), [(0, 1)])
+        self.assertEqual(sorted(second.edges), [(0, 1), (1, 2)])
+        self.assertEqual(list(second.inbound_edges(2)), [(1, 2)])
+        self.assertEqual(list(self.graph.edges), [])
+        self.assertEqual(second.copy().edges_count, 2)
+
+    def test_from_edges(self):
+        graph = DirectedGraph.from_edges(3, [((0, 1), 4), ((1, 2), 5), ((2, 2), 6)])
+        self.assertEqual(graph.edges_count, 3)
+        self.assertEqual(graph.get_cost((1, 2)), 5)
+        self.assertEqual(list(graph.inbound_edges(2)), [(1, 5), (2, 6)])
+
+        self.assertRaises(ValueError, DirectedGraph.from_edges, 3, [((0, 1), 4), ((0, 1), 5)])
+        self.assertRaises(ValueError, DirectedGraph.from_edges, 3, [((0, 3), 4)])
+        self.assertRaises(ValueError, DirectedGraph.from_edges, 3, [((-1, 0), 4)])
@@ -0,0 +1,56 @@
+import os
+import tempfile
+from unittest import TestCase
+from src.graphs.directed_graph import DirectedGraph
+from src.services.directed_graph_service import DirectedGraphService
+
+
+class TestDirectedGraphService(TestCase):
+    def setUp(self):
+        self.graph = DirectedGraph(50)
+        for start in range(50):
+            for end in (start * 7 + 3) % 50, (start * 11 + 5) % 50:
+                if not self.graph.are_connected(start, end):
+                    self.graph.add_edge((start, end), start - end)
+
+        handle, self.file_path = tempfile.mkstemp()
+        os.close(handle)
+        DirectedGraphService.write_graph_to_file(self.graph, self.file_path)
+
+        handle, self.binary_file_path = tempfile.mkstemp()
+        os.close(handle)
+        DirectedGraphService.write_graph_to_binary_file(self.graph, self.binary_file_path)
+
+    def tearDown(self):
+        os.remove(self.file_path)
+        os.remove(self.binary_file_path)
+        del self.graph
+
+    def test_read_graph_from_file(self):
+        graph = DirectedGraphService.read_graph_from_file(self.file_path)
+        self.assertEqual(graph.vertices_count, self.graph.vertices_count)
+        self.assertEqual(sorted(graph.edges), sorted(self.graph.edges))
+        for edge in self.graph.edges:
+            self.assertEqual(graph.get_cost(edge), self.graph.get_cost(edge))
+
+    def test_read_edge_batches(self):
+        self.assertEqual(DirectedGraphService.read_graph_header(self.file_path), (50, self.graph.edges_count))
+
+        edges = [edge for batch in DirectedGraphService.read_edge_batches(self.file_path) for edge in batch]
+        self.assertEqual(edges, [(edge, self.graph.get_cost(edge)) for edge in self.graph.edges])
+
+    def test_read_graph_from_binary_file(self):
+        graph = DirectedGraphService.read_graph_from_binary_file(self.binary_file_path)
+        self.assertEqual(graph.vertices_count, self.graph.vertices_count)
+        self.assertEqual(sorted(graph.edges), sorted(self.graph.edges))
+        for vertex in self.graph.vertices:
+            self.assertEqual(sorted(graph.outbound_edges(vertex)), sorted(self.graph.outbound_edges(vertex)))
+            self.assertEqual(sorted(graph.inbound_edges(vertex)), sorted(self.graph.inbound_edges(vertex)))
+
+    def test_read_graph_from_invalid_binary_file(self):
+        self.assertRaises(ValueError, DirectedGraphService.read_graph_from_binary_file, self.file_path)
+
+    def test_write_graph_with_arbitrary_labels_to_binary_file(self):
+        graph = DirectedGraph(0)
+        graph.add_vertex("a")
+        self.assertRaises(ValueError, DirectedGraphService.write_graph_to_binary_file, graph, self.binary_file_path)
@@ -0,0 +1,34 @@
+from unittest import TestCase
+from src.algorithms.disjoint_set import DisjointSet
+
+
+class TestDisjointSet(TestCase):
+    def setUp(self):
+        self.disjoint_set = DisjointSet(5)
+
+    def tearDown(self):
+        del self.disjoint_set
+
+    def test_union(self):
+        self.assertEqual(self.disjoint_set.sets_count, 5)
+        self.assertTrue(self.disjoint_set.union(0, 1))
+        self.assertTrue(self.disjoint_set.union(2, 3))
+        self.assertTrue(self.disjoint_set.union(1, 3))
+        self.assertFalse(self.disjoint_set.union(0, 2))
+        self.assertEqual(self.disjoint_set.sets_count, 2)
+        self.assertEqual(self.disjoint_set.find(0), self.disjoint_set.find(3))
+        self.assertNotEqual(self.disjoint_set.find(0), self.disjoint_set.find(4))
+
+    def test_add(self):
+        self.assertEqual(self.disjoint_set.add(), 5)
+        self.assertEqual(len(self.disjoint_set), 6)
+        self.assertEqual(self.disjoint_set.sets_count, 6)
+        self.assertTrue(self.disjoint_set.union(5, 4))
+        self.assertEqual(self.disjoint_set.find(5), self.disjoint_set.find(4))
+
+    def test_long_chain(self):
+        disjoint_set = DisjointSet(100000)
+        for element in range(1, 100000):
+            disjoint_set.union(element - 1, element)
+        self.assertEqual(disjoint_set.sets_count, 1)
+        self.assertEqual(disjoint_set.find(99999), disjoint_set.find(0))
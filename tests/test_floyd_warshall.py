@@ -0,0 +1,61 @@
+import random
+from unittest import TestCase
+from src.algorithms.dijkstra import Dijkstra
+from src.algorithms.floyd_warshall import FloydWarshall
+from src.graphs.directed_graph import DirectedGraph
+
+
+class TestFloydWarshall(TestCase):
+    def setUp(self):
+        self.graph = DirectedGraph(4)
+        self.graph.add_edge((0, 1), 3)
+        self.graph.add_edge((0, 2), 2)
+        self.graph.add_edge((1, 3), 7)
+        self.graph.add_edge((2, 3), 5)
+        self.floyd_warshall = FloydWarshall(self.graph)
+
+    def tearDown(self):
+        del self.floyd_warshall
+        del self.graph
+
+    def test_get_shortest_path_matrix(self):
+        cost, next_vertex = self.floyd_warshall.get_shortest_path_matrix()
+        infinity = float('inf')
+
+        self.assertEqual([list(row) for row in cost], [
+            [0, 3, 2, 7],
+            [infinity, 0, infinity, 7],
+            [infinity, infinity, 0, 5],
+            [infinity, infinity, infinity, 0],
+        ])
+        self.assertEqual(list(next_vertex[0]), [-1, 1, 2, 2])
+        self.assertEqual(list(next_vertex[3]), [-1, -1, -1, -1])
+
+    def test_get_minimum_cost_walk(self):
+        self.assertEqual(self.floyd_warshall.get_minimum_cost_walk(0, 3), ([0, 2, 3], 7))
+        self.assertEqual(self.floyd_warshall.get_minimum_cost_walk(3, 0), (None, float('inf')))
+        self.assertRaises(ValueError, self.floyd_warshall.get_minimum_cost_walk, 0, 4)
+
+    def test_negative_cycle(self):
+        self.assertEqual(self.floyd_warshall.get_negative_cycle_vertices(), [])
+
+        self.graph.add_edge((3, 0), -10)
+        floyd_warshall = FloydWarshall(self.graph)
+        self.assertEqual(floyd_warshall.get_negative_cycle_vertices(), [0, 2, 3])
+        self.assertRaises(ValueError, floyd_warshall.get_minimum_cost_walk, 0, 3)
+
+    def test_agrees_with_dijkstra(self):
+        generator = random.Random(3)
+        graph = DirectedGraph(25)
+        for _ in range(80):
+            start, end = generator.randrange(25), generator.randrange(25)
+            if start != end and not graph.are_connected(start, end):
+                graph.add_edge((start, end), generator.randint(1, 20))
+
+        floyd_warshall, dijkstra = FloydWarshall(graph), Dijkstra(graph)
+        for source in range(25):
+            for destination in range(25):
+                walk, cost = floyd_warshall.get_minimum_cost_walk(source, destination)
+                self.assertEqual(cost, dijkstra.get_minimum_cost_walk(source, destination)[1])
+                if walk is not None:
+                    self.assertEqual(sum(graph.get_cost(edge) for edge in zip(walk, walk[1:])), cost)
@@ -0,0 +1,104 @@
+import random
+from unittest import TestCase
+from src.algorithms.floyd_warshall import FloydWarshall
+from src.algorithms.incremental_all_pairs_shortest_paths import IncrementalAllPairsShortestPaths
+from src.algorithms.johnson import Johnson
+from src.graphs.directed_graph import DirectedGraph
+
+
+class TestIncrementalAllPairsShortestPaths(TestCase):
+    def setUp(self):
+        self.graph = DirectedGraph(4)
+        self.graph.add_edge((0, 1), 1)
+        self.graph.add_edge((1, 2), 1)
+        self.graph.add_edge((0, 2), 5)
+        self.graph.add_edge((2, 3), 1)
+        self.paths = IncrementalAllPairsShortestPaths(self.graph)
+
+    def tearDown(self):
+        del self.paths
+        del self.graph
+
+    def test_add_edge(self):
+        self.paths.add_edge((0, 3), 1)
+        self.assertEqual(self.paths.get_minimum_cost_walk(0, 3), ([0, 3], 1))
+        self.assertEqual(self.paths.get_minimum_cost_walk(3, 0), (None, float('inf')))
+
+        self.paths.add_edge((3, 0), 2)
+        self.assertEqual(self.paths.get_minimum_cost_walk(2, 1), ([2, 3, 0, 1], 4))
+        self.assertEqual(self.paths.recalculations, 0)
+
+    def test_set_cost(self):
+        self.paths.set_cost((1, 2), 10)
+        self.assertEqual(self.paths.get_minimum_cost_walk(0, 3), ([0, 2, 3], 6))
+
+        self.paths.set_cost((0, 2), 1)
+        self.assertEqual(self.paths.get_minimum_cost_walk(0, 2), ([0, 2], 1))
+        self.assertEqual(self.paths.recalculations, 0)
+
+    def test_remove_edge(self):
+        self.paths.remove_edge((1, 2))
+        self.assertEqual(self.paths.get_minimum_cost_walk(0, 3), ([0, 2, 3], 6))
+        self.assertEqual(self.paths.get_minimum_cost_walk(1, 3), (None, float('inf')))
+        self.assertFalse(self.graph.are_connected(1, 2))
+
+    def test_negative_cost_cycle(self):
+        self.paths.add_edge((3, 0), -4)
+        self.assertRaises(ValueError, self.paths.get_minimum_cost_walk, 0, 3)
+
+        self.paths.set_cost((3, 0), 0)
+        self.assertEqual(self.paths.get_minimum_cost_walk(3, 2), ([3, 0, 1, 2], 2))
+
+    def test_negative_cost_cycle_johnson(self):
+        paths = IncrementalAllPairsShortestPaths(self.graph, Johnson(self.graph, max_workers=1))
+        paths.add_edge((2, 0), -5)
+        self.assertRaises(ValueError, paths.get_minimum_cost_walk, 0, 3)
+
+        paths.set_cost((2, 0), 5)
+        self.assertEqual(paths.get_minimum_cost_walk(1, 0), ([1, 2, 0], 6))
+        cost, _ = FloydWarshall(self.graph).get_shortest_path_matrix()
+        self.assertEqual(paths.get_shortest_path_matrix()[0], cost)
+
+    def test_failed_update_leaves_graph_unchanged(self):
+        class FailingFloydWarshall(FloydWarshall):
+            fail = False
+
+            def _relax_all_pairs(self, graph, vertices, cost, next_vertex):
+                if self.fail:
+                    raise ValueError("Negative cost cycle")
+                super()._relax_all_pairs(graph, vertices, cost, next_vertex)
+
+        floyd_warshall = FailingFloydWarshall(self.graph)
+        paths = IncrementalAllPairsShortestPaths(self.graph, floyd_warshall, repair_limit=0)
+        floyd_warshall.fail = True
+
+        self.assertRaises(ValueError, paths.add_edge, (3, 0), -4)
+        self.assertFalse(self.graph.are_connected(3, 0))
+        self.assertRaises(ValueError, paths.set_cost, (2, 3), 10)
+        self.assertEqual(self.graph.get_cost((2, 3)), 1)
+        self.assertRaises(ValueError, paths.remove_edge, (1, 2))
+        self.assertEqual(self.graph.get_cost((1, 2)), 1)
+        self.assertEqual(paths.get_minimum_cost_walk(0, 3), ([0, 1, 2, 3], 3))
+
+    def test_random_changes(self):
+        generator = random.Random(5)
+        graph = DirectedGraph(15)
+        for _ in range(40):
+            start, end = generator.randrange(15), generator.randrange(15)
+            if not graph.are_connected(start, end):
+                graph.add_edge((start, end), generator.randint(0, 9))
+        paths = IncrementalAllPairsShortestPaths(graph, repair_limit=1)
+
+        for _ in range(200):
+            start, end = generator.randrange(15), generator.randrange(15)
+            if not graph.are_connected(start, end):
+                paths.add_edge((start, end), generator.randint(0, 9))
+            elif generator.random() < 0.3:
+                paths.remove_edge((start, end))
+            else:
+                paths.set_cost((start, end), generator.randint(0, 9))
+
+            cost, _ = FloydWarshall(graph).get_shortest_path_matrix()
+            self.assertEqual(paths.get_shortest_path_matrix()[0], cost)
+
+        self.assertEqual(paths.recalculations, 0)
@@ -0,0 +1,72 @@
+import random
+from unittest import TestCase
+from src.algorithms.incremental_condensation import IncrementalCondensation
+from src.algorithms.tarjan import Tarjan
+from src.graphs.directed_graph import DirectedGraph
+
+
+class TestIncrementalCondensation(TestCase):
+    def setUp(self):
+        self.graph = DirectedGraph(5)
+        self.graph.add_edge((0, 1), 4)
+        self.graph.add_edge((1, 2), 1)
+        self.graph.add_edge((2, 1), 1)
+        self.condensation = IncrementalCondensation(self.graph)
+
+    def tearDown(self):
+        del self.condensation
+        del self.graph
+
+    def test_add_edge_along_order(self):
+        self.condensation.add_edge((2, 3), 2)
+        self.assertEqual(self.condensation.components_count, 4)
+        self.assertTrue(self.graph.are_connected(2, 3))
+        self.assertFalse(self.condensation.same_component(2, 3))
+
+    def test_add_edge_closing_cycle(self):
+        self.condensation.add_edge((2, 0), 1)
+        self.assertEqual(self.condensation.components_count, 3)
+        self.assertTrue(self.condensation.same_component(0, 2))
+        self.assertFalse(self.condensation.same_component(0, 3))
+
+    def test_add_vertex(self):
+        self.condensation.add_vertex(5)
+        self.condensation.add_edge((5, 0), 1)
+        self.condensation.add_edge((1, 5), 1)
+        self.assertTrue(self.condensation.same_component(0, 5))
+        self.assertRaises(ValueError, self.condensation.same_component, 0, 6)
+
+    def test_get_condensation(self):
+        self.condensation.add_edge((3, 0), 7)
+        self.condensation.add_edge((3, 2), 5)
+        condensation, component, order = self.condensation.get_condensation()
+
+        self.assertEqual(condensation.vertices_count, 4)
+        self.assertEqual(component[1], component[2])
+        self.assertEqual(condensation.get_cost((component[3], component[1])), 5)
+        for start, end in condensation.edges:
+            self.assertLess(order.index(start), order.index(end))
+
+    def test_agrees_with_tarjan(self):
+        generator = random.Random(17)
+        for _ in range(20):
+            graph = DirectedGraph(25)
+            condensation = IncrementalCondensation(graph)
+
+            for _ in range(60):
+                start, end = generator.randrange(25), generator.randrange(25)
+                if graph.are_connected(start, end):
+                    continue
+                condensation.add_edge((start, end), generator.randint(1, 9))
+
+                expected = {frozenset(component) for component in Tarjan(graph).get_strongly_connected_components()}
+                components = condensation.get_strongly_connected_components()
+                self.assertEqual({frozenset(component) for component in components}, expected)
+
+                # Every edge between components goes forward in the topological order
+                dag, component, order = condensation.get_condensation()
+                rank = {component_id: index for index, component_id in enumerate(order)}
+                for edge_start, edge_end in graph.edges:
+                    if component[edge_start] != component[edge_end]:
+                        self.assertLess(rank[component[edge_start]], rank[component[edge_end]])
+                        self.assertTrue(dag.are_connected(component[edge_start], component[edge_end]))
@@ -0,0 +1,48 @@
+import random
+from unittest import TestCase
+from src.algorithms.floyd_warshall import FloydWarshall
+from src.algorithms.johnson import Johnson
+from src.graphs.directed_graph import DirectedGraph
+
+
+class TestJohnson(TestCase):
+    def setUp(self):
+        generator = random.Random(11)
+        self.graph = DirectedGraph(30)
+        for _ in range(100):
+            start, end = generator.randrange(30), generator.randrange(30)
+            if start != end and not self.graph.are_connected(start, end):
+                # Negative costs only on edges going forward keep the graph free of negative cost cycles
+                self.graph.add_edge((start, end), generator.randint(-5 if start < end else 1, 20))
+
+    def tearDown(self):
+        del self.graph
+
+    def test_get_shortest_path_matrix(self):
+        cost, _ = FloydWarshall(self.graph).get_shortest_path_matrix()
+        self.assertEqual(Johnson(self.graph, max_workers=1).get_shortest_path_matrix()[0], cost)
+        self.assertEqual(Johnson(self.graph, max_workers=2).get_shortest_path_matrix()[0], cost)
+
+    def test_get_minimum_cost_walk(self):
+        floyd_warshall, johnson = FloydWarshall(self.graph), Johnson(self.graph, max_workers=2)
+
+        for source in range(30):
+            for destination in range(30):
+                walk, cost = johnson.get_minimum_cost_walk(source, destination)
+                self.assertEqual(cost, floyd_warshall.get_minimum_cost_walk(source, destination)[1])
+                if walk is not None:
+                    self.assertEqual(walk[0], source)
+                    self.assertEqual(walk[-1], destination)
+                    self.assertEqual(sum(self.graph.get_cost(edge) for edge in zip(walk, walk[1:])), cost)
+
+    def test_negative_cycle(self):
+        graph = DirectedGraph(3)
+        graph.add_edge((0, 1), 1)
+        graph.add_edge((1, 2), -3)
+        graph.add_edge((2, 0), 1)
+
+        johnson = Johnson(graph, max_workers=1)
+        cost, _ = FloydWarshall(graph).get_shortest_path_matrix()
+        self.assertEqual(johnson.get_shortest_path_matrix()[0], cost)
+        self.assertEqual(johnson.get_negative_cycle_vertices(), [0, 1, 2])
+        self.assertRaises(ValueError, johnson.get_minimum_cost_walk, 0, 2)
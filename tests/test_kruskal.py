@@ -0,0 +1,68 @@
+import random
+from unittest import TestCase
+from src.algorithms.kruskal import Kruskal
+from src.graphs.compact_undirected_graph import CompactUndirectedGraph
+from src.graphs.undirected_graph import UndirectedGraph
+
+
+class TestKruskal(TestCase):
+    def setUp(self):
+        self.graph = UndirectedGraph(6)
+        self.graph.add_edge((0, 1), 4)
+        self.graph.add_edge((0, 2), 1)
+        self.graph.add_edge((1, 2), 2)
+        self.graph.add_edge((1, 3), 5)
+        self.graph.add_edge((2, 3), 8)
+        self.graph.add_edge((4, 5), 3)
+        self.kruskal = Kruskal(self.graph)
+
+    def tearDown(self):
+        del self.kruskal
+        del self.graph
+
+    def test_get_minimum_spanning_tree(self):
+        tree, cost = self.kruskal.get_minimum_spanning_tree()
+        self.assertEqual(cost, 11)
+        self.assertEqual(sorted(map(sorted, tree)), [[0, 2], [1, 2], [1, 3], [4, 5]])
+
+    def test_get_minimum_spanning_tree_compact(self):
+        tree, cost = Kruskal(CompactUndirectedGraph(self.graph)).get_minimum_spanning_tree()
+        self.assertEqual(cost, 11)
+        self.assertEqual(len(tree), 4)
+
+    def test_get_minimum_spanning_tree_empty(self):
+        self.assertEqual(Kruskal(UndirectedGraph(3)).get_minimum_spanning_tree(), ([], 0))
+
+    def test_get_minimum_spanning_tree_random(self):
+        generator = random.Random(5)
+        for _ in range(20):
+            graph = UndirectedGraph(10)
+            for start in range(10):
+                for end in range(start + 1, 10):
+                    if generator.random() < 0.3:
+                        graph.add_edge((start, end), generator.randint(-5, 20))
+
+            tree, cost = Kruskal(graph).get_minimum_spanning_tree()
+            self.assertEqual(cost, sum(graph.get_cost(edge) for edge in tree))
+            self.assertEqual(cost, self.__get_reverse_delete_cost(graph))
+
+    @staticmethod
+    def __get_reverse_delete_cost(graph):
+        # Drop the edges from the most expensive one down, unless that would disconnect their ends
+        edges = sorted(graph.edges, key=graph.get_cost, reverse=True)
+        for edge in list(edges):
+            edges.remove(edge)
+
+            reached, stack = {edge[0]}, [edge[0]]
+            while stack:
+                vertex = stack.pop()
+                for start, end in edges:
+                    for neighbour in (end,) if start == vertex else (start,) if end == vertex else ():
+                        if neighbour not in reached:
+                            reached.add(neighbour)
+                            stack.append(neighbour)
+
+            if edge[1] not in reached:
+                edges.append(edge)
+
+        return sum(map(graph.get_cost, edges))
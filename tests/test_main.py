@@ -0,0 +1,40 @@
+import io
+import json
+import os
+import tempfile
+from contextlib import redirect_stdout
+from unittest import TestCase
+from src.main import main
+
+
+class TestMain(TestCase):
+    def setUp(self):
+        handle, self.graph_file_path = tempfile.mkstemp()
+        with os.fdopen(handle, "w") as output_file:
+            output_file.write("4 4\n0 1 3\n0 2 2\n1 3 7\n2 3 5\n")
+
+        handle, self.queries_file_path = tempfile.mkstemp()
+        with os.fdopen(handle, "w") as output_file:
+            output_file.write("0 3\nfoo\n\n3 0\n0 1 2\n0 x\n--1 2\n\u00b2 1\n1 3\n")
+
+    def tearDown(self):
+        os.remove(self.graph_file_path)
+        os.remove(self.queries_file_path)
+
+    def test_query(self):
+        expected = [
+            {"source": 0, "destination": 3, "walk": [0, 2, 3], "cost": 7},
+            {"query": ["foo"], "error": "Invalid query"},
+            {"source": 3, "destination": 0, "walk": None, "cost": None},
+            {"query": [0, 1, 2], "error": "Invalid query"},
+            {"source": 0, "destination": "x", "error": "Invalid vertex"},
+            {"source": "--1", "destination": 2, "error": "Invalid vertex"},
+            {"source": "\u00b2", "destination": 1, "error": "Invalid vertex"},
+            {"source": 1, "destination": 3, "walk": [1, 3], "cost": 7},
+        ]
+
+        for algorithm in "dijkstra", "bellman_ford", "floyd_warshall":
+            output = io.StringIO()
+            with redirect_stdout(output):
+                main(["query", self.graph_file_path, self.queries_file_path, "--algorithm", algorithm])
+            self.assertEqual([json.loads(line) for line in output.getvalue().splitlines()], expected)
@@ -0,0 +1,60 @@
+import random
+from unittest import TestCase
+from src.algorithms.kruskal import Kruskal
+from src.algorithms.prim import Prim
+from src.graphs.compact_undirected_graph import CompactUndirectedGraph
+from src.graphs.undirected_graph import UndirectedGraph
+
+
+class TestPrim(TestCase):
+    def setUp(self):
+        self.graph = UndirectedGraph(6)
+        self.graph.add_edge((0, 1), 4)
+        self.graph.add_edge((0, 2), 1)
+        self.graph.add_edge((1, 2), 2)
+        self.graph.add_edge((1, 3), 5)
+        self.graph.add_edge((2, 3), 8)
+        self.graph.add_edge((4, 5), 3)
+        self.prim = Prim(self.graph)
+
+    def tearDown(self):
+        del self.prim
+        del self.graph
+
+    def test_get_minimum_spanning_tree(self):
+        tree, cost = self.prim.get_minimum_spanning_tree()
+        self.assertEqual(cost, 11)
+        self.assertEqual(sorted(map(sorted, tree)), [[0, 2], [1, 2], [1, 3], [4, 5]])
+
+    def test_get_minimum_spanning_tree_compact(self):
+        tree, cost = Prim(CompactUndirectedGraph(self.graph)).get_minimum_spanning_tree()
+        self.assertEqual(cost, 11)
+        self.assertEqual(len(tree), 4)
+
+    def test_get_minimum_spanning_tree_empty(self):
+        self.assertEqual(Prim(UndirectedGraph(3)).get_minimum_spanning_tree(), ([], 0))
+
+    def test_get_minimum_spanning_tree_mixed_labels(self):
+        graph = UndirectedGraph(0)
+        for vertex in [0, "a", 1, "b"]:
+            graph.add_vertex(vertex)
+        for edge in [(0, "a"), (0, 1), ("a", "b"), (1, "b"), ("a", 1)]:
+            graph.add_edge(edge, 2)
+
+        tree, cost = Prim(graph).get_minimum_spanning_tree()
+        self.assertEqual(cost, 6)
+        self.assertEqual(len(tree), 3)
+
+    def test_get_minimum_spanning_tree_random(self):
+        generator = random.Random(5)
+        for _ in range(20):
+            graph = UndirectedGraph(30)
+            for start in range(30):
+                for end in range(start + 1, 30):
+                    if generator.random() < 0.1:
+                        graph.add_edge((start, end), generator.randint(-5, 20))
+
+            tree, cost = Prim(graph).get_minimum_spanning_tree()
+            self.assertEqual(cost, sum(graph.get_cost(edge) for edge in tree))
+            self.assertEqual(cost, Kruskal(graph).get_minimum_spanning_tree()[1])
+            self.assertEqual(len(tree), len(Kruskal(graph).get_minimum_spanning_tree()[0]))
@@ -0,0 +1,56 @@
+from unittest import TestCase
+from src.services.directed_graph_service import DirectedGraphService
+from src.services.random_graph_generator import RandomGraphGenerator
+from src.services.undirected_graph_service import UndirectedGraphService
+
+
+class TestRandomGraphGenerator(TestCase):
+    def test_get_uniform_edges(self):
+        generator = RandomGraphGenerator(1)
+
+        edges = generator.get_uniform_edges(20, 100, True)
+        self.assertEqual(len(set(edges)), 100)
+        self.assertTrue(all(start != end for start, end in edges))
+
+        edges = generator.get_uniform_edges(20, 190, False)
+        self.assertEqual(sorted(edges), [(start, end) for start in range(20) for end in range(start + 1, 20)])
+
+        self.assertRaises(ValueError, generator.get_uniform_edges, 5, 21, True)
+
+    def test_get_gnp_edges(self):
+        generator = RandomGraphGenerator(2)
+
+        self.assertEqual(generator.get_gnp_edges(10, 0, True), [])
+        self.assertEqual(len(generator.get_gnp_edges(10, 1, True)), 90)
+
+        edges = generator.get_gnp_edges(200, 0.1, False)
+        self.assertEqual(len(set(edges)), len(edges))
+        self.assertTrue(1800 < len(edges) < 2200)
+
+    def test_get_barabasi_albert_edges(self):
+        edges = RandomGraphGenerator(3).get_barabasi_albert_edges(100, 2)
+
+        self.assertEqual(len(edges), 196)
+        self.assertEqual(len(set(edges)), 196)
+        self.assertTrue(all(start > end for start, end in edges))
+        self.assertRaises(ValueError, RandomGraphGenerator(3).get_barabasi_albert_edges, 2, 2)
+
+    def test_get_grid_edges(self):
+        self.assertEqual(RandomGraphGenerator.get_grid_edges(2, 3), [(0, 1), (0, 3), (1, 2), (1, 4), (2, 5),
+                                                                      (3, 4), (4, 5)])
+
+    def test_seed(self):
+        first = DirectedGraphService.generate_random_graph(30, 100, seed=4)
+        second = DirectedGraphService.generate_random_graph(30, 100, seed=4)
+
+        self.assertEqual(list(first.edges), list(second.edges))
+        self.assertEqual([first.get_cost(edge) for edge in first.edges],
+                         [second.get_cost(edge) for edge in second.edges])
+
+    def test_generate_grid_graph(self):
+        graph = DirectedGraphService.generate_grid_graph(3, 3, seed=5)
+        self.assertEqual(graph.edges_count, 24)
+        self.assertEqual(graph.get_cost((0, 1)), graph.get_cost((1, 0)))
+
+        self.assertEqual(UndirectedGraphService.generate_grid_graph(3, 3).edges_count, 12)
+        self.assertEqual(UndirectedGraphService.generate_barabasi_albert_graph(10, 3, seed=6).edges_count, 21)
@@ -0,0 +1,74 @@
+import random
+from unittest import TestCase
+from src.algorithms.dijkstra import Dijkstra
+from src.algorithms.shortest_path_cache import ShortestPathCache
+from src.graphs.directed_graph import DirectedGraph
+
+
+class TestShortestPathCache(TestCase):
+    def setUp(self):
+        self.graph = DirectedGraph(5)
+        self.graph.add_edge((0, 1), 4)
+        self.graph.add_edge((0, 2), 1)
+        self.graph.add_edge((2, 1), 2)
+        self.graph.add_edge((1, 3), 1)
+
+    def tearDown(self):
+        del self.graph
+
+    def test_get_minimum_cost_walk(self):
+        for algorithm in ShortestPathCache.ALGORITHMS:
+            cache = ShortestPathCache(self.graph, algorithm)
+
+            self.assertEqual(cache.get_minimum_cost_walk(0, 3), ([0, 2, 1, 3], 4))
+            self.assertEqual(cache.get_minimum_cost_walk(0, 0), ([0], 0))
+            self.assertEqual(cache.get_minimum_cost_walk(0, 4), (None, float('inf')))
+            self.assertEqual(cache.get_distance(0, 1), 3)
+            self.assertEqual((cache.hits, cache.misses), (3, 1))
+
+            self.assertRaises(ValueError, cache.get_minimum_cost_walk, 0, 7)
+            self.assertRaises(ValueError, cache.get_minimum_cost_walk, 7, 0)
+
+    def test_invalidation(self):
+        cache = ShortestPathCache(self.graph)
+        self.assertEqual(cache.get_distance(0, 3), 4)
+
+        self.graph.set_cost((0, 1), 1)
+        self.assertEqual(cache.get_minimum_cost_walk(0, 3), ([0, 1, 3], 2))
+
+        self.graph.add_vertex(5)
+        self.graph.add_edge((3, 5), 1)
+        self.assertEqual(cache.get_distance(0, 5), 3)
+
+        self.graph.remove_edge((1, 3))
+        self.assertEqual(cache.get_distance(0, 5), float('inf'))
+
+        self.graph.remove_vertex(2)
+        self.assertEqual(cache.get_minimum_cost_walk(0, 1), ([0, 1], 1))
+        self.assertEqual(cache.misses, 5)
+
+    def test_memory_budget(self):
+        # Every tree of the 5 vertex graph takes 80 bytes
+        cache = ShortestPathCache(self.graph, memory_budget=160)
+        for source in 0, 1, 2, 0:
+            cache.get_distance(source, 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.memory_used, 160)
+        self.assertEqual((cache.hits, cache.misses), (0, 4))
+
+        self.assertEqual(ShortestPathCache(self.graph, memory_budget=10).get_distance(0, 3), 4)
+
+    def test_random_graph(self):
+        generator = random.Random(9)
+        graph = DirectedGraph(40)
+        for _ in range(200):
+            start, end = generator.randrange(40), generator.randrange(40)
+            if not graph.are_connected(start, end):
+                graph.add_edge((start, end), generator.randint(1, 20))
+
+        cache = ShortestPathCache(graph, memory_budget=1000)
+        for _ in range(300):
+            source, destination = generator.randrange(40), generator.randrange(40)
+            self.assertEqual(cache.get_minimum_cost_walk(source, destination)[1],
+                             Dijkstra(graph).get_minimum_cost_walk(source, destination)[1])
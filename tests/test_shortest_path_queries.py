@@ -0,0 +1,55 @@
+from unittest import TestCase
+from src.algorithms.shortest_path_queries import ShortestPathQueries
+from src.graphs.directed_graph import DirectedGraph
+
+
+class TestShortestPathQueries(TestCase):
+    def setUp(self):
+        self.graph = DirectedGraph(5)
+        self.graph.add_edge((0, 1), 4)
+        self.graph.add_edge((0, 2), 1)
+        self.graph.add_edge((2, 1), 2)
+        self.graph.add_edge((1, 3), 1)
+        self.queries = [(0, 3), (0, 4), (2, 3), (0, 7), (7, 0), (0, 1)]
+
+    def tearDown(self):
+        del self.graph
+
+    def test_get_minimum_cost_walks(self):
+        expected = [
+            {"source": 0, "destination": 3, "walk": [0, 2, 1, 3], "cost": 4},
+            {"source": 0, "destination": 4, "walk": None, "cost": None},
+            {"source": 2, "destination": 3, "walk": [2, 1, 3], "cost": 3},
+            {"source": 0, "destination": 7, "error": "Invalid vertex"},
+            {"source": 7, "destination": 0, "error": "Invalid vertex"},
+            {"source": 0, "destination": 1, "walk": [0, 2, 1], "cost": 3},
+        ]
+
+        for algorithm in ShortestPathQueries.ALGORITHMS:
+            for chunk_size in 1, 4:
+                queries = ShortestPathQueries(self.graph, algorithm, chunk_size)
+                self.assertEqual(list(queries.get_minimum_cost_walks(iter(self.queries))), expected)
+
+    def test_invalid_queries(self):
+        expected = [
+            {"query": (0,), "error": "Invalid query"},
+            {"source": 0, "destination": 3, "walk": [0, 2, 1, 3], "cost": 4},
+            {"query": (0, 1, 2), "error": "Invalid query"},
+            {"query": None, "error": "Invalid query"},
+            {"source": "a", "destination": 3, "error": "Invalid vertex"},
+        ]
+
+        for algorithm in ShortestPathQueries.ALGORITHMS:
+            queries = ShortestPathQueries(self.graph, algorithm)
+            answers = queries.get_minimum_cost_walks([(0,), (0, 3), (0, 1, 2), None, ("a", 3)])
+            self.assertEqual(list(answers), expected)
+
+    def test_negative_cost_cycle(self):
+        self.graph.add_edge((3, 0), -5)
+
+        for algorithm in "bellman_ford", "floyd_warshall":
+            answer = next(ShortestPathQueries(self.graph, algorithm).get_minimum_cost_walks([(0, 3)]))
+            self.assertIn("Negative cost cycle", answer["error"])
+
+    def test_invalid_algorithm(self):
+        self.assertRaises(ValueError, ShortestPathQueries, self.graph, "prim")
@@ -0,0 +1,66 @@
+import random
+from unittest import TestCase
+from src.algorithms.tarjan import Tarjan
+from src.graphs.directed_graph import DirectedGraph
+
+
+class TestTarjan(TestCase):
+    def setUp(self):
+        self.graph = DirectedGraph(6)
+        for edge in [(0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (4, 3), (5, 4)]:
+            self.graph.add_edge(edge, 1)
+
+    def tearDown(self):
+        del self.graph
+
+    def test_get_strongly_connected_components(self):
+        components = Tarjan(self.graph).get_strongly_connected_components()
+        self.assertEqual(sorted(sorted(component) for component in components), [[0, 1, 2], [3, 4], [5]])
+
+    def test_long_chain(self):
+        graph = DirectedGraph(100000)
+        for vertex in range(99999):
+            graph.add_edge((vertex, vertex + 1), 1)
+        graph.add_edge((99999, 0), 1)
+
+        components = Tarjan(graph).get_strongly_connected_components()
+        self.assertEqual(len(components), 1)
+        self.assertEqual(len(components[0]), 100000)
+
+    def test_random_graphs(self):
+        generator = random.Random(13)
+        for _ in range(30):
+            graph = DirectedGraph(20)
+            for _ in range(30):
+                start, end = generator.randrange(20), generator.randrange(20)
+                if not graph.are_connected(start, end):
+                    graph.add_edge((start, end), 1)
+
+            # Two vertices share a component exactly when each can reach the other
+            reachable = {vertex: self.__reachable(graph, vertex) for vertex in range(20)}
+            expected = {frozenset(end for end in reachable[vertex] if vertex in reachable[end]) for vertex in range(20)}
+
+            components = Tarjan(graph).get_strongly_connected_components()
+            self.assertEqual({frozenset(component) for component in components}, expected)
+            self.assertEqual(sum(len(component) for component in components), 20)
+
+    @staticmethod
+    def __reachable(graph, vertex):
+        reachable, stack = {vertex}, [vertex]
+        while stack:
+            for neighbour in graph.outbound_neighbours(stack.pop()):
+                if neighbour not in reachable:
+                    reachable.add(neighbour)
+                    stack.append(neighbour)
+        return reachable
+
+    def test_get_condensation(self):
+        condensation, component, order = Tarjan(self.graph).get_condensation()
+
+        self.assertEqual(condensation.vertices_count, 3)
+        self.assertEqual(len({component[0], component[1], component[2]}), 1)
+        self.assertEqual(component[3], component[4])
+        self.assertEqual(sorted(condensation.edges),
+                         sorted([(component[2], component[3]), (component[5], component[4])]))
+        for start, end in condensation.edges:
+            self.assertLess(order.index(start), order.index(end))
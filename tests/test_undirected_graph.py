@@ -24,6 +24,14 @@ class TestUndirectedGraph(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.graph.remove_edge((0, 1))
 
+    def test_remove_edges_from_graph(self):
+        self.graph.add_edge((0, 1))
+        self.graph.add_edge((1, 2))
+        self.graph.add_edge((2, 3))
+        self.graph.remove_edges([(1, 0), (2, 3)])
+        self.assertEqual(list(self.graph.edges), [(1, 2)])
+        self.assertEqual(list(self.graph.neighbours(1)), [2])
+
     def test_add_vertex_to_graph(self):
         self.graph.add_vertex(5)
         self.assertEqual(self.graph.vertices_count, 6)
@@ -37,6 +45,15 @@ class TestUndirectedGraph(unittest.TestCase):
         self.graph.remove_vertex(5)
         self.assertEqual(self.graph.vertices_count, 5)
 
+    def test_remove_vertex_removes_its_edges(self):
+        self.graph.add_edge((0, 1))
+        self.graph.add_edge((2, 1))
+        self.graph.add_edge((2, 3))
+        self.graph.remove_vertex(1)
+        self.assertEqual(list(self.graph.edges), [(2, 3)])
+        self.assertEqual(self.graph.degree(0), 0)
+        self.assertEqual(self.graph.degree(4), 0)
+
     def test_remove_nonexistent_vertex_raises_error(self):
         with self.assertRaises(ValueError):
             self.graph.remove_vertex(5)
@@ -66,6 +83,88 @@ class TestUndirectedGraph(unittest.TestCase):
         with self.assertRaises(ValueError):
             list(self.graph.neighbours(5))
 
+    def test_edge_costs(self):
+        self.graph.add_edge((0, 1), 4)
+        self.graph.add_edges([(1, 2), (2, 3)], [5, 6])
+        self.graph.add_edge((3, 4))
+        self.assertEqual(self.graph.get_cost((1, 0)), 4)
+        self.assertEqual(self.graph.get_cost((2, 3)), 6)
+        self.assertIsNone(self.graph.get_cost((3, 4)))
+        self.assertEqual(sorted(self.graph.incident_edges(2)), [(1, 5), (3, 6)])
+
+        self.graph.set_cost((1, 0), 7)
+        self.assertEqual(self.graph.get_cost((0, 1)), 7)
+        self.assertEqual(list(self.graph.incident_edges(1)), [(0, 7), (2, 5)])
+        self.assertRaises(ValueError, self.graph.get_cost, (0, 2))
+        self.assertRaises(ValueError, self.graph.set_cost, (0, 2), 1)
+        self.assertRaises(ValueError, self.graph.incident_edges, 5)
+
+    def test_add_edges_with_mismatched_costs_raises_error(self):
+        self.assertRaises(ValueError, self.graph.add_edges, [(0, 1), (1, 2)], [4])
+        self.assertRaises(ValueError, self.graph.add_edges, [(2, 3)], [4, 5])
+        self.assertRaises(ValueError, self.graph.copy().add_edges, [(3, 4), (0, 4)], [4])
+
+    def test_copy_does_not_change_original(self):
+        self.graph.add_edge((0, 1), 1)
+        self.graph.add_edge((1, 2), 2)
+        copy = self.graph.copy()
+
+        copy.set_cost((0, 1), 5)
+        copy.remove_edge((2, 1))
+        copy.add_vertex(5)
+        copy.add_edges([(5, 0)], [4])
+        copy.remove_vertex(1)
+
+        self.assertEqual(list(self.graph.edges), [(0, 1), (1, 2)])
+        self.assertEqual(self.graph.get_cost((1, 0)), 1)
+        self.assertEqual(self.graph.vertices_count, 5)
+        self.assertEqual(list(copy.edges), [(5, 0)])
+        self.assertEqual(list(copy.incident_edges(0)), [(5, 4)])
+
+    def test_original_does_not_change_copies(self):
+        self.graph.add_edge((0, 1))
+        first = self.graph.copy()
+        self.graph.add_edge((1, 2))
+        second = self.graph.copy()
+        self.graph.remove_edge((0, 1))
+        self.graph.remove_vertex(2)
+
+        self.assertEqual(list(first.edges), [(0, 1)])
+        self.assertEqual(list(second.edges), [(0, 1), (1, 2)])
+        self.assertEqual(list(second.neighbours(1)), [0, 2])
+        self.assertEqual(list(self.graph.edges), [])
+
+    def test_copy_shares_unchanged_vertices(self):
+        self.graph.add_edges([(0, 1), (2, 3), (3, 4)], [1, 2, 3])
+        copy = self.graph.copy()
+        copy.set_cost((1, 0), 5)
+        copy.remove_edge((4, 3))
+
+        # Only the dictionaries of the vertices the changes touched were copied
+        for vertex, shared in (0, False), (1, False), (2, True), (3, False), (4, False):
+            for dictionaries in "_UndirectedGraph__neighbours", "_UndirectedGraph__edge_ends":
+                original, copied = getattr(self.graph, dictionaries)[vertex], getattr(copy, dictionaries)[vertex]
+                self.assertEqual(original is copied, shared)
+
+        self.assertEqual(list(self.graph.edges), [(0, 1), (2, 3), (3, 4)])
+        self.assertEqual(self.graph.get_cost((0, 1)), 1)
+        self.assertEqual(list(copy.edges), [(0, 1), (2, 3)])
+        self.assertEqual(copy.get_cost((0, 1)), 5)
+        self.assertEqual(copy.edges_count, 2)
+
+    def test_from_edges(self):
+        graph = UndirectedGraph.from_edges(3, [(0, 1), (1, 2), (2, 2)], [4, 5, 6])
+        self.assertEqual(graph.edges_count, 3)
+        self.assertEqual(list(graph.edges), [(0, 1), (1, 2), (2, 2)])
+        self.assertEqual(graph.get_cost((2, 1)), 5)
+        self.assertIsNone(UndirectedGraph.from_edges(2, [(0, 1)]).get_cost((0, 1)))
+
+        self.assertRaises(ValueError, UndirectedGraph.from_edges, 3, [(0, 1), (1, 0)])
+        self.assertRaises(ValueError, UndirectedGraph.from_edges, 3, [(2, 2), (2, 2)])
+        self.assertRaises(ValueError, UndirectedGraph.from_edges, 3, [(0, 3)])
+        self.assertRaises(ValueError, UndirectedGraph.from_edges, 3, [(0, 1), (1, 2)], [4])
+        self.assertRaises(ValueError, UndirectedGraph.from_edges, 3, [(0, 1)], [4, 5])
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,90 @@
+import os
+import tempfile
+from unittest import TestCase
+from src.graphs.undirected_graph import UndirectedGraph
+from src.services.undirected_graph_service import UndirectedGraphService
+
+
+class TestUndirectedGraphService(TestCase):
+    def setUp(self):
+        self.graph = UndirectedGraph(50)
+        self.weighted_graph = UndirectedGraph(50)
+        for start in range(50):
+            for end in (start * 7 + 3) % 50, (start * 11 + 5) % 50:
+                if not self.graph.are_connected(start, end):
+                    self.graph.add_edge((start, end))
+                    self.weighted_graph.add_edge((start, end), start - end)
+
+        handle, self.file_path = tempfile.mkstemp()
+        os.close(handle)
+        UndirectedGraphService.write_graph_to_file(self.graph, self.file_path)
+
+        handle, self.weighted_file_path = tempfile.mkstemp()
+        os.close(handle)
+        UndirectedGraphService.write_graph_to_file(self.weighted_graph, self.weighted_file_path)
+
+        handle, self.binary_file_path = tempfile.mkstemp()
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.file_path)
+        os.remove(self.weighted_file_path)
+        os.remove(self.binary_file_path)
+        del self.graph
+        del self.weighted_graph
+
+    def test_read_graph_from_file(self):
+        graph = UndirectedGraphService.read_graph_from_file(self.file_path)
+        self.assertEqual(graph.vertices_count, self.graph.vertices_count)
+        self.assertEqual(list(graph.edges), list(self.graph.edges))
+        for edge in self.graph.edges:
+            self.assertIsNone(graph.get_cost(edge))
+
+    def test_read_weighted_graph_from_file(self):
+        graph = UndirectedGraphService.read_graph_from_file(self.weighted_file_path)
+        self.assertEqual(list(graph.edges), list(self.weighted_graph.edges))
+        for edge in self.weighted_graph.edges:
+            self.assertEqual(graph.get_cost(edge), self.weighted_graph.get_cost(edge))
+
+    def test_read_edge_batches(self):
+        edges = [edge for batch in UndirectedGraphService.read_edge_batches(self.file_path) for edge in batch]
+        self.assertEqual(edges, list(self.graph.edges))
+
+        edges = [edge for batch in UndirectedGraphService.read_edge_batches(self.weighted_file_path) for edge in batch]
+        self.assertEqual(edges, [(edge, self.weighted_graph.get_cost(edge)) for edge in self.weighted_graph.edges])
+
+    def test_read_graph_from_binary_file(self):
+        for source in self.graph, self.weighted_graph:
+            UndirectedGraphService.write_graph_to_binary_file(source, self.binary_file_path)
+            graph = UndirectedGraphService.read_graph_from_binary_file(self.binary_file_path)
+            self.assertEqual(graph.vertices_count, source.vertices_count)
+            self.assertEqual(graph.edges_count, source.edges_count)
+            for vertex in source.vertices:
+                self.assertEqual(sorted(graph.incident_edges(vertex)), sorted(source.incident_edges(vertex)))
+
+    def test_write_graph_to_file_round_trip(self):
+        UndirectedGraphService.write_graph_to_file(self.weighted_graph, self.file_path)
+        graph = UndirectedGraphService.read_graph_from_file(self.file_path)
+        self.assertEqual(graph.vertices_count, self.weighted_graph.vertices_count)
+        self.assertEqual(list(graph.edges), list(self.weighted_graph.edges))
+        for edge in self.weighted_graph.edges:
+            self.assertEqual(graph.get_cost(edge), self.weighted_graph.get_cost(edge))
+
+        # An edge without a cost keeps the other costs out of the file
+        self.weighted_graph.add_edge((0, 49))
+        UndirectedGraphService.write_graph_to_file(self.weighted_graph, self.file_path)
+        graph = UndirectedGraphService.read_graph_from_file(self.file_path)
+        self.assertEqual(list(graph.edges), list(self.weighted_graph.edges))
+        for edge in graph.edges:
+            self.assertIsNone(graph.get_cost(edge))
+
+    def test_read_graph_from_file_invalid_columns(self):
+        for contents in "3 2\n0 1\n1 2 5\n", "3 2\n0 1 5\n1 2\n", "3 2\n0 1 5\n":
+            with open(self.file_path, "w") as output_file:
+                output_file.write(contents)
+            self.assertRaises(ValueError, UndirectedGraphService.read_graph_from_file, self.file_path)
+
+        with open(self.file_path, "w") as output_file:
+            output_file.write("3 2\n0 1 5\n\n1 2 4")
+        graph = UndirectedGraphService.read_graph_from_file(self.file_path)
+        self.assertEqual([graph.get_cost(edge) for edge in graph.edges], [5, 4])
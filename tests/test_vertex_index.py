@@ -0,0 +1,63 @@
+from array import array
+from unittest import TestCase
+from src.graphs.vertex_index import VertexIndex
+
+
+class TestVertexIndex(TestCase):
+    def setUp(self):
+        self.index = VertexIndex(["a", "b", "c"])
+
+    def tearDown(self):
+        del self.index
+
+    def test_ids(self):
+        self.assertEqual(len(self.index), 3)
+        self.assertEqual(list(self.index), ["a", "b", "c"])
+        self.assertEqual(self.index.get_id("b"), 1)
+        self.assertEqual(self.index.get_label(2), "c")
+        self.assertEqual(list(self.index.get_labels([2, 0])), ["c", "a"])
+        self.assertIn("a", self.index)
+        self.assertNotIn("d", self.index)
+        self.assertRaises(ValueError, self.index.get_id, "d")
+        self.assertRaises(ValueError, self.index.get_id, [])
+        self.assertRaises(ValueError, self.index.get_label, 3)
+        self.assertRaises(ValueError, VertexIndex, ["a", "a"])
+
+    def test_free_list(self):
+        self.assertEqual(self.index.remove("b"), 1)
+        self.assertEqual(len(self.index), 2)
+        self.assertEqual(self.index.capacity, 3)
+        self.assertEqual(list(self.index), ["a", "c"])
+        self.assertRaises(ValueError, self.index.get_label, 1)
+        self.assertRaises(ValueError, self.index.remove, "b")
+
+        self.assertEqual(self.index.add("d"), 1)
+        self.assertEqual(self.index.add("e"), 3)
+        self.assertEqual(self.index.get_label(1), "d")
+        self.assertEqual(self.index.capacity, 4)
+        self.assertRaises(ValueError, self.index.add, "e")
+
+    def test_identity(self):
+        index = VertexIndex(range(3))
+        self.assertIsNone(index.labels)
+        self.assertEqual(index.add(3), 3)
+        self.assertIsNone(index.labels)
+        self.assertNotIn(True, index)
+
+        self.assertEqual(index.add(10), 4)
+        self.assertEqual(list(index.labels), [0, 1, 2, 3, 10])
+        index.remove(0)
+        self.assertEqual(index.add(2 ** 64), 0)
+        self.assertEqual(index.get_id(2 ** 64), 0)
+        self.assertEqual(list(index), [2 ** 64, 1, 2, 3, 10])
+
+    def test_wrap(self):
+        index = VertexIndex.wrap(memoryview(array("q", [5, 9])), 2)
+        self.assertEqual(index.get_id(9), 1)
+        self.assertEqual(index.get_label(0), 5)
+        self.assertEqual(index.add(7), 2)
+        self.assertEqual(list(index), [5, 9, 7])
+
+        self.assertIsNone(VertexIndex.wrap(None, 4).labels)
+        self.assertEqual(VertexIndex.wrap(None, 4).get_id(3), 3)
+        self.assertRaises(ValueError, VertexIndex.wrap, array("q", [1, 1]), 2)